@@ -12,6 +12,7 @@ load_dotenv(override=True)
 if os.getenv("GEMINI_API_KEY"):
     os.environ["GOOGLE_API_KEY"] = os.environ["GEMINI_API_KEY"]
 
+import asyncio
 from datetime import date
 from google.genai import types
 from google.adk.agents import Agent
@@ -25,13 +26,13 @@ from .sub_agents import (
     economic_agent,
     resources_agent,
 )
+from .config import get_config
 from .prompts import return_instructions_root
 from .tools import (
-    call_weather_agent,
-    call_crops_agent,
-    call_health_agent,
-    call_economic_agent,
-    call_resources_agent,
+    call_agent,
+    call_agents_parallel,
+    cancel_speculative_calls,
+    launch_speculative_call,
 )
 from .utils.data import REGIONS, CROPS, SEASONS
 from .observability import make_adk_callbacks
@@ -39,6 +40,11 @@ from .observability import make_adk_callbacks
 date_today = date.today()
 _obs = make_adk_callbacks()
 
+# Les listes de cultures/régions sont constantes: jointes une fois au
+# chargement plutôt qu'à chaque tour.
+_CROP_KEYS_JOINED = ", ".join(k.value for k in CROPS)
+_REGION_KEYS_JOINED = ", ".join(k.value for k in REGIONS)
+
 
 def setup_before_agent_call(callback_context: CallbackContext):
     """Initialise l'état de session + démarre le span Langfuse."""
@@ -47,26 +53,41 @@ def setup_before_agent_call(callback_context: CallbackContext):
             "regions": {k.value: k.value for k in REGIONS},
             "crops": {k.value: k.value for k in CROPS},
             "current_date": str(date_today),
-            "default_region": os.getenv("DEFAULT_REGION", "Centre"),
-            "language": os.getenv("DEFAULT_LANGUAGE", "fr"),
+            "default_region": get_config().default_region.value,
+            "language": get_config().default_language,
         }
     context = callback_context.state["agriculture_settings"]
-    callback_context._invocation_context.agent.instruction = (
-        return_instructions_root()
-        + f"""
+
+    # L'instruction complète ne dépend que de (région par défaut, date):
+    # construite une fois par session puis relue depuis l'état.
+    cache_key = [context["default_region"], context["current_date"]]
+    cached = callback_context.state.get("_cached_instruction")
+    if not cached or cached.get("key") != cache_key:
+        cached = {
+            "key": cache_key,
+            "instruction": (
+                return_instructions_root()
+                + f"""
 
         Contexte actuel:
         - Date: {context['current_date']}
         - Région par défaut: {context['default_region']}
-        - Cultures principales: {', '.join(context['crops'].keys())}
-        - Régions disponibles: {', '.join(context['regions'].keys())}
+        - Cultures principales: {_CROP_KEYS_JOINED}
+        - Régions disponibles: {_REGION_KEYS_JOINED}
         """
-    )
+            ),
+        }
+        callback_context.state["_cached_instruction"] = cached
+    callback_context._invocation_context.agent.instruction = cached["instruction"]
+    # Pré-lance le sous-agent le plus probable pendant le tour de
+    # planification du root (latence masquée si la spéculation est juste).
+    launch_speculative_call(callback_context)
     _obs["before_agent"](callback_context)
 
 
 def teardown_after_agent_call(callback_context: CallbackContext):
     """Ferme le span Langfuse après la réponse de l'agent."""
+    cancel_speculative_calls(callback_context)
     _obs["after_agent"](callback_context)
 
 
@@ -86,11 +107,8 @@ root_agent = Agent(
         resources_agent,
     ],
     tools=[
-        call_weather_agent,
-        call_crops_agent,
-        call_health_agent,
-        call_economic_agent,
-        call_resources_agent,
+        call_agent,
+        call_agents_parallel,
         load_artifacts,
     ],
     before_agent_callback=setup_before_agent_call,
@@ -98,4 +116,38 @@ root_agent = Agent(
     before_tool_callback=_obs["before_tool"],
     after_tool_callback=_obs["after_tool"],
     generate_content_config=types.GenerateContentConfig(temperature=0.7),
-)
\ No newline at end of file
+)
+
+
+async def _warmup():
+    """Établit les connexions HTTPS vers Gemini avant la première requête.
+
+    La connexion (DNS + TLS) n'est ouverte qu'au premier generate_content:
+    un mini appel par modèle distinct paie ce coût au démarrage du worker
+    plutôt que sur la première question d'un utilisateur.
+    """
+    from .utils.genai_client import get_model
+
+    config = get_config()
+    model_names = {
+        config.root_agent_model,
+        config.weather_agent_model,
+        config.crops_agent_model,
+        config.health_agent_model,
+        config.economic_agent_model,
+        config.resources_agent_model,
+    }
+    for model_name in model_names:
+        try:
+            await get_model(model_name).generate_content_async(
+                "ping", generation_config={"max_output_tokens": 1}
+            )
+        except Exception:
+            pass
+
+
+try:
+    asyncio.get_running_loop().create_task(_warmup())
+except RuntimeError:
+    # Import hors boucle d'événements (tests, scripts): pas de préchauffage.
+    pass
\ No newline at end of file
@@ -12,8 +12,8 @@ from pydantic import BaseModel, ConfigDict, Field, field_validator
 
 
 class AgricultureBaseModel(BaseModel):
-    """Base model for all Agriculture Cameroun data structures."""
-    
+    """Base model for mutable Agriculture Cameroun structures (configuration)."""
+
     model_config = ConfigDict(
         arbitrary_types_allowed=True,
         extra='forbid',
@@ -23,6 +23,24 @@ class AgricultureBaseModel(BaseModel):
     )
 
 
+class AgricultureValueModel(BaseModel):
+    """Base model for immutable value objects (weather records, prices, advice).
+
+    Sans `validate_assignment` ni mutation: la chaîne de validateurs ne tourne
+    qu'à la construction. Pour des données déjà validées en amont (lignes DB
+    de confiance), utiliser `model_construct` qui saute aussi la validation
+    initiale.
+    """
+
+    model_config = ConfigDict(
+        arbitrary_types_allowed=True,
+        extra='forbid',
+        validate_assignment=False,
+        str_strip_whitespace=True,
+        frozen=True
+    )
+
+
 class RegionType(str, Enum):
     """Types de régions du Cameroun."""
     CENTRE = "Centre"
@@ -71,11 +89,61 @@ class SeasonType(str, Enum):
     GRANDE_SAISON_SECHE = "grande_saison_sèche"
 
 
+class UrgencyLevel(str, Enum):
+    """Niveaux d'urgence d'un conseil agricole."""
+    LOW = "low"
+    MEDIUM = "medium"
+    HIGH = "high"
+    URGENT = "urgent"
+
+
+class SeverityLevel(str, Enum):
+    """Niveaux de gravité d'un problème phytosanitaire."""
+    LOW = "low"
+    MEDIUM = "medium"
+    HIGH = "high"
+    CRITICAL = "critical"
+
+
+class QualityGrade(str, Enum):
+    """Grades de qualité d'un produit sur le marché."""
+    PREMIUM = "premium"
+    STANDARD = "standard"
+    LOW = "low"
+
+
+class WaterRequirement(str, Enum):
+    """Besoins en eau d'une culture."""
+    LOW = "low"
+    MEDIUM = "medium"
+    HIGH = "high"
+
+
+class Availability(str, Enum):
+    """Disponibilité d'une ressource."""
+    AVAILABLE = "available"
+    SEASONAL = "seasonal"
+    LIMITED = "limited"
+    UNAVAILABLE = "unavailable"
+
+
+class ResourceType(str, Enum):
+    """Types de ressources agricoles."""
+    FERTILIZER = "fertilizer"
+    PESTICIDE = "pesticide"
+    IRRIGATION = "irrigation"
+    EQUIPMENT = "equipment"
+
+
 class AgricultureConfig(AgricultureBaseModel):
     """Configuration principale du système agricole."""
     
-    default_region: RegionType = RegionType.CENTRE
-    default_language: str = "fr"
+    default_region: RegionType = Field(
+        default_factory=lambda: RegionType(os.getenv("DEFAULT_REGION", "Centre"))
+    )
+    default_language: str = Field(
+        default_factory=lambda: os.getenv("DEFAULT_LANGUAGE", "fr")
+    )
     currency: str = "FCFA"
     temperature_unit: str = "celsius"
     distance_unit: str = "km"
@@ -91,9 +159,10 @@ class AgricultureConfig(AgricultureBaseModel):
     resources_agent_model: str = Field(default="gemini-2.0-flash-001")
     
     # Configuration API
-    gemini_api_key: Optional[str] = Field(default=None)
+    gemini_api_key: Optional[str] = Field(default=None, validate_default=True)
     max_retries: int = 3
     timeout_seconds: int = 30
+    max_gemini_concurrency: int = 8
     
     # Configuration base de données
     enable_data_persistence: bool = False
@@ -109,7 +178,7 @@ class AgricultureConfig(AgricultureBaseModel):
         return v
 
 
-class WeatherData(AgricultureBaseModel):
+class WeatherData(AgricultureValueModel):
     """Structure des données météorologiques."""
     
     date: str
@@ -123,7 +192,7 @@ class WeatherData(AgricultureBaseModel):
     conditions: str
 
 
-class CropInfo(AgricultureBaseModel):
+class CropInfo(AgricultureValueModel):
     """Informations sur une culture."""
     
     name: CropType
@@ -132,14 +201,14 @@ class CropInfo(AgricultureBaseModel):
     growth_cycle_days: int = Field(gt=0)
     optimal_temperature_min: float
     optimal_temperature_max: float
-    water_requirements: str  # "low", "medium", "high"
+    water_requirements: WaterRequirement
     soil_preferences: List[SoilType] = Field(default_factory=list)
     suitable_regions: List[RegionType] = Field(default_factory=list)
     planting_seasons: List[SeasonType] = Field(default_factory=list)
     expected_yield_per_hectare: float = Field(gt=0)
 
 
-class MarketPrice(AgricultureBaseModel):
+class MarketPrice(AgricultureValueModel):
     """Prix du marché pour une culture."""
     
     crop: CropType
@@ -148,10 +217,10 @@ class MarketPrice(AgricultureBaseModel):
     currency: str = "FCFA"
     date: str
     market_location: str
-    quality_grade: str = "standard"  # "premium", "standard", "low"
+    quality_grade: QualityGrade = QualityGrade.STANDARD
 
 
-class FarmingAdvice(AgricultureBaseModel):
+class FarmingAdvice(AgricultureValueModel):
     """Conseil agricole."""
     
     title: str
@@ -161,34 +230,34 @@ class FarmingAdvice(AgricultureBaseModel):
     season: Optional[SeasonType] = None
     advice_text: str
     estimated_cost_fcfa: Optional[float] = None
-    urgency_level: str = "medium"  # "low", "medium", "high", "urgent"
+    urgency_level: UrgencyLevel = UrgencyLevel.MEDIUM
     source: str = "agriculture_agent"
 
 
-class HealthIssue(AgricultureBaseModel):
+class HealthIssue(AgricultureValueModel):
     """Problème de santé des plantes."""
     
     issue_type: str  # "disease", "pest", "nutrient_deficiency", "environmental"
     name: str
     symptoms: List[str]
     affected_crops: List[CropType]
-    severity_level: str = "medium"  # "low", "medium", "high", "critical"
+    severity_level: SeverityLevel = SeverityLevel.MEDIUM
     treatment_options: List[str] = Field(default_factory=list)
     prevention_measures: List[str] = Field(default_factory=list)
     estimated_treatment_cost: Optional[float] = None
 
 
-class ResourceRecommendation(AgricultureBaseModel):
+class ResourceRecommendation(AgricultureValueModel):
     """Recommandation de ressources."""
     
-    resource_type: str  # "fertilizer", "pesticide", "irrigation", "equipment"
+    resource_type: ResourceType
     name: str
     description: str
     crop: Optional[CropType] = None
     application_rate: Optional[str] = None
     application_timing: Optional[str] = None
     estimated_cost_per_hectare: Optional[float] = None
-    availability: str = "available"  # "available", "seasonal", "limited", "unavailable"
+    availability: Availability = Availability.AVAILABLE
     local_suppliers: List[str] = Field(default_factory=list)
 
 
@@ -226,7 +295,7 @@ def validate_environment():
 
 
 # Classes utilitaires pour les réponses des agents
-class AgentResponse(AgricultureBaseModel):
+class AgentResponse(AgricultureValueModel):
     """Réponse standard d'un agent."""
     
     agent_name: str
@@ -237,7 +306,7 @@ class AgentResponse(AgricultureBaseModel):
     processing_time_seconds: Optional[float] = None
 
 
-class MultiAgentResponse(AgricultureBaseModel):
+class MultiAgentResponse(AgricultureValueModel):
     """Réponse combinée de plusieurs agents."""
     
     primary_agent: str
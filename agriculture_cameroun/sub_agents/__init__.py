@@ -2,16 +2,34 @@
 
 """Module des sous-agents spécialisés."""
 
-from .weather.agent import weather_agent
-from .crops.agent import crops_agent
-from .health.agent import health_agent
-from .economic.agent import economic_agent
-from .resources.agent import resources_agent
+from importlib import import_module
+
+# PEP 562: ré-export paresseux. L'import eager de resources_agent déclenchait
+# la construction différée de resources/agent.py dès l'import du package (que
+# tout import d'un sous-module provoque), annulant le bénéfice du démarrage
+# paresseux. Chaque agent n'est maintenant importé qu'au premier accès à son
+# nom, puis mis en cache dans globals() pour les accès suivants.
+_AGENT_MODULES = {
+    "weather_agent": ".weather.agent",
+    "crops_agent": ".crops.agent",
+    "health_agent": ".health.agent",
+    "economic_agent": ".economic.agent",
+    "resources_agent": ".resources.agent",
+}
 
 __all__ = [
     "weather_agent",
-    "crops_agent", 
+    "crops_agent",
     "health_agent",
     "economic_agent",
     "resources_agent"
-]
\ No newline at end of file
+]
+
+
+def __getattr__(name):
+    module_path = _AGENT_MODULES.get(name)
+    if module_path is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    agent = getattr(import_module(module_path, __name__), name)
+    globals()[name] = agent
+    return agent
@@ -0,0 +1,28 @@
+# Copyright 2025 Agriculture Cameroun
+
+"""Cache partagé des GenerateContentConfig entre sous-agents.
+
+Chaque agent construisait sa propre GenerateContentConfig — un modèle
+Pydantic revalidé à chaque (re)construction, alors que plusieurs agents
+utilisent des paramètres identiques. Les configurations sont mémoïsées ici
+et partagées entre appelants.
+"""
+
+from __future__ import annotations
+
+from functools import lru_cache
+
+
+@lru_cache(maxsize=32)
+def gen_cfg(temperature: float, top_p: float | None = None, top_k: int | None = None):
+    """Retourne une GenerateContentConfig mémoïsée pour ces paramètres."""
+    # Import différé: ce module est importé par des chemins paresseux
+    # (voir resources/agent.py) et ne doit pas tirer google.genai à froid.
+    from google.genai import types
+
+    kwargs = {"temperature": temperature}
+    if top_p is not None:
+        kwargs["top_p"] = top_p
+    if top_k is not None:
+        kwargs["top_k"] = top_k
+    return types.GenerateContentConfig(**kwargs)
@@ -2,7 +2,10 @@
 
 """Instructions pour l'agent de gestion des cultures."""
 
+import functools
 
+
+@functools.cache
 def return_instructions_crops() -> str:
     """Retourne les instructions pour l'agent cultures."""
     
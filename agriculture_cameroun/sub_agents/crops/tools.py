@@ -2,17 +2,118 @@
 
 """Outils pour l'agent de gestion des cultures."""
 
-import os
 from typing import Dict, List, Any, Optional
-import google.generativeai as genai
 from google.adk.tools import ToolContext
 
-# Configuration de l'API Gemini
-genai.configure(api_key=os.getenv("GEMINI_API_KEY"))
-model = genai.GenerativeModel('gemini-2.0-flash-001')
+from ...utils.batch import BatchGeminiClient, batch_mode_enabled
+from ...utils.cache import CachedResponse, GeminiResponseCache
+from ...utils.genai_client import get_model, get_semaphore
 
+# Client Gemini partagé (connexion réutilisée entre sous-agents)
+model = get_model('gemini-2.0-flash-001')
 
-def get_planting_calendar(
+# Client de micro-batching pour les workflows non-interactifs (rapports,
+# planification multi-fermes) — voir utils/batch.py.
+_batch_client = BatchGeminiClient(model) if batch_mode_enabled() else None
+
+# Cache disque des réponses: les prompts ne dépendent que d'arguments discrets
+# (culture, région, priorités), donc les hits évitent tout appel Gemini.
+_cache = GeminiResponseCache("crops")
+
+
+async def _generate(prompt: str, tool_context: ToolContext, cache_key: Optional[tuple] = None):
+    """Envoie un prompt à Gemini, avec cache disque et mode groupé optionnels."""
+    if cache_key is not None and not tool_context.state.get("force_refresh"):
+        cached = _cache.get(*cache_key)
+        if cached is not None:
+            return CachedResponse(cached)
+
+    if _batch_client is not None and tool_context.state.get("batch_mode"):
+        response = await _batch_client.generate(prompt)
+    elif tool_context.state.get("streaming"):
+        # Mode streaming: les chunks sont publiés au fil de l'eau dans l'état
+        # de session, ce qui réduit le temps-avant-premier-octet perçu sans
+        # changer la valeur de retour de l'outil.
+        async with get_semaphore():
+            stream = await model.generate_content_async(prompt, stream=True)
+            parts: List[str] = []
+            async for chunk in stream:
+                parts.append(chunk.text)
+                tool_context.state["partial_response"] = "".join(parts)
+            response = CachedResponse("".join(parts), from_cache=False)
+    else:
+        async with get_semaphore():
+            response = await model.generate_content_async(prompt)
+
+    if cache_key is not None:
+        _cache.set(response.text, *cache_key)
+    return response
+
+
+# Prompts restructurés en préfixe statique (candidat au cache de prompt côté
+# Gemini) + court suffixe dynamique: seuls quelques tokens changent par appel.
+_PLANTING_CALENDAR_PREFIX = """En tant qu'agronome expert au Cameroun, crée un calendrier de plantation détaillé.
+
+Le calendrier doit inclure:
+1. Période optimale de semis/plantation
+2. Préparation du sol (timing et méthodes)
+3. Étapes de croissance avec durées
+4. Périodes d'entretien (sarclage, buttage)
+5. Application d'engrais (timing et types)
+6. Période de récolte optimale
+7. Activités post-récolte
+
+Adapte selon le climat local et les pratiques traditionnelles efficaces.
+Format: structure JSON avec mois et activités.
+"""
+
+_ROTATION_ADVICE_PREFIX = """Expert en rotation des cultures au Cameroun, recommande un plan de rotation.
+
+Fournis:
+1. Prochaine culture recommandée (avec justification)
+2. Plan de rotation sur 3-4 ans
+3. Cultures de couverture/engrais verts à intégrer
+4. Bénéfices attendus (fertilité, contrôle parasites)
+5. Associations culturales bénéfiques
+6. Estimation des rendements
+
+Considère les pratiques locales et la rentabilité économique.
+"""
+
+_VARIETY_RECOMMENDATIONS_PREFIX = """En tant qu'expert en sélection variétale au Cameroun, recommande les meilleures variétés.
+
+Pour chaque variété recommandée, fournis:
+1. Nom de la variété (local et scientifique si applicable)
+2. Caractéristiques principales
+3. Rendement potentiel
+4. Cycle de croissance
+5. Résistance aux maladies/parasites
+6. Exigences spécifiques
+7. Disponibilité des semences
+8. Coût approximatif
+
+Inclus les variétés locales performantes et les variétés améliorées disponibles.
+"""
+
+_CULTIVATION_TECHNIQUES_PREFIX = """Expert en techniques culturales au Cameroun, fournis un guide de culture.
+
+Détaille:
+1. Préparation du sol (méthodes adaptées)
+2. Techniques de semis/plantation
+3. Espacement et densité optimaux
+4. Gestion de l'eau (irrigation si nécessaire)
+5. Fertilisation (organique et minérale)
+6. Contrôle des adventices
+7. Protection des cultures (méthodes intégrées)
+8. Techniques de récolte
+9. Innovations simples applicables
+10. Estimation des coûts
+
+Privilégie les solutions économiques et durables.
+"""
+
+
+async def get_planting_calendar(
     crop: str,
     region: str,
     tool_context: ToolContext,
@@ -27,25 +128,11 @@ def get_planting_calendar(
     Returns:
         Calendrier de plantation avec dates et activités
     """
-    prompt = f"""
-    En tant qu'agronome expert au Cameroun, crée un calendrier de plantation détaillé pour:
-    - Culture: {crop}
-    - Région: {region}
-    
-    Le calendrier doit inclure:
-    1. Période optimale de semis/plantation
-    2. Préparation du sol (timing et méthodes)
-    3. Étapes de croissance avec durées
-    4. Périodes d'entretien (sarclage, buttage)
-    5. Application d'engrais (timing et types)
-    6. Période de récolte optimale
-    7. Activités post-récolte
-    
-    Adapte selon le climat local et les pratiques traditionnelles efficaces.
-    Format: structure JSON avec mois et activités.
-    """
+    prompt = _PLANTING_CALENDAR_PREFIX + f"\n- Culture: {crop}\n- Région: {region}"
     
-    response = model.generate_content(prompt)
+    response = await _generate(
+        prompt, tool_context, cache_key=("planting_calendar", crop, region)
+    )
     
     # Parser la réponse pour extraire le calendrier
     calendar_data = {
@@ -58,7 +145,7 @@ def get_planting_calendar(
     return calendar_data
 
 
-def get_crop_rotation_advice(
+async def get_crop_rotation_advice(
     current_crop: str,
     soil_type: str,
     tool_context: ToolContext,
@@ -77,24 +164,17 @@ def get_crop_rotation_advice(
     """
     history_str = ", ".join(field_history) if field_history else "Non spécifié"
     
-    prompt = f"""
-    Expert en rotation des cultures au Cameroun, recommande un plan de rotation pour:
-    - Culture actuelle: {current_crop}
-    - Type de sol: {soil_type}
-    - Historique du champ: {history_str}
-    
-    Fournis:
-    1. Prochaine culture recommandée (avec justification)
-    2. Plan de rotation sur 3-4 ans
-    3. Cultures de couverture/engrais verts à intégrer
-    4. Bénéfices attendus (fertilité, contrôle parasites)
-    5. Associations culturales bénéfiques
-    6. Estimation des rendements
-    
-    Considère les pratiques locales et la rentabilité économique.
-    """
+    prompt = _ROTATION_ADVICE_PREFIX + (
+        f"\n- Culture actuelle: {current_crop}"
+        f"\n- Type de sol: {soil_type}"
+        f"\n- Historique du champ: {history_str}"
+    )
     
-    response = model.generate_content(prompt)
+    response = await _generate(
+        prompt,
+        tool_context,
+        cache_key=("rotation_advice", current_crop, soil_type, tuple(sorted(field_history or ()))),
+    )
     
     return {
         "current_crop": current_crop,
@@ -103,7 +183,7 @@ def get_crop_rotation_advice(
     }
 
 
-def get_variety_recommendations(
+async def get_variety_recommendations(
     crop: str,
     region: str,
     tool_context: ToolContext,
@@ -122,26 +202,15 @@ def get_variety_recommendations(
     """
     priorities_str = ", ".join(priorities) if priorities else "Rendement et adaptation locale"
     
-    prompt = f"""
-    En tant qu'expert en sélection variétale au Cameroun, recommande les meilleures variétés pour:
-    - Culture: {crop}
-    - Région: {region}
-    - Priorités: {priorities_str}
-    
-    Pour chaque variété recommandée, fournis:
-    1. Nom de la variété (local et scientifique si applicable)
-    2. Caractéristiques principales
-    3. Rendement potentiel
-    4. Cycle de croissance
-    5. Résistance aux maladies/parasites
-    6. Exigences spécifiques
-    7. Disponibilité des semences
-    8. Coût approximatif
-    
-    Inclus les variétés locales performantes et les variétés améliorées disponibles.
-    """
+    prompt = _VARIETY_RECOMMENDATIONS_PREFIX + (
+        f"\n- Culture: {crop}\n- Région: {region}\n- Priorités: {priorities_str}"
+    )
     
-    response = model.generate_content(prompt)
+    response = await _generate(
+        prompt,
+        tool_context,
+        cache_key=("variety_recommendations", crop, region, tuple(sorted(priorities or ()))),
+    )
     
     return {
         "crop": crop,
@@ -151,7 +220,7 @@ def get_variety_recommendations(
     }
 
 
-def get_cultivation_techniques(
+async def get_cultivation_techniques(
     crop: str,
     tool_context: ToolContext,
     farming_system: str = "Traditionnel",
@@ -170,28 +239,15 @@ def get_cultivation_techniques(
     """
     constraints_str = ", ".join(constraints) if constraints else "Budget limité"
     
-    prompt = f"""
-    Expert en techniques culturales au Cameroun, fournis un guide pour:
-    - Culture: {crop}
-    - Système: {farming_system}
-    - Contraintes: {constraints_str}
-    
-    Détaille:
-    1. Préparation du sol (méthodes adaptées)
-    2. Techniques de semis/plantation
-    3. Espacement et densité optimaux
-    4. Gestion de l'eau (irrigation si nécessaire)
-    5. Fertilisation (organique et minérale)
-    6. Contrôle des adventices
-    7. Protection des cultures (méthodes intégrées)
-    8. Techniques de récolte
-    9. Innovations simples applicables
-    10. Estimation des coûts
-    
-    Privilégie les solutions économiques et durables.
-    """
+    prompt = _CULTIVATION_TECHNIQUES_PREFIX + (
+        f"\n- Culture: {crop}\n- Système: {farming_system}\n- Contraintes: {constraints_str}"
+    )
     
-    response = model.generate_content(prompt)
+    response = await _generate(
+        prompt,
+        tool_context,
+        cache_key=("cultivation_techniques", crop, farming_system, tuple(sorted(constraints or ()))),
+    )
     
     return {
         "crop": crop,
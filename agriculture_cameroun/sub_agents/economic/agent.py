@@ -13,7 +13,8 @@ from .tools import (
     get_market_trends,
     recommend_sales_strategy,
     calculate_production_costs,
-    analyze_market_opportunities
+    analyze_market_opportunities,
+    analyze_crop_full,
 )
 from ...rag import retrieve_agricultural_knowledge
 from ...observability import make_adk_callbacks
@@ -32,6 +33,7 @@ economic_agent = Agent(
         recommend_sales_strategy,
         calculate_production_costs,
         analyze_market_opportunities,
+        analyze_crop_full,
     ],
     before_agent_callback=_obs["before_agent"],
     after_agent_callback=_obs["after_agent"],
@@ -26,6 +26,9 @@ def return_instructions_economic() -> str:
     - `recommend_sales_strategy`: Conseiller sur les stratégies de vente
     - `calculate_production_costs`: Calculer les coûts de production
     - `analyze_market_opportunities`: Identifier les opportunités
+    - `analyze_crop_full`: Analyse complète (prix + rentabilité + tendances +
+      stratégie + coûts) en un seul appel — à préférer quand la question
+      couvre plusieurs facettes économiques d'une même culture
     
     ## Contexte économique camerounais:
     
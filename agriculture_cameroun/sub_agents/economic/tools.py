@@ -2,25 +2,446 @@
 
 """Outils pour l'agent économique."""
 
+import asyncio
+import functools
 import os
-import random
-from datetime import datetime, timedelta
+import heapq
+import json
+from datetime import date, datetime, timedelta
+from operator import itemgetter
+from types import MappingProxyType
 from typing import Dict, List, Any, Optional
-import google.generativeai as genai
+
+import numpy as np
 from google.adk.tools import ToolContext
-from agriculture_cameroun.config import CropType, RegionType, get_config
-from ...utils.data import MARKET_PRICES, LOCAL_FERTILIZERS, AGRICULTURAL_TOOLS
+from agriculture_cameroun.config import CropType, get_config
+from ...utils.cache import CachedResponse, GeminiResponseCache
+from ...utils.data import MARKET_PRICES, get_crop_info
+from ...utils.genai_client import get_cached_model, get_semaphore
+from .prompts import return_instructions_economic
+
+# Générateur partagé pour les simulations: tirages groupés vectorisés au lieu
+# d'appels random.* unitaires dans des boucles Python.
+_RNG = np.random.default_rng()
+
+
+@functools.lru_cache(maxsize=1)
+def _get_model():
+    """Modèle partagé, initialisé au premier appel d'outil.
+
+    L'initialisation (configuration genai + création du CachedContent, voir
+    utils/genai_client.py) ne se paie plus à l'import: les processus qui
+    n'invoquent jamais l'agent économique ne la paient jamais. Le bloc
+    d'instructions économique reste mis en cache côté Gemini.
+
+    Les narrations d'outils sont courtes et très cadrées: le palier lite
+    suffit par défaut, ECONOMIC_TOOL_MODEL permet de remonter vers
+    flash-001 sans changement de code (l'agent lui-même reste piloté par
+    ECONOMIC_AGENT_MODEL).
+    """
+    return get_cached_model(
+        os.getenv("ECONOMIC_TOOL_MODEL", "gemini-2.0-flash-lite"),
+        return_instructions_economic(),
+    )
+
+# Cache disque des analyses Gemini, clé = prompt exact. Les prompts sont des
+# fonctions déterministes de quelques arguments (culture, superficie, système,
+# mois courant): une entrée valide un jour évite l'aller-retour LLM complet.
+_cache = GeminiResponseCache("economic")
+
+# Les prix et tendances simulés évoluent au plus à la journée.
+_CACHE_MAX_AGE_SECONDS = 86400
+
+
+@functools.lru_cache(maxsize=64)
+def _crop(crop: str) -> CropType:
+    """Conversion mémoïsée nom → CropType (évite le scan de l'énum par appel)."""
+    return CropType(crop)
+
+
+@functools.lru_cache(maxsize=64)
+def _crop_info(crop: CropType):
+    """Lookup mémoïsé des informations de culture."""
+    return get_crop_info(crop)
+
+
+def _fmt_compact(obj: Any) -> str:
+    """Sérialisation compacte d'une structure pour insertion dans un prompt.
+
+    JSON compact plutôt que repr() Python: moins de tokens (pas d'espaces ni
+    de quotes simples) et un format que le modèle lit sans ambiguïté.
+    """
+    return json.dumps(obj, ensure_ascii=False, separators=(",", ":"), default=str)
+
+
+# Prompts restructurés en préfixe statique (instructions, candidat au cache
+# implicite côté Gemini) + court suffixe de données par appel — même motif que
+# crops/tools.py.
+_MARKET_PRICES_PREFIX = """En tant qu'analyste du marché agricole camerounais, fournis une analyse de prix incluant:
+1. Évaluation du niveau de prix actuel
+2. Facteurs influençant les prix
+3. Prévisions à court terme
+4. Conseils pour optimiser les ventes
+5. Comparaison avec les autres cultures
+"""
+
+_PROFITABILITY_PREFIX = """Expert en économie agricole camerounaise, fournis une analyse de rentabilité incluant:
+1. Évaluation de la rentabilité
+2. Points d'amélioration possibles
+3. Risques économiques
+4. Recommandations concrètes
+5. Comparaison avec d'autres cultures
+"""
+
+_MARKET_TRENDS_PREFIX = """Analyste du marché agricole camerounais, fournis une analyse complète des tendances incluant:
+1. Tendances générales du marché
+2. Cultures les plus prometteuses
+3. Facteurs de risque identifiés
+4. Opportunités émergentes
+5. Recommandations stratégiques pour les agriculteurs
+6. Prévisions pour les 6 prochains mois
+"""
+
+_SALES_STRATEGY_PREFIX = """Expert en commercialisation agricole au Cameroun, recommande la meilleure stratégie de vente en considérant:
+1. Canal de vente optimal
+2. Timing de vente
+3. Préparation nécessaire (qualité, conditionnement)
+4. Négociation des prix
+5. Diversification des canaux
+6. Alternatives en cas de difficulté
+"""
 
-# Configuration de l'API Gemini
-genai.configure(api_key=os.getenv("GEMINI_API_KEY"))
-model = genai.GenerativeModel('gemini-2.0-flash-001')
+_PRODUCTION_COSTS_PREFIX = """Expert en gestion d'exploitation agricole au Cameroun, fournis une analyse des coûts de production incluant:
+1. Répartition des coûts par poste
+2. Postes les plus coûteux
+3. Opportunités de réduction des coûts
+4. Alternatives économiques locales
+5. Impact du niveau d'intrants sur la rentabilité
+6. Conseils pour l'optimisation financière
+"""
 
+_OPPORTUNITIES_PREFIX = """Expert en investissement agricole au Cameroun, fournis une analyse détaillée des opportunités incluant:
+1. Top 3 des meilleures opportunités
+2. Facteurs de succès pour chaque opportunité
+3. Risques et défis à considérer
+4. Étapes de mise en œuvre
+5. Partenaires potentiels
+6. Sources de financement disponibles
+7. Timeline recommandé
+"""
+
+
+async def _generate(prompt: str, tool_context: ToolContext):
+    """Envoie un prompt à Gemini avec cache disque exact sur le prompt."""
+    if not tool_context.state.get("force_refresh"):
+        cached = _cache.get(prompt, max_age_seconds=_CACHE_MAX_AGE_SECONDS)
+        if cached is not None:
+            return CachedResponse(cached)
+    if tool_context.state.get("streaming"):
+        # Mode streaming: les chunks sont publiés au fil de l'eau dans l'état
+        # de session (voir le même motif dans crops/tools.py), ce qui réduit
+        # le temps-avant-premier-octet perçu sans changer la valeur de retour.
+        async with get_semaphore():
+            stream = await _get_model().generate_content_async(prompt, stream=True)
+            parts: List[str] = []
+            async for chunk in stream:
+                parts.append(chunk.text)
+                tool_context.state["partial_response"] = "".join(parts)
+            response = CachedResponse("".join(parts), from_cache=False)
+    else:
+        async with get_semaphore():
+            response = await _get_model().generate_content_async(prompt)
+    _cache.set(response.text, prompt)
+    return response
+
+
+# Tables constantes hissées au niveau module: valeurs statiques, plus de
+# reconstruction de dicts à chaque appel. Les tables de facteurs (jamais
+# renvoyées à l'appelant) sont gelées via MappingProxyType; les structures
+# renvoyées dans les résultats d'outils restent des dicts JSON-sérialisables
+# partagés — à ne pas muter.
+# Facteur saisonnier simulé par mois (1=janvier): soudure en juin-août,
+# récolte en novembre-janvier.
+_SEASONAL_FACTOR_BY_MONTH = (
+    0.9, 1.0, 1.0, 1.0, 1.0, 1.2, 1.2, 1.2, 1.0, 1.0, 0.9, 0.9
+)
+
+_MARKET_MULTIPLIERS = MappingProxyType({
+    "producteur": 0.7,  # Prix au producteur plus bas
+    "gros": 1.0,        # Prix de référence
+    "détail": 1.4,      # Prix au détail plus élevé
+    "export": 1.2       # Prix export variable
+})
+
+_YIELD_FACTORS = MappingProxyType({
+    "traditionnel": 0.7,
+    "amélioré": 1.0,
+    "intensif": 1.4
+})
+
+# Coûts de base par hectare (FCFA) pour l'analyse de rentabilité.
+_PROFIT_BASE_COSTS = {
+    "semences": 25000,
+    "engrais": 45000,
+    "pesticides": 20000,
+    "main_oeuvre": 80000,
+    "transport": 15000,
+    "divers": 10000
+}
+
+# Ajustements engrais/pesticides par système de production.
+_PROFIT_COST_ADJUSTMENTS = {
+    "intensif": {"engrais": 1.5, "pesticides": 1.3},
+    "traditionnel": {"engrais": 0.5, "pesticides": 0.3},
+}
+
+
+def _profit_costs(production_system: str) -> Dict[str, float]:
+    """Coûts par hectare ajustés au système, précalculés par variante."""
+    return _PROFIT_COSTS_BY_SYSTEM.get(production_system, _PROFIT_BASE_COSTS)
+
+
+_PROFIT_COSTS_BY_SYSTEM = {
+    system: {
+        item: cost * adjustments.get(item, 1.0)
+        for item, cost in _PROFIT_BASE_COSTS.items()
+    }
+    for system, adjustments in _PROFIT_COST_ADJUSTMENTS.items()
+}
+
+_MARKET_FACTORS = (
+    "Conditions climatiques",
+    "Demande d'exportation",
+    "Politique gouvernementale",
+    "Coûts de transport",
+    "Concurrence régionale"
+)
+
+# Canaux de commercialisation possibles.
+_SALES_CHANNELS = {
+    "marché_local": {
+        "prix_relatif": 0.8,
+        "délai_jours": 1,
+        "coût_transport": 0.02,
+        "avantages": ["Paiement immédiat", "Pas d'intermédiaire"],
+        "inconvénients": ["Prix plus bas", "Quantités limitées"]
+    },
+    "coopérative": {
+        "prix_relatif": 0.9,
+        "délai_jours": 7,
+        "coût_transport": 0.01,
+        "avantages": ["Prix négocié", "Soutien technique"],
+        "inconvénients": ["Délai de paiement", "Conditions qualité"]
+    },
+    "grossiste": {
+        "prix_relatif": 0.85,
+        "délai_jours": 3,
+        "coût_transport": 0.03,
+        "avantages": ["Gros volumes", "Régularité"],
+        "inconvénients": ["Négociation difficile", "Dépendance"]
+    },
+    "export": {
+        "prix_relatif": 1.2,
+        "délai_jours": 30,
+        "coût_transport": 0.08,
+        "avantages": ["Prix élevé", "Devise"],
+        "inconvénients": ["Exigences qualité", "Procédures complexes"]
+    }
+}
+
+# Attributs numériques des canaux en tableaux parallèles: les revenus de
+# tous les canaux se calculent en une passe vectorisée.
+_CHANNEL_NAMES = tuple(_SALES_CHANNELS)
+_CHANNEL_INDEX = MappingProxyType({name: i for i, name in enumerate(_CHANNEL_NAMES)})
+_CHANNEL_PRICE_REL = np.array(
+    [_SALES_CHANNELS[name]["prix_relatif"] for name in _CHANNEL_NAMES]
+)
+_CHANNEL_TRANSPORT = np.array(
+    [_SALES_CHANNELS[name]["coût_transport"] for name in _CHANNEL_NAMES]
+)
+
+# Coûts de production de base par poste (FCFA/ha).
+_PRODUCTION_BASE_COSTS = {
+    "préparation_sol": {
+        "labour": 30000,
+        "hersage": 15000,
+        "billonnage": 10000
+    },
+    "semences_plants": {
+        "semences": 25000,
+        "transport_semences": 2000
+    },
+    "fertilisation": {
+        "engrais_organique": 20000,
+        "engrais_minéral": 35000,
+        "amendements": 8000
+    },
+    "protection_cultures": {
+        "herbicides": 15000,
+        "insecticides": 12000,
+        "fongicides": 8000
+    },
+    "main_oeuvre": {
+        "plantation": 25000,
+        "entretien": 40000,
+        "récolte": 35000
+    },
+    "autres": {
+        "transport_intrants": 8000,
+        "stockage": 5000,
+        "divers": 7000
+    }
+}
 
-def get_market_prices(
+_INPUT_FACTORS = MappingProxyType({
+    "minimal": 0.6,
+    "standard": 1.0,
+    "intensif": 1.5
+})
+
+
+# Représentation vectorielle des postes de coûts: tous les montants dans un
+# seul tableau float64, les catégories repérées par leurs indices de début.
+# Les variantes par niveau d'intrants sortent d'un unique produit broadcast
+# (niveaux × postes) + reduceat par catégorie, et les sweeps de scénarios
+# futurs peuvent réutiliser ces mêmes tableaux sans repasser par Python.
+_COST_CATEGORY_NAMES = tuple(_PRODUCTION_BASE_COSTS)
+_COST_ITEM_NAMES = tuple(
+    item for items in _PRODUCTION_BASE_COSTS.values() for item in items
+)
+_COST_ITEMS = np.array(
+    [cost for items in _PRODUCTION_BASE_COSTS.values() for cost in items.values()],
+    dtype=np.float64,
+)
+_CATEGORY_STARTS = np.cumsum(
+    [0] + [len(items) for items in _PRODUCTION_BASE_COSTS.values()][:-1]
+)
+
+_LEVEL_NAMES = tuple(_INPUT_FACTORS)
+_scaled = _COST_ITEMS[None, :] * np.array(
+    [_INPUT_FACTORS[level] for level in _LEVEL_NAMES], dtype=np.float64
+)[:, None]
+_category_totals = np.add.reduceat(_scaled, _CATEGORY_STARTS, axis=1)
+
+# Variantes pré-multipliées par niveau d'intrants: le calcul par appel se
+# réduit à un lookup. Les dicts ne sont matérialisés qu'ici, une fois.
+_PRODUCTION_COSTS_BY_LEVEL = {}
+for _i, _level in enumerate(_LEVEL_NAMES):
+    _by_category: Dict[str, Dict[str, float]] = {}
+    _j = 0
+    for _c, (_category, _items) in enumerate(_PRODUCTION_BASE_COSTS.items()):
+        _by_category[_category] = {
+            item: float(_scaled[_i, _j + k]) for k, item in enumerate(_items)
+        }
+        _by_category[_category]["total"] = float(_category_totals[_i, _c])
+        _j += len(_items)
+    _PRODUCTION_COSTS_BY_LEVEL[_level] = _by_category
+_PRODUCTION_TOTAL_PER_HA = {
+    level: float(_scaled[i].sum()) for i, level in enumerate(_LEVEL_NAMES)
+}
+
+# Opportunités par secteur.
+_OPPORTUNITIES = {
+    "cultures_émergentes": {
+        "moringa": {
+            "potentiel": "très élevé",
+            "investissement_min": 200000,
+            "roi_estimé": "200-300%",
+            "marché_cible": "export, nutrition"
+        },
+        "avocat": {
+            "potentiel": "élevé",
+            "investissement_min": 500000,
+            "roi_estimé": "150-200%",
+            "marché_cible": "urbain, export"
+        },
+        "spiruline": {
+            "potentiel": "élevé",
+            "investissement_min": 1000000,
+            "roi_estimé": "300-400%",
+            "marché_cible": "santé, export"
+        }
+    },
+    "transformation": {
+        "farine_manioc": {
+            "potentiel": "très élevé",
+            "investissement_min": 300000,
+            "roi_estimé": "100-150%",
+            "marché_cible": "boulangerie, export"
+        },
+        "huile_palme_artisanale": {
+            "potentiel": "élevé",
+            "investissement_min": 150000,
+            "roi_estimé": "80-120%",
+            "marché_cible": "local, régional"
+        }
+    },
+    "services": {
+        "location_équipement": {
+            "potentiel": "élevé",
+            "investissement_min": 800000,
+            "roi_estimé": "60-100%",
+            "marché_cible": "petits agriculteurs"
+        },
+        "formation_conseil": {
+            "potentiel": "modéré",
+            "investissement_min": 50000,
+            "roi_estimé": "50-80%",
+            "marché_cible": "agriculteurs, coopératives"
+        }
+    }
+}
+
+_POTENTIAL_SCORES = MappingProxyType(
+    {"très élevé": 5, "élevé": 4, "modéré": 3, "faible": 2}
+)
+
+# Scores d'opportunité précalculés: le catalogue est statique, le parsing des
+# chaînes "roi_estimé" ("200-300%") et la pondération ne se font qu'à l'import.
+_OPPORTUNITY_SCORES = {
+    (sector, item): (
+        int(data["roi_estimé"].split("-")[0].replace("%", "")) / 20
+        + _POTENTIAL_SCORES.get(data["potentiel"], 3)
+    )
+    for sector, items in _OPPORTUNITIES.items()
+    for item, data in items.items()
+}
+
+
+@functools.lru_cache(maxsize=128)
+def _price_history(crop: str, year_month: str, average: float) -> tuple:
+    """Historique de prix simulé, gelé par (culture, mois).
+
+    Le bruit aléatoire ne sert que de contexte au LLM: le figer rend le
+    préfixe du prompt identique d'un appel à l'autre pour le même couple,
+    ce qui économise les tirages et augmente les hits du cache implicite
+    de Gemini sur le préambule.
+    """
+    now = datetime.now()
+    month_prices = (average * (0.8 + _RNG.random(12) * 0.4)).astype(int)
+    volumes = _RNG.integers(100, 1001, size=12)
+    return tuple(
+        {
+            "month": (now - timedelta(days=i * 30)).strftime("%B %Y"),
+            "price": int(month_prices[i]),
+            "volume_estimation": int(volumes[i]),
+        }
+        for i in range(12)
+    )
+
+
+# Résultats complets de get_market_prices par (culture, marché, région,
+# narration, jour): la simulation ne bouge qu'à la journée, les re-demandes
+# du même tuple dans un tour d'agent deviennent un lookup sans token.
+_market_prices_memo: Dict[tuple, Dict[str, Any]] = {}
+
+
+async def get_market_prices(
     crop: str,
     tool_context: ToolContext,
     market_type: str = "gros",
     region: Optional[str] = None,
+    include_analysis: bool = True,
 ) -> Dict[str, Any]:
     """Obtient les prix actuels du marché pour une culture.
     
@@ -29,89 +450,76 @@ def get_market_prices(
         region: Région (optionnel)
         market_type: Type de marché (gros, détail, export)
         tool_context: Contexte de l'outil
+        include_analysis: Génère la narration LLM (False pour les
+            consommateurs machine qui n'utilisent que les champs numériques)
         
     Returns:
         Prix du marché avec tendances
     """
+    memo_key = (crop, market_type, region, include_analysis, date.today().isoformat())
+    cached_result = _market_prices_memo.get(memo_key)
+    if cached_result is not None and not tool_context.state.get("force_refresh"):
+        return cached_result
+    
     config = get_config()
     
     # Obtenir les prix de base
-    base_prices = MARKET_PRICES.get(CropType(crop), {"min": 100, "max": 500, "average": 300})
+    base_prices = MARKET_PRICES.get(_crop(crop), {"min": 100, "max": 500, "average": 300})
     
     # Simulation de variations selon le type de marché
-    market_multipliers = {
-        "producteur": 0.7,  # Prix au producteur plus bas
-        "gros": 1.0,        # Prix de référence
-        "détail": 1.4,      # Prix au détail plus élevé
-        "export": 1.2       # Prix export variable
-    }
+    multiplier = _MARKET_MULTIPLIERS.get(market_type, 1.0)
     
-    multiplier = market_multipliers.get(market_type, 1.0)
-    
-    # Variations saisonnières simulées
-    current_month = datetime.now().month
-    seasonal_factor = 1.0
-    
-    # Exemple: prix plus élevés en période de soudure
-    if current_month in [6, 7, 8]:  # Période de soudure
-        seasonal_factor = 1.2
-    elif current_month in [11, 12, 1]:  # Période de récolte
-        seasonal_factor = 0.9
+    # Variations saisonnières simulées: lecture unique de l'horloge, facteur
+    # par table précalculée
+    now = datetime.now()
+    seasonal_factor = _SEASONAL_FACTOR_BY_MONTH[now.month - 1]
     
     # Prix avec variations
     current_price = int(base_prices["average"] * multiplier * seasonal_factor)
     min_price = int(base_prices["min"] * multiplier * seasonal_factor)
     max_price = int(base_prices["max"] * multiplier * seasonal_factor)
     
-    # Génération de données historiques simulées
-    price_history = []
-    for i in range(12):  # 12 derniers mois
-        month_date = datetime.now() - timedelta(days=i*30)
-        month_price = int(base_prices["average"] * (0.8 + random.random() * 0.4))
-        price_history.append({
-            "month": month_date.strftime("%B %Y"),
-            "price": month_price,
-            "volume_estimation": random.randint(100, 1000)
-        })
-    
-    # Utiliser Gemini pour générer une analyse
-    prompt = f"""
-    Analyse économique des prix pour {crop} au Cameroun en {region or "toutes régions"}:
-    
-    Prix actuel: {current_price} FCFA/kg
-    Fourchette: {min_price} - {max_price} FCFA/kg
-    Type de marché: {market_type}
-    Historique: {price_history[:3]}
-    
-    Fournis une analyse incluant:
-    1. Évaluation du niveau de prix actuel
-    2. Facteurs influençant les prix
-    3. Prévisions à court terme
-    4. Conseils pour optimiser les ventes
-    5. Comparaison avec les autres cultures
-    """
-    
-    response = model.generate_content(prompt)
-    
-    return {
+    # Historique simulé stable sur le mois (voir _price_history)
+    price_history = list(_price_history(crop, now.strftime("%Y-%m"), base_prices["average"]))
+    
+    # Narration Gemini, sautée quand l'appelant ne consomme que les chiffres
+    analysis = None
+    if include_analysis:
+        prompt = _MARKET_PRICES_PREFIX + (
+            f"\nDonnées:\n"
+            f"- Culture: {crop} ({region or 'toutes régions'})\n"
+            f"- Prix actuel: {current_price} FCFA/kg (fourchette {min_price}-{max_price})\n"
+            f"- Type de marché: {market_type}\n"
+            f"- Historique: {_fmt_compact(price_history[:3])}"
+        )
+        response = await _generate(prompt, tool_context)
+        analysis = response.text
+    
+    result = {
         "crop": crop,
         "region": region,
         "market_type": market_type,
         "current_price": current_price,
         "price_range": {"min": min_price, "max": max_price},
         "currency": config.currency,
-        "date": datetime.now().strftime("%Y-%m-%d"),
+        "date": now.strftime("%Y-%m-%d"),
         "price_history": price_history,
-        "analysis": response.text,
+        "analysis": analysis,
         "trend": "stable" if seasonal_factor == 1.0 else ("hausse" if seasonal_factor > 1.0 else "baisse")
     }
+    if len(_market_prices_memo) > 256:
+        # Purge simple: les clés datées des jours précédents ne reviennent pas.
+        _market_prices_memo.clear()
+    _market_prices_memo[memo_key] = result
+    return result
 
 
-def analyze_profitability(
+async def analyze_profitability(
     crop: str,
     area_hectares: float,
     tool_context: ToolContext,
     production_system: str = "traditionnel",
+    include_analysis: bool = True,
 ) -> Dict[str, Any]:
     """Analyse la rentabilité d'une culture.
     
@@ -120,44 +528,21 @@ def analyze_profitability(
         area_hectares: Superficie en hectares
         production_system: Système de production (traditionnel, amélioré, intensif)
         tool_context: Contexte de l'outil
+        include_analysis: Génère la narration LLM (False pour les
+            consommateurs machine qui n'utilisent que les champs numériques)
         
     Returns:
         Analyse de rentabilité détaillée
     """
-    # Rendements selon le système
-    yield_factors = {
-        "traditionnel": 0.7,
-        "amélioré": 1.0,
-        "intensif": 1.4
-    }
-    
-    # Coûts de base par hectare (FCFA)
-    base_costs = {
-        "semences": 25000,
-        "engrais": 45000,
-        "pesticides": 20000,
-        "main_oeuvre": 80000,
-        "transport": 15000,
-        "divers": 10000
-    }
-    
-    factor = yield_factors.get(production_system, 1.0)
-    
-    # Ajustement des coûts selon le système
-    if production_system == "intensif":
-        base_costs["engrais"] *= 1.5
-        base_costs["pesticides"] *= 1.3
-    elif production_system == "traditionnel":
-        base_costs["engrais"] *= 0.5
-        base_costs["pesticides"] *= 0.3
+    factor = _YIELD_FACTORS.get(production_system, 1.0)
     
-    # Calcul du coût total par hectare
+    # Coûts par hectare pré-ajustés au système (voir _PROFIT_COSTS_BY_SYSTEM)
+    base_costs = _profit_costs(production_system)
     total_cost_per_ha = sum(base_costs.values())
     total_cost = total_cost_per_ha * area_hectares
     
     # Estimation du rendement
-    from ...utils.data import get_crop_info
-    crop_info = get_crop_info(CropType(crop))
+    crop_info = _crop_info(_crop(crop))
     if crop_info:
         expected_yield_ha = crop_info.expected_yield_per_hectare * factor
         total_yield = expected_yield_ha * area_hectares
@@ -166,7 +551,7 @@ def analyze_profitability(
         total_yield = expected_yield_ha * area_hectares
     
     # Prix de vente estimé
-    market_price = MARKET_PRICES.get(CropType(crop), {"average": 300})["average"]
+    market_price = MARKET_PRICES.get(_crop(crop), {"average": 300})["average"]
     
     # Calcul des revenus
     gross_revenue = total_yield * market_price
@@ -174,28 +559,19 @@ def analyze_profitability(
     profit_margin = (net_revenue / gross_revenue * 100) if gross_revenue > 0 else 0
     roi = (net_revenue / total_cost * 100) if total_cost > 0 else 0
     
-    # Utiliser Gemini pour l'analyse
-    prompt = f"""
-    Analyse de rentabilité pour {crop} au Cameroun:
-    
-    Superficie: {area_hectares} ha
-    Système: {production_system}
-    Coûts totaux: {total_cost:,.0f} FCFA
-    Rendement estimé: {total_yield:,.0f} kg
-    Revenus bruts: {gross_revenue:,.0f} FCFA
-    Bénéfice net: {net_revenue:,.0f} FCFA
-    Marge: {profit_margin:.1f}%
-    ROI: {roi:.1f}%
-    
-    Fournis une analyse incluant:
-    1. Évaluation de la rentabilité
-    2. Points d'amélioration possibles
-    3. Risques économiques
-    4. Recommandations concrètes
-    5. Comparaison avec d'autres cultures
-    """
-    
-    response = model.generate_content(prompt)
+    # Narration Gemini, sautée quand l'appelant ne consomme que les chiffres
+    analysis = None
+    if include_analysis:
+        prompt = _PROFITABILITY_PREFIX + (
+            f"\nDonnées:\n"
+            f"- Culture: {crop}, {area_hectares} ha, système {production_system}\n"
+            f"- Coûts totaux: {total_cost:,.0f} FCFA\n"
+            f"- Rendement estimé: {total_yield:,.0f} kg\n"
+            f"- Revenus bruts: {gross_revenue:,.0f} FCFA, bénéfice net: {net_revenue:,.0f} FCFA\n"
+            f"- Marge: {profit_margin:.1f}%, ROI: {roi:.1f}%"
+        )
+        response = await _generate(prompt, tool_context)
+        analysis = response.text
     
     return {
         "crop": crop,
@@ -222,14 +598,32 @@ def analyze_profitability(
             "roi_percent": roi,
             "break_even_kg": total_cost / market_price if market_price > 0 else 0
         },
-        "analysis": response.text
+        "analysis": analysis
     }
 
 
-def get_market_trends(
+async def _build_trend(
+    crop_name: str,
+    direction: str,
+    variation: int,
+    demand_level: str,
+    supply_situation: str,
+) -> tuple:
+    """Construit l'entrée de tendance d'une culture (point d'extension async)."""
+    return crop_name, {
+        "trend": direction,
+        "variation_percent": variation,
+        "key_factors": _RNG.choice(_MARKET_FACTORS, size=3, replace=False).tolist(),
+        "demand_level": demand_level,
+        "supply_situation": supply_situation
+    }
+
+
+async def get_market_trends(
     tool_context: ToolContext,
     crop: Optional[str] = None,
     period_months: int = 12,
+    include_analysis: bool = True,
 ) -> Dict[str, Any]:
     """Analyse les tendances du marché.
     
@@ -237,72 +631,69 @@ def get_market_trends(
         crop: Culture spécifique (optionnel)
         period_months: Période d'analyse en mois
         tool_context: Contexte de l'outil
+        include_analysis: Génère la narration LLM (False pour les
+            consommateurs machine qui n'utilisent que les champs numériques)
         
     Returns:
         Analyse des tendances du marché
     """
     # Génération de données de tendance simulées
-    trends_data = {}
-    
     if crop:
         crops_to_analyze = [crop]
     else:
         crops_to_analyze = ["cacao", "café", "manioc", "maïs", "plantain"]
     
-    for crop_name in crops_to_analyze:
-        # Simulation de tendances
-        trend_direction = random.choice(["hausse", "baisse", "stable"])
-        trend_percentage = random.randint(-15, 25)
-        
-        market_factors = [
-            "Conditions climatiques",
-            "Demande d'exportation", 
-            "Politique gouvernementale",
-            "Coûts de transport",
-            "Concurrence régionale"
-        ]
-        
-        selected_factors = random.sample(market_factors, 3)
-        
-        trends_data[crop_name] = {
-            "trend": trend_direction,
-            "variation_percent": trend_percentage,
-            "key_factors": selected_factors,
-            "demand_level": random.choice(["faible", "modérée", "forte", "très forte"]),
-            "supply_situation": random.choice(["déficit", "équilibre", "excédent"])
-        }
-    
-    # Utiliser Gemini pour l'analyse
-    prompt = f"""
-    Analyse des tendances du marché agricole camerounais sur {period_months} mois:
-    
-    Données: {trends_data}
-    
-    Fournis une analyse complète incluant:
-    1. Tendances générales du marché
-    2. Cultures les plus prometteuses
-    3. Facteurs de risque identifiés
-    4. Opportunités émergentes
-    5. Recommandations stratégiques pour les agriculteurs
-    6. Prévisions pour les 6 prochains mois
-    """
-    
-    response = model.generate_content(prompt)
+    # Simulation de tendances: tous les tirages en une passe vectorisée
+    n = len(crops_to_analyze)
+    directions = _RNG.choice(["hausse", "baisse", "stable"], size=n).tolist()
+    variations = _RNG.integers(-15, 26, size=n).tolist()
+    demand_levels = _RNG.choice(
+        ["faible", "modérée", "forte", "très forte"], size=n
+    ).tolist()
+    supply_situations = _RNG.choice(
+        ["déficit", "équilibre", "excédent"], size=n
+    ).tolist()
+    
+    # Fan-out par culture: aujourd'hui purement CPU, mais tout enrichissement
+    # I/O par culture ajouté dans _build_trend (scraping MINADER, appel LLM
+    # dédié) s'exécutera en parallèle sans retoucher cette boucle.
+    entries = await asyncio.gather(*(
+        _build_trend(
+            crop_name,
+            directions[i],
+            int(variations[i]),
+            demand_levels[i],
+            supply_situations[i],
+        )
+        for i, crop_name in enumerate(crops_to_analyze)
+    ))
+    trends_data = dict(entries)
+    
+    # Narration Gemini, sautée quand l'appelant ne consomme que les chiffres
+    analysis = None
+    if include_analysis:
+        prompt = _MARKET_TRENDS_PREFIX + (
+            f"\nPériode analysée: {period_months} mois\n"
+            f"Données: {_fmt_compact(trends_data)}"
+        )
+        response = await _generate(prompt, tool_context)
+        analysis = response.text
     
     return {
         "period_months": period_months,
         "analysis_date": datetime.now().strftime("%Y-%m-%d"),
         "trends_data": trends_data,
-        "market_analysis": response.text,
+        "market_analysis": analysis,
         "recommended_crops": [crop for crop, data in trends_data.items() if data["variation_percent"] > 10]
     }
 
 
-def recommend_sales_strategy(
+async def recommend_sales_strategy(
     crop: str,
     quantity_kg: float,
     tool_context: ToolContext,
     urgency: str = "normal",
+    include_analysis: bool = True,
 ) -> Dict[str, Any]:
     """Recommande une stratégie de vente optimale.
     
@@ -311,44 +702,14 @@ def recommend_sales_strategy(
         quantity_kg: Quantité à vendre en kg
         urgency: Urgence de vente (urgent, normal, patient)
         tool_context: Contexte de l'outil
+        include_analysis: Génère la narration LLM (False pour les
+            consommateurs machine qui n'utilisent que les champs numériques)
         
     Returns:
         Stratégie de vente recommandée
     """
-    # Canaux de commercialisation possibles
-    sales_channels = {
-        "marché_local": {
-            "prix_relatif": 0.8,
-            "délai_jours": 1,
-            "coût_transport": 0.02,
-            "avantages": ["Paiement immédiat", "Pas d'intermédiaire"],
-            "inconvénients": ["Prix plus bas", "Quantités limitées"]
-        },
-        "coopérative": {
-            "prix_relatif": 0.9,
-            "délai_jours": 7,
-            "coût_transport": 0.01,
-            "avantages": ["Prix négocié", "Soutien technique"],
-            "inconvénients": ["Délai de paiement", "Conditions qualité"]
-        },
-        "grossiste": {
-            "prix_relatif": 0.85,
-            "délai_jours": 3,
-            "coût_transport": 0.03,
-            "avantages": ["Gros volumes", "Régularité"],
-            "inconvénients": ["Négociation difficile", "Dépendance"]
-        },
-        "export": {
-            "prix_relatif": 1.2,
-            "délai_jours": 30,
-            "coût_transport": 0.08,
-            "avantages": ["Prix élevé", "Devise"],
-            "inconvénients": ["Exigences qualité", "Procédures complexes"]
-        }
-    }
-    
     # Prix de base
-    base_price = MARKET_PRICES.get(CropType(crop), {"average": 300})["average"]
+    base_price = MARKET_PRICES.get(_crop(crop), {"average": 300})["average"]
     
     # Recommandations selon l'urgence
     if urgency == "urgent":
@@ -358,45 +719,43 @@ def recommend_sales_strategy(
     else:
         recommended_channels = ["coopérative", "grossiste"]
     
-    # Calcul des revenus potentiels par canal
+    # Revenus de tous les canaux en une passe vectorisée; les scénarios ne
+    # sont matérialisés que pour les canaux retenus par le filtre d'urgence
+    prices_per_kg = base_price * _CHANNEL_PRICE_REL
+    transport_costs = quantity_kg * _CHANNEL_TRANSPORT * base_price
+    gross_revenues = quantity_kg * prices_per_kg
+    net_revenues = gross_revenues - transport_costs
+    
     revenue_scenarios = {}
     for channel in recommended_channels:
-        channel_data = sales_channels[channel]
-        price_per_kg = base_price * channel_data["prix_relatif"]
-        transport_cost = quantity_kg * channel_data["coût_transport"] * base_price
-        net_revenue = (quantity_kg * price_per_kg) - transport_cost
-        
+        i = _CHANNEL_INDEX[channel]
+        channel_data = _SALES_CHANNELS[channel]
         revenue_scenarios[channel] = {
-            "price_per_kg": price_per_kg,
-            "gross_revenue": quantity_kg * price_per_kg,
-            "transport_cost": transport_cost,
-            "net_revenue": net_revenue,
+            "price_per_kg": float(prices_per_kg[i]),
+            "gross_revenue": float(gross_revenues[i]),
+            "transport_cost": float(transport_costs[i]),
+            "net_revenue": float(net_revenues[i]),
             "delivery_days": channel_data["délai_jours"],
             "advantages": channel_data["avantages"],
             "disadvantages": channel_data["inconvénients"]
         }
     
-    # Utiliser Gemini pour la recommandation
-    prompt = f"""
-    Stratégie de vente pour {crop} au Cameroun:
-    
-    Quantité: {quantity_kg} kg
-    Urgence: {urgency}
-    Scénarios de revenus: {revenue_scenarios}
-    
-    Recommande la meilleure stratégie en considérant:
-    1. Canal de vente optimal
-    2. Timing de vente
-    3. Préparation nécessaire (qualité, conditionnement)
-    4. Négociation des prix
-    5. Diversification des canaux
-    6. Alternatives en cas de difficulté
-    """
+    # Narration Gemini, sautée quand l'appelant ne consomme que les chiffres
+    analysis = None
+    if include_analysis:
+        prompt = _SALES_STRATEGY_PREFIX + (
+            f"\nDonnées:\n"
+            f"- Culture: {crop}, quantité: {quantity_kg} kg, urgence: {urgency}\n"
+            f"- Scénarios de revenus: {_fmt_compact(revenue_scenarios)}"
+        )
+        response = await _generate(prompt, tool_context)
+        analysis = response.text
     
-    response = model.generate_content(prompt)
     
-    # Meilleur canal par revenu net
-    best_channel = max(revenue_scenarios.keys(), key=lambda x: revenue_scenarios[x]["net_revenue"])
+    # Meilleur canal par revenu net (sur les canaux retenus)
+    best_channel = max(
+        recommended_channels, key=lambda c: net_revenues[_CHANNEL_INDEX[c]]
+    )
     
     return {
         "crop": crop,
@@ -404,16 +763,17 @@ def recommend_sales_strategy(
         "urgency": urgency,
         "recommended_channel": best_channel,
         "revenue_scenarios": revenue_scenarios,
-        "strategy_analysis": response.text,
+        "strategy_analysis": analysis,
         "estimated_best_revenue": revenue_scenarios[best_channel]["net_revenue"]
     }
 
 
-def calculate_production_costs(
+async def calculate_production_costs(
     crop: str,
     area_hectares: float,
     tool_context: ToolContext,
     input_level: str = "standard",
+    include_analysis: bool = True,
 ) -> Dict[str, Any]:
     """Calcule les coûts de production détaillés.
     
@@ -422,91 +782,29 @@ def calculate_production_costs(
         area_hectares: Superficie en hectares
         input_level: Niveau d'intrants (minimal, standard, intensif)
         tool_context: Contexte de l'outil
+        include_analysis: Génère la narration LLM (False pour les
+            consommateurs machine qui n'utilisent que les champs numériques)
         
     Returns:
         Analyse détaillée des coûts de production
     """
-    # Coûts de base par poste (FCFA/ha)
-    base_costs = {
-        "préparation_sol": {
-            "labour": 30000,
-            "hersage": 15000,
-            "billonnage": 10000
-        },
-        "semences_plants": {
-            "semences": 25000,
-            "transport_semences": 2000
-        },
-        "fertilisation": {
-            "engrais_organique": 20000,
-            "engrais_minéral": 35000,
-            "amendements": 8000
-        },
-        "protection_cultures": {
-            "herbicides": 15000,
-            "insecticides": 12000,
-            "fongicides": 8000
-        },
-        "main_oeuvre": {
-            "plantation": 25000,
-            "entretien": 40000,
-            "récolte": 35000
-        },
-        "autres": {
-            "transport_intrants": 8000,
-            "stockage": 5000,
-            "divers": 7000
-        }
-    }
-    
-    # Facteurs selon le niveau d'intrants
-    input_factors = {
-        "minimal": 0.6,
-        "standard": 1.0,
-        "intensif": 1.5
-    }
-    
-    factor = input_factors.get(input_level, 1.0)
-    
-    # Calcul des coûts ajustés
-    adjusted_costs = {}
-    total_cost_per_ha = 0
-    
-    for category, items in base_costs.items():
-        adjusted_costs[category] = {}
-        category_total = 0
-        
-        for item, cost in items.items():
-            adjusted_cost = cost * factor
-            adjusted_costs[category][item] = adjusted_cost
-            category_total += adjusted_cost
-        
-        adjusted_costs[category]["total"] = category_total
-        total_cost_per_ha += category_total
-    
+    # Coûts pré-multipliés par niveau d'intrants: simple lookup par appel
+    level = input_level if input_level in _PRODUCTION_COSTS_BY_LEVEL else "standard"
+    adjusted_costs = _PRODUCTION_COSTS_BY_LEVEL[level]
+    total_cost_per_ha = _PRODUCTION_TOTAL_PER_HA[level]
     total_cost = total_cost_per_ha * area_hectares
     
-    # Utiliser Gemini pour l'analyse
-    prompt = f"""
-    Analyse des coûts de production pour {crop} au Cameroun:
-    
-    Superficie: {area_hectares} ha
-    Niveau d'intrants: {input_level}
-    Coût total par hectare: {total_cost_per_ha:,.0f} FCFA
-    Coût total: {total_cost:,.0f} FCFA
-    
-    Détail des coûts: {adjusted_costs}
-    
-    Fournis une analyse incluant:
-    1. Répartition des coûts par poste
-    2. Postes les plus coûteux
-    3. Opportunités de réduction des coûts
-    4. Alternatives économiques locales
-    5. Impact du niveau d'intrants sur la rentabilité
-    6. Conseils pour l'optimisation financière
-    """
-    
-    response = model.generate_content(prompt)
+    # Narration Gemini, sautée quand l'appelant ne consomme que les chiffres
+    analysis = None
+    if include_analysis:
+        prompt = _PRODUCTION_COSTS_PREFIX + (
+            f"\nDonnées:\n"
+            f"- Culture: {crop}, {area_hectares} ha, intrants {input_level}\n"
+            f"- Coût par hectare: {total_cost_per_ha:,.0f} FCFA, total: {total_cost:,.0f} FCFA\n"
+            f"- Détail des coûts: {_fmt_compact(adjusted_costs)}"
+        )
+        response = await _generate(prompt, tool_context)
+        analysis = response.text
     
     return {
         "crop": crop,
@@ -518,19 +816,20 @@ def calculate_production_costs(
             "total": total_cost,
             "currency": "FCFA"
         },
-        "cost_analysis": response.text,
-        "major_cost_drivers": sorted(
-            [(cat, data["total"]) for cat, data in adjusted_costs.items()],
-            key=lambda x: x[1],
-            reverse=True
-        )[:3]
+        "cost_analysis": analysis,
+        "major_cost_drivers": heapq.nlargest(
+            3,
+            ((cat, data["total"]) for cat, data in adjusted_costs.items()),
+            key=itemgetter(1),
+        )
     }
 
 
-def analyze_market_opportunities(
+async def analyze_market_opportunities(
     tool_context: ToolContext,
     region: Optional[str] = None,
     investment_budget: Optional[float] = None,
+    include_analysis: bool = True,
 ) -> Dict[str, Any]:
     """Identifie les opportunités de marché.
     
@@ -538,61 +837,13 @@ def analyze_market_opportunities(
         region: Région d'intérêt (optionnel)
         investment_budget: Budget d'investissement disponible (optionnel)
         tool_context: Contexte de l'outil
+        include_analysis: Génère la narration LLM (False pour les
+            consommateurs machine qui n'utilisent que les champs numériques)
         
     Returns:
         Analyse des opportunités de marché
     """
-    # Opportunités par secteur
-    opportunities = {
-        "cultures_émergentes": {
-            "moringa": {
-                "potentiel": "très élevé",
-                "investissement_min": 200000,
-                "roi_estimé": "200-300%",
-                "marché_cible": "export, nutrition"
-            },
-            "avocat": {
-                "potentiel": "élevé", 
-                "investissement_min": 500000,
-                "roi_estimé": "150-200%",
-                "marché_cible": "urbain, export"
-            },
-            "spiruline": {
-                "potentiel": "élevé",
-                "investissement_min": 1000000,
-                "roi_estimé": "300-400%",
-                "marché_cible": "santé, export"
-            }
-        },
-        "transformation": {
-            "farine_manioc": {
-                "potentiel": "très élevé",
-                "investissement_min": 300000,
-                "roi_estimé": "100-150%",
-                "marché_cible": "boulangerie, export"
-            },
-            "huile_palme_artisanale": {
-                "potentiel": "élevé",
-                "investissement_min": 150000,
-                "roi_estimé": "80-120%",
-                "marché_cible": "local, régional"
-            }
-        },
-        "services": {
-            "location_équipement": {
-                "potentiel": "élevé",
-                "investissement_min": 800000,
-                "roi_estimé": "60-100%",
-                "marché_cible": "petits agriculteurs"
-            },
-            "formation_conseil": {
-                "potentiel": "modéré",
-                "investissement_min": 50000,
-                "roi_estimé": "50-80%",
-                "marché_cible": "agriculteurs, coopératives"
-            }
-        }
-    }
+    opportunities = _OPPORTUNITIES
     
     # Filtrage selon le budget si fourni
     if investment_budget:
@@ -604,50 +855,122 @@ def analyze_market_opportunities(
                 filtered_opportunities[sector] = filtered_items
         opportunities = filtered_opportunities
     
-    # Utiliser Gemini pour l'analyse
-    prompt = f"""
-    Analyse des opportunités de marché agricole au Cameroun:
-    
-    Région: {region or "Toutes régions"}
-    Budget disponible: {investment_budget or "Non spécifié"} FCFA
-    
-    Opportunités identifiées: {opportunities}
-    
-    Fournis une analyse détaillée incluant:
-    1. Top 3 des meilleures opportunités
-    2. Facteurs de succès pour chaque opportunité
-    3. Risques et défis à considérer
-    4. Étapes de mise en œuvre
-    5. Partenaires potentiels
-    6. Sources de financement disponibles
-    7. Timeline recommandé
-    """
+    # Narration Gemini, sautée quand l'appelant ne consomme que les chiffres
+    analysis = None
+    if include_analysis:
+        prompt = _OPPORTUNITIES_PREFIX + (
+            f"\nDonnées:\n"
+            f"- Région: {region or 'Toutes régions'}\n"
+            f"- Budget disponible: {investment_budget or 'Non spécifié'} FCFA\n"
+            f"- Opportunités identifiées: {_fmt_compact(opportunities)}"
+        )
+        response = await _generate(prompt, tool_context)
+        analysis = response.text
+    
+    
+    # Scores précalculés à l'import (catalogue statique): simple lookup ici,
+    # appliqué après le filtre budgétaire
+    scored_opportunities = [
+        {
+            "name": item,
+            "sector": sector,
+            "score": _OPPORTUNITY_SCORES[(sector, item)],
+            "data": data
+        }
+        for sector, items in opportunities.items()
+        for item, data in items.items()
+    ]
     
-    response = model.generate_content(prompt)
-    
-    # Calcul du score d'opportunité
-    scored_opportunities = []
-    for sector, items in opportunities.items():
-        for item, data in items.items():
-            roi_score = int(data["roi_estimé"].split("-")[0].replace("%", ""))
-            potentiel_score = {"très élevé": 5, "élevé": 4, "modéré": 3, "faible": 2}.get(data["potentiel"], 3)
-            
-            total_score = roi_score / 20 + potentiel_score
-            scored_opportunities.append({
-                "name": item,
-                "sector": sector,
-                "score": total_score,
-                "data": data
-            })
-    
-    # Tri par score décroissant
-    scored_opportunities.sort(key=lambda x: x["score"], reverse=True)
+    # Sélection des meilleures sans tri complet: O(N log 5)
+    top_opportunities = heapq.nlargest(5, scored_opportunities, key=itemgetter("score"))
     
     return {
         "region": region,
         "investment_budget": investment_budget,
         "opportunities": opportunities,
-        "top_opportunities": scored_opportunities[:5],
-        "market_analysis": response.text,
+        "top_opportunities": top_opportunities,
+        "market_analysis": analysis,
         "analysis_date": datetime.now().strftime("%Y-%m-%d")
-    }
\ No newline at end of file
+    }
+
+
+_FULL_ANALYSIS_PREFIX = """Expert en économie agricole camerounaise, fournis une analyse complète (prix, rentabilité, tendances, stratégie de vente, coûts) incluant:
+1. Synthèse de la situation économique de la culture
+2. Rentabilité attendue et points d'amélioration
+3. Stratégie de vente recommandée et timing
+4. Risques et opportunités du marché
+5. Recommandations concrètes priorisées
+"""
+
+
+async def analyze_crop_full(
+    crop: str,
+    area_hectares: float,
+    quantity_kg: float,
+    tool_context: ToolContext,
+    production_system: str = "traditionnel",
+    region: Optional[str] = None,
+    urgency: str = "normal",
+    input_level: str = "standard",
+) -> Dict[str, Any]:
+    """Analyse économique complète d'une culture en un seul appel.
+
+    Regroupe prix, rentabilité, tendances, stratégie de vente et coûts de
+    production: les volets numériques s'exécutent en parallèle sans leurs
+    narrations individuelles, puis une unique narration Gemini couvre
+    l'ensemble — un aller-retour LLM au lieu de cinq. À préférer quand la
+    question de l'utilisateur couvre plusieurs facettes économiques.
+
+    Args:
+        crop: Type de culture
+        area_hectares: Superficie en hectares
+        quantity_kg: Quantité à vendre en kg
+        production_system: Système de production (traditionnel, amélioré, intensif)
+        region: Région (optionnel)
+        urgency: Urgence de vente (urgent, normal, patient)
+        input_level: Niveau d'intrants (minimal, standard, intensif)
+        tool_context: Contexte de l'outil
+
+    Returns:
+        Volets numériques combinés et analyse globale
+    """
+    prices, profitability, trends, strategy, costs = await asyncio.gather(
+        get_market_prices(
+            crop, tool_context, region=region, include_analysis=False
+        ),
+        analyze_profitability(
+            crop, area_hectares, tool_context, production_system,
+            include_analysis=False,
+        ),
+        get_market_trends(tool_context, crop, include_analysis=False),
+        recommend_sales_strategy(
+            crop, quantity_kg, tool_context, urgency, include_analysis=False
+        ),
+        calculate_production_costs(
+            crop, area_hectares, tool_context, input_level,
+            include_analysis=False,
+        ),
+    )
+    
+    prompt = _FULL_ANALYSIS_PREFIX + (
+        f"\nDonnées:\n"
+        f"- Culture: {crop}, {area_hectares} ha, système {production_system}\n"
+        f"- Prix actuel: {prices['current_price']} FCFA/kg ({prices['trend']})\n"
+        f"- Bénéfice net estimé: {profitability['revenue']['net']:,.0f} FCFA, "
+        f"ROI: {profitability['profitability']['roi_percent']:.1f}%\n"
+        f"- Tendance marché: {_fmt_compact(trends['trends_data'].get(crop))}\n"
+        f"- Meilleur canal de vente: {strategy['recommended_channel']} "
+        f"({strategy['estimated_best_revenue']:,.0f} FCFA net)\n"
+        f"- Coûts de production: {costs['totals']['total']:,.0f} FCFA"
+    )
+    response = await _generate(prompt, tool_context)
+    
+    return {
+        "crop": crop,
+        "market_prices": prices,
+        "profitability": profitability,
+        "market_trends": trends,
+        "sales_strategy": strategy,
+        "production_costs": costs,
+        "analysis": response.text,
+    }
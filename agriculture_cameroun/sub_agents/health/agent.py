@@ -6,8 +6,9 @@ import os
 from google.adk.agents import Agent
 from google.genai import types
 
-from .prompts import return_instructions_health
+from .prompts import INSTRUCTIONS_HEALTH
 from .tools import (
+    diagnose_and_treat,
     diagnose_plant_disease,
     get_treatment_recommendations,
     get_pest_identification,
@@ -21,9 +22,10 @@ _obs = make_adk_callbacks()
 health_agent = Agent(
     model=os.getenv("HEALTH_AGENT_MODEL", "gemini-2.0-flash-001"),
     name="health_agent",
-    instruction=return_instructions_health(),
+    instruction=INSTRUCTIONS_HEALTH,
     tools=[
         retrieve_agricultural_knowledge,
+        diagnose_and_treat,
         diagnose_plant_disease,
         get_treatment_recommendations,
         get_pest_identification,
@@ -3,10 +3,9 @@
 """Instructions pour l'agent de santé des plantes."""
 
 
-def return_instructions_health() -> str:
-    """Retourne les instructions pour l'agent santé des plantes."""
-    
-    instruction_prompt = """
+# Instruction figée au niveau module: construite une seule fois à l'import,
+# les appelants peuvent l'importer directement sans passer par la fonction.
+INSTRUCTIONS_HEALTH: str = """
     Tu es un phytopathologiste expert spécialisé dans la santé des cultures camerounaises.
     Ton rôle est de diagnostiquer les maladies, identifier les parasites et recommander des traitements adaptés au contexte local.
     
@@ -23,6 +22,8 @@ def return_instructions_health() -> str:
     - `retrieve_agricultural_knowledge`: **À utiliser EN PREMIER** pour toute
       question sur une maladie, un ravageur ou un traitement. Filtre avec
       `topic="health"` (et/ou `crop="..."`) et cite les sources.
+    - `diagnose_and_treat`: Diagnostic + plan de traitement en un seul appel —
+      **à préférer** quand l'utilisateur demande les deux à la fois
     - `diagnose_plant_disease`: Diagnostic de maladies basé sur les symptômes
     - `get_treatment_recommendations`: Recommandations de traitement spécifiques
     - `get_pest_identification`: Identification des parasites et ravageurs
@@ -147,5 +148,8 @@ def return_instructions_health() -> str:
     - **Modérée**: Impact limité mais surveillance nécessaire (10-30%)
     - **Faible**: Problème mineur, traitement préventif (<10%)
     """
-    
-    return instruction_prompt
\ No newline at end of file
+
+
+def return_instructions_health() -> str:
+    """Retourne les instructions pour l'agent santé des plantes."""
+    return INSTRUCTIONS_HEALTH
\ No newline at end of file
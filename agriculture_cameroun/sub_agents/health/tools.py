@@ -2,166 +2,587 @@
 
 """Outils pour l'agent de santé des plantes."""
 
-import os
-import random
+import json
+from dataclasses import dataclass, field
+from operator import itemgetter
 from typing import Dict, List, Any, Optional
-import google.generativeai as genai
+
+import numpy as np
 from google.adk.tools import ToolContext
-from typing import Optional
+from ...utils.batch import BatchGeminiClient, batch_mode_enabled
+from ...utils.cache import CachedResponse, GeminiResponseCache
 from ...utils.data import COMMON_DISEASES
+from ...utils.genai_client import get_model, get_semaphore
+
+# Client Gemini partagé (voir utils/genai_client.py): configuration unique
+# par processus et connexion réutilisée entre sous-agents.
+model = get_model('gemini-2.0-flash-001')
+
+# Palier léger pour les narrations à faible enjeu (plans de traitement et de
+# prévention, qui reformulent des données déjà calculées localement): latence
+# et coût par appel nettement moindres. Le diagnostic reste sur flash.
+model_lite = get_model('gemini-2.0-flash-lite')
+
+# Micro-batching des prompts pour les diagnostics en masse (campagnes de
+# suivi multi-parcelles) — même mécanique que crops, voir utils/batch.py.
+_batch_client = BatchGeminiClient(model) if batch_mode_enabled() else None
+
+# Cache disque des réponses: mêmes symptômes + même culture reviennent souvent
+# dans une région et une saison données, et la réponse agronomique est stable.
+_cache = GeminiResponseCache("health")
+
+# Les réponses phytosanitaires restent valables à l'échelle d'une saison;
+# sept jours laissent les entrées se rafraîchir sans repayer chaque appel.
+_CACHE_MAX_AGE_SECONDS = 7 * 86400
+
+# Sortie bornée par défaut: le temps de génération est linéaire au nombre de
+# tokens produits, et les prompts demandent 6-8 points courts — 512 tokens
+# suffisent et coupent la latence de queue des réponses qui divaguent.
+_GENERATION_CONFIG = {"max_output_tokens": 512, "temperature": 0.2}
+
+
+async def _generate(
+    prompt: str,
+    tool_context: ToolContext,
+    cache_key: Optional[tuple] = None,
+    generation_config: Optional[Dict[str, Any]] = None,
+    llm: Optional[Any] = None,
+):
+    """Envoie un prompt à Gemini, avec cache disque et mode groupé optionnels."""
+    llm = llm if llm is not None else model
+    if cache_key is not None and not tool_context.state.get("force_refresh"):
+        cached = _cache.get(*cache_key, max_age_seconds=_CACHE_MAX_AGE_SECONDS)
+        if cached is not None:
+            return CachedResponse(cached)
+
+    if (
+        _batch_client is not None
+        and tool_context.state.get("batch_mode")
+        and generation_config is None
+    ):
+        response = await _batch_client.generate(prompt)
+    elif tool_context.state.get("streaming") and generation_config is None:
+        # Mode streaming: les chunks sont publiés au fil de l'eau dans l'état
+        # de session, ce qui réduit le temps-avant-premier-octet perçu sans
+        # changer la valeur de retour de l'outil.
+        async with get_semaphore():
+            stream = await llm.generate_content_async(
+                prompt, generation_config=_GENERATION_CONFIG, stream=True
+            )
+            parts: List[str] = []
+            async for chunk in stream:
+                parts.append(chunk.text)
+                tool_context.state["partial_response"] = "".join(parts)
+            response = CachedResponse("".join(parts), from_cache=False)
+    else:
+        async with get_semaphore():
+            response = await llm.generate_content_async(
+                prompt, generation_config=generation_config or _GENERATION_CONFIG
+            )
+
+    if cache_key is not None:
+        _cache.set(response.text, *cache_key)
+    return response
+
+
+# Bases de données statiques construites une fois à l'import: chaque appel
+# d'outil les référence au lieu de reconstruire ~100 littéraux dict/list.
+# Entrées figées en dataclasses à __slots__: moins de mémoire que des dicts,
+# accès attribut plus rapide qu'une indexation, et les ensembles de tokens du
+# scoring sont dérivés une seule fois à la construction.
+def _tokens(phrases) -> frozenset:
+    """Ensemble des tokens minuscules d'une liste de courtes phrases."""
+    return frozenset(tok for phrase in phrases for tok in phrase.lower().split())
+
+
+@dataclass(slots=True, frozen=True)
+class Disease:
+    """Fiche maladie statique avec ses ensembles de tokens précalculés."""
+
+    name: str
+    agent: str
+    symptoms: tuple
+    affected_parts: tuple
+    conditions: tuple
+    severity: str
+    treatments: tuple
+    symptom_tokens: frozenset = field(init=False)
+    part_tokens: frozenset = field(init=False)
+    condition_tokens: frozenset = field(init=False)
+
+    def __post_init__(self):
+        object.__setattr__(self, "symptom_tokens", _tokens(self.symptoms))
+        object.__setattr__(self, "part_tokens", _tokens(self.affected_parts))
+        object.__setattr__(self, "condition_tokens", _tokens(self.conditions))
+
+
+@dataclass(slots=True, frozen=True)
+class Pest:
+    """Fiche parasite statique avec ses ensembles de tokens précalculés."""
+
+    name: str
+    scientific_name: str
+    description: str
+    damage: tuple
+    location: tuple
+    lifecycle: str
+    peak_season: tuple
+    economic_impact: str
+    description_tokens: frozenset = field(init=False)
+    damage_tokens: frozenset = field(init=False)
+    location_tokens: frozenset = field(init=False)
+
+    def __post_init__(self):
+        object.__setattr__(self, "description_tokens", frozenset(self.description.lower().split()))
+        object.__setattr__(self, "damage_tokens", _tokens(self.damage))
+        object.__setattr__(self, "location_tokens", _tokens(self.location))
+
+
+# Base de données des maladies étendues
+_DISEASE_DB = {
+    "cacao": (
+        Disease(
+            name="Pourriture brune",
+            agent="Phytophthora palmivora",
+            symptoms=("taches brunes", "pourriture fruits", "brunissement cabosses", "exsudat"),
+            affected_parts=("fruits", "cabosses", "branches"),
+            conditions=("humidité élevée", "température 25-30°C", "blessures"),
+            severity="élevée",
+            treatments=("fongicides cupriques", "taille sanitaire", "amélioration drainage"),
+        ),
+        Disease(
+            name="Mirides",
+            agent="Sahlbergella singularis",
+            symptoms=("taches noires", "dessèchement branches", "écoulement sève", "chancres"),
+            affected_parts=("branches", "tronc", "rameaux"),
+            conditions=("saison sèche", "stress hydrique", "mauvais entretien"),
+            severity="très élevée",
+            treatments=("insecticides", "taille parties atteintes", "amélioration ombrage"),
+        ),
+        Disease(
+            name="Chancre du cacaoyer",
+            agent="Phytophthora megakarya",
+            symptoms=("chancres bruns", "exsudat noir", "flétrissement", "défoliation"),
+            affected_parts=("tronc", "branches", "fruits"),
+            conditions=("blessures", "humidité", "mauvaise ventilation"),
+            severity="critique",
+            treatments=("fongicides systémiques", "curettage chancres", "mastication"),
+        ),
+    ),
+    "maïs": (
+        Disease(
+            name="Charbon du maïs",
+            agent="Ustilago maydis",
+            symptoms=("galles blanches", "galles noires", "déformation épis", "spores noires"),
+            affected_parts=("épis", "feuilles", "tiges"),
+            conditions=("humidité", "blessures", "variété sensible"),
+            severity="modérée",
+            treatments=("variétés résistantes", "rotation culturale", "élimination galles"),
+        ),
+        Disease(
+            name="Striure du maïs",
+            agent="Maize streak virus",
+            symptoms=("striures jaunes", "nanisme", "déformation feuilles", "rendement réduit"),
+            affected_parts=("feuilles", "plant entier"),
+            conditions=("cicadelles vectrices", "saison des pluies"),
+            severity="élevée",
+            treatments=("variétés résistantes", "lutte contre cicadelles", "dates plantation"),
+        ),
+    ),
+    "manioc": (
+        Disease(
+            name="Mosaïque du manioc",
+            agent="Cassava mosaic virus",
+            symptoms=("mosaïque feuilles", "jaunissement", "déformation", "nanisme"),
+            affected_parts=("feuilles", "plant entier"),
+            conditions=("boutures infectées", "aleurodes vectrices"),
+            severity="élevée",
+            treatments=("boutures saines", "lutte contre aleurodes", "variétés résistantes"),
+        ),
+    ),
+}
+
+
+# Traitements par type et budget
+_TREATMENT_OPTIONS = {
+    "biologique": {
+        "cost_level": "faible",
+        "products": [
+            {"name": "Trichoderma", "price_fcfa": 5000, "dose": "5g/L", "efficacy": 70},
+            {"name": "Bacillus thuringiensis", "price_fcfa": 8000, "dose": "2g/L", "efficacy": 65},
+            {"name": "Extrait de neem", "price_fcfa": 3000, "dose": "10ml/L", "efficacy": 60},
+            {"name": "Savon noir", "price_fcfa": 1000, "dose": "20g/L", "efficacy": 50}
+        ]
+    },
+    "traditionnel": {
+        "cost_level": "très faible",
+        "products": [
+            {"name": "Cendre de bois", "price_fcfa": 500, "dose": "100g/L", "efficacy": 45},
+            {"name": "Extrait ail-piment", "price_fcfa": 800, "dose": "50ml/L", "efficacy": 55},
+            {"name": "Urine fermentée", "price_fcfa": 0, "dose": "1:10", "efficacy": 40},
+            {"name": "Infusion feuilles papayer", "price_fcfa": 200, "dose": "100g/L", "efficacy": 35}
+        ]
+    },
+    "chimique": {
+        "cost_level": "élevé",
+        "products": [
+            {"name": "Mancozèbe", "price_fcfa": 15000, "dose": "2.5g/L", "efficacy": 85},
+            {"name": "Lambda-cyhalothrine", "price_fcfa": 12000, "dose": "1ml/L", "efficacy": 90},
+            {"name": "Oxychlorure de cuivre", "price_fcfa": 8000, "dose": "3g/L", "efficacy": 80},
+            {"name": "Profénofos", "price_fcfa": 18000, "dose": "2ml/L", "efficacy": 88}
+        ]
+    }
+}
+
+
+# Base de données des parasites
+_PEST_DB = {
+    "cacao": (
+        Pest(
+            name="Mirides",
+            scientific_name="Sahlbergella singularis",
+            description="Insecte brun-noir, 10-12mm, antennes longues",
+            damage=("taches noires branches", "dessèchement", "écoulement sève"),
+            location=("branches", "tronc", "rameaux"),
+            lifecycle="45-60 jours",
+            peak_season=("saison sèche",),
+            economic_impact="très élevé",
+        ),
+        Pest(
+            name="Punaises des cabosses",
+            scientific_name="Bathycoelia thalassina",
+            description="Punaise verte, 8-10mm, forme ovale",
+            damage=("piqûres cabosses", "déformation fruits", "coulure"),
+            location=("cabosses", "fruits"),
+            lifecycle="30-40 jours",
+            peak_season=("saison des pluies",),
+            economic_impact="élevé",
+        ),
+    ),
+    "maïs": (
+        Pest(
+            name="Foreur de tige",
+            scientific_name="Sesamia calamistis",
+            description="Chenille rosâtre, 25-40mm, tête brune",
+            damage=("trous dans tiges", "brisure plants", "flétrissement"),
+            location=("tiges", "épis"),
+            lifecycle="35-45 jours",
+            peak_season=("début saison pluies",),
+            economic_impact="élevé",
+        ),
+        Pest(
+            name="Légionnaire d'automne",
+            scientific_name="Spodoptera frugiperda",
+            description="Chenille gris-brun, 30-40mm, rayures longitudinales",
+            damage=("défoliation", "consommation grains", "trous feuilles"),
+            location=("feuilles", "épis", "grains"),
+            lifecycle="30-35 jours",
+            peak_season=("toute l'année",),
+            economic_impact="très élevé",
+        ),
+    ),
+    "manioc": (
+        Pest(
+            name="Cochenille farineuse",
+            scientific_name="Phenacoccus manihoti",
+            description="Insecte blanc farineux, 2-4mm, colonies denses",
+            damage=("jaunissement feuilles", "déformation", "fumagine"),
+            location=("feuilles", "tiges", "bourgeons"),
+            lifecycle="20-30 jours",
+            peak_season=("saison sèche",),
+            economic_impact="élevé",
+        ),
+    ),
+}
+
+
+# Stratégies préventives par catégorie
+_PREVENTION_STRATEGIES = {
+    "culturales": [
+        {"strategy": "Rotation des cultures", "cost": 0, "efficacy": 70, "description": "Briser le cycle des parasites"},
+        {"strategy": "Densité optimale", "cost": 5000, "efficacy": 60, "description": "Réduire humidité et compétition"},
+        {"strategy": "Associations culturales", "cost": 2000, "efficacy": 65, "description": "Plantes répulsives ou attractives"},
+        {"strategy": "Dates de semis", "cost": 0, "efficacy": 55, "description": "Éviter les pics d'infestation"}
+    ],
+    "biologiques": [
+        {"strategy": "Auxiliaires naturels", "cost": 10000, "efficacy": 75, "description": "Prédateurs et parasitoïdes"},
+        {"strategy": "Plantes pièges", "cost": 3000, "efficacy": 60, "description": "Concentrer les parasites"},
+        {"strategy": "Biodiversité fonctionnelle", "cost": 5000, "efficacy": 70, "description": "Haies, bandes fleuries"},
+        {"strategy": "Micro-organismes bénéfiques", "cost": 8000, "efficacy": 65, "description": "Mycorhizes, rhizobactéries"}
+    ],
+    "physiques": [
+        {"strategy": "Paillage", "cost": 15000, "efficacy": 50, "description": "Limiter mauvaises herbes et maladies sol"},
+        {"strategy": "Filets anti-insectes", "cost": 25000, "efficacy": 85, "description": "Barrière physique"},
+        {"strategy": "Pièges colorés", "cost": 8000, "efficacy": 60, "description": "Capture des adultes volants"},
+        {"strategy": "Barrières végétales", "cost": 12000, "efficacy": 55, "description": "Haies répulsives"}
+    ],
+    "sanitaires": [
+        {"strategy": "Assainissement", "cost": 2000, "efficacy": 80, "description": "Élimination résidus infectés"},
+        {"strategy": "Désinfection outils", "cost": 1000, "efficacy": 70, "description": "Éviter propagation"},
+        {"strategy": "Quarantaine nouvelles plants", "cost": 500, "efficacy": 90, "description": "Contrôle introduction"},
+        {"strategy": "Surveillance régulière", "cost": 3000, "efficacy": 85, "description": "Détection précoce"}
+    ],
+    "nutritionnelles": [
+        {"strategy": "Équilibre NPK", "cost": 20000, "efficacy": 65, "description": "Plantes plus résistantes"},
+        {"strategy": "Amendements organiques", "cost": 15000, "efficacy": 70, "description": "Amélioration sol et résistance"},
+        {"strategy": "Oligoéléments", "cost": 8000, "efficacy": 60, "description": "Stimulation défenses naturelles"},
+        {"strategy": "Compost de qualité", "cost": 10000, "efficacy": 68, "description": "Nutrition équilibrée"}
+    ]
+}
+
+
+# Classements précalculés à l'import: les tables sont statiques, le tri
+# N·log(N) refait à chaque appel devient une simple tranche.
+_PRODUCTS_BY_EFFICACY = {
+    category: tuple(sorted(options["products"], key=itemgetter("efficacy"), reverse=True))
+    for category, options in _TREATMENT_OPTIONS.items()
+}
+_STRATEGIES_BY_EFFICACY = {
+    category: tuple(sorted(strategies, key=itemgetter("efficacy"), reverse=True))
+    for category, strategies in _PREVENTION_STRATEGIES.items()
+}
+
+
+def _build_match_index(db: Dict[str, tuple], fields: tuple):
+    """Encode une base en matrices 0/1 (entrées × vocabulaire) par critère.
+
+    Retourne par culture `(vocab, {champ: (matrice, comptes_par_ligne)})`:
+    le scoring d'un appel devient un produit matrice-vecteur NumPy au lieu
+    d'une boucle Python par (entrée × critère).
+    """
+    index = {}
+    for crop_name, entries in db.items():
+        vocab: Dict[str, int] = {}
+        for entry in entries:
+            for field_name in fields:
+                for token in getattr(entry, f"{field_name}_tokens"):
+                    vocab.setdefault(token, len(vocab))
+        matrices = {}
+        for field_name in fields:
+            matrix = np.zeros((len(entries), len(vocab)), dtype=np.float32)
+            for row, entry in enumerate(entries):
+                for token in getattr(entry, f"{field_name}_tokens"):
+                    matrix[row, vocab[token]] = 1.0
+            matrices[field_name] = (matrix, matrix.sum(axis=1))
+        index[crop_name] = (vocab, matrices)
+    return index
+
+
+_DISEASE_INDEX = _build_match_index(_DISEASE_DB, ("symptom", "part", "condition"))
+_PEST_INDEX = _build_match_index(_PEST_DB, ("description", "damage", "location"))
+
+
+def _encode_tokens(tokens, vocab: Dict[str, int]) -> np.ndarray:
+    """Vecteur 0/1 des tokens de l'utilisateur dans le vocabulaire du crop."""
+    vector = np.zeros(len(vocab), dtype=np.float32)
+    for token in tokens:
+        position = vocab.get(token)
+        if position is not None:
+            vector[position] = 1.0
+    return vector
+
+
+def _normalize_terms(values: Optional[List[str]]) -> List[str]:
+    """Nettoie, met en minuscules et déduplique en conservant l'ordre.
+
+    Les appelants passent parfois doublons ou chaînes vides, ce qui gonfle le
+    prompt et fausse le comptage de correspondances du scoring.
+    """
+    if not values:
+        return []
+    return list(dict.fromkeys(v.strip().lower() for v in values if v and v.strip()))
+
+
+def _fmt_compact(obj: Any) -> str:
+    """Sérialisation JSON compacte pour l'interpolation dans les prompts."""
+    return json.dumps(obj, ensure_ascii=False, separators=(",", ":"), default=str)
+
+
+# Prompts restructurés en préfixe statique (candidat au cache de prompt côté
+# Gemini) + court suffixe dynamique: seuls quelques tokens changent par appel.
+_DIAGNOSIS_PREFIX = """Diagnostic phytosanitaire au Cameroun.
+
+Fournis un diagnostic détaillé incluant:
+1. Diagnostic le plus probable avec justification
+2. Diagnostics différentiels à considérer
+3. Examens complémentaires recommandés
+4. Urgence d'intervention
+5. Risques d'évolution si non traité
+6. Impact potentiel sur le rendement
+"""
+
+_TREATMENT_PREFIX = """Plan de traitement phytosanitaire au Cameroun.
+
+Élabore un plan détaillé incluant:
+1. Stratégie de traitement prioritaire
+2. Protocole d'application précis
+3. Calendrier d'intervention
+4. Mesures d'accompagnement (cultural, préventif)
+5. Évaluation de l'efficacité
+6. Plan B en cas d'échec
+7. Coût total estimé
+8. Précautions d'usage et sécurité
+"""
+
+_PREVENTION_PREFIX = """Stratégies de prévention phytosanitaire au Cameroun.
+
+Élabore un plan préventif incluant:
+1. Priorités d'action selon les menaces
+2. Calendrier de mise en œuvre
+3. Combinaisons synergiques de stratégies
+4. Adaptations selon les conditions locales
+5. Indicateurs de suivi et évaluation
+6. Plan d'urgence si prévention insuffisante
+7. Formation nécessaire pour l'agriculteur
+"""
 
-# Configuration de l'API Gemini
-genai.configure(api_key=os.getenv("GEMINI_API_KEY"))
-model = genai.GenerativeModel('gemini-2.0-flash-001')
 
+# Seuil (en %) sous lequel le signal local est du bruit: on épargne
+# l'aller-retour LLM et on demande plus d'observations à la place.
+_MIN_CONFIDENCE = 15
 
-def diagnose_plant_disease(
+_LOW_CONFIDENCE_DIAGNOSIS = (
+    "Les symptômes fournis ne correspondent à aucune maladie connue avec une "
+    "confiance suffisante. Précisez davantage de symptômes, les parties de la "
+    "plante affectées et les conditions environnementales pour affiner le diagnostic."
+)
+
+_LOW_CONFIDENCE_PEST = (
+    "La description fournie ne correspond à aucun parasite connu avec une "
+    "confiance suffisante. Précisez l'aspect de l'insecte, le type de dégâts "
+    "et leur localisation sur la plante pour affiner l'identification."
+)
+
+
+_PEST_IDENTIFICATION_PREFIX = """Identification de parasite au Cameroun.
+
+Fournis une analyse détaillée incluant:
+1. Identification la plus probable avec justification
+2. Stade de développement probable
+3. Niveau d'infestation estimé
+4. Urgence d'intervention
+5. Méthodes de confirmation d'identification
+6. Prédiction évolution sans traitement
+"""
+
+
+def _score_diseases(
     crop: str,
     symptoms: List[str],
-    tool_context: ToolContext,
     affected_parts: Optional[List[str]] = None,
     environmental_conditions: Optional[str] = None,
-) -> Dict[str, Any]:
-    """Diagnostique une maladie des plantes basée sur les symptômes.
-    
-    Args:
-        crop: Type de culture affectée
-        symptoms: Liste des symptômes observés
-        affected_parts: Parties de la plante affectées (optionnel)
-        environmental_conditions: Conditions environnementales (optionnel)
-        tool_context: Contexte de l'outil
-        
-    Returns:
-        Diagnostic détaillé avec probabilités
-    """
-    # Base de données des maladies étendues
-    disease_database = {
-        "cacao": [
-            {
-                "name": "Pourriture brune",
-                "agent": "Phytophthora palmivora",
-                "symptoms": ["taches brunes", "pourriture fruits", "brunissement cabosses", "exsudat"],
-                "affected_parts": ["fruits", "cabosses", "branches"],
-                "conditions": ["humidité élevée", "température 25-30°C", "blessures"],
-                "severity": "élevée",
-                "treatments": ["fongicides cupriques", "taille sanitaire", "amélioration drainage"]
-            },
-            {
-                "name": "Mirides",
-                "agent": "Sahlbergella singularis",
-                "symptoms": ["taches noires", "dessèchement branches", "écoulement sève", "chancres"],
-                "affected_parts": ["branches", "tronc", "rameaux"],
-                "conditions": ["saison sèche", "stress hydrique", "mauvais entretien"],
-                "severity": "très élevée",
-                "treatments": ["insecticides", "taille parties atteintes", "amélioration ombrage"]
-            },
-            {
-                "name": "Chancre du cacaoyer",
-                "agent": "Phytophthora megakarya",
-                "symptoms": ["chancres bruns", "exsudat noir", "flétrissement", "défoliation"],
-                "affected_parts": ["tronc", "branches", "fruits"],
-                "conditions": ["blessures", "humidité", "mauvaise ventilation"],
-                "severity": "critique",
-                "treatments": ["fongicides systémiques", "curettage chancres", "mastication"]
-            }
-        ],
-        "maïs": [
-            {
-                "name": "Charbon du maïs",
-                "agent": "Ustilago maydis",
-                "symptoms": ["galles blanches", "galles noires", "déformation épis", "spores noires"],
-                "affected_parts": ["épis", "feuilles", "tiges"],
-                "conditions": ["humidité", "blessures", "variété sensible"],
-                "severity": "modérée",
-                "treatments": ["variétés résistantes", "rotation culturale", "élimination galles"]
-            },
-            {
-                "name": "Striure du maïs",
-                "agent": "Maize streak virus",
-                "symptoms": ["striures jaunes", "nanisme", "déformation feuilles", "rendement réduit"],
-                "affected_parts": ["feuilles", "plant entier"],
-                "conditions": ["cicadelles vectrices", "saison des pluies"],
-                "severity": "élevée",
-                "treatments": ["variétés résistantes", "lutte contre cicadelles", "dates plantation"]
-            }
-        ],
-        "manioc": [
-            {
-                "name": "Mosaïque du manioc",
-                "agent": "Cassava mosaic virus",
-                "symptoms": ["mosaïque feuilles", "jaunissement", "déformation", "nanisme"],
-                "affected_parts": ["feuilles", "plant entier"],
-                "conditions": ["boutures infectées", "aleurodes vectrices"],
-                "severity": "élevée",
-                "treatments": ["boutures saines", "lutte contre aleurodes", "variétés résistantes"]
-            }
-        ]
-    }
-    
-    # Calcul des scores de correspondance
-    crop_diseases = disease_database.get(crop, [])
+) -> List[Dict[str, Any]]:
+    """Score local des maladies candidates, trié par probabilité décroissante."""
+    crop_diseases = _DISEASE_DB.get(crop, ())
     disease_scores = []
     
-    for disease in crop_diseases:
-        score = 0
+    symptom_tokens = _tokens(symptoms)
+    part_tokens = _tokens(affected_parts) if affected_parts else frozenset()
+    condition_tokens = (
+        frozenset(environmental_conditions.lower().split())
+        if environmental_conditions
+        else frozenset()
+    )
+    
+    # Scores de tous les diagnostics en un passage vectorisé par critère
+    probabilities = np.zeros(len(crop_diseases))
+    if crop_diseases:
+        vocab, matrices = _DISEASE_INDEX[crop]
+        scores = np.zeros(len(crop_diseases), dtype=np.float32)
         total_criteria = 0
-        
-        # Score basé sur les symptômes
         if symptoms:
-            symptom_matches = sum(1 for symptom in symptoms 
-                                if any(s in symptom.lower() for s in disease["symptoms"]))
-            score += (symptom_matches / len(disease["symptoms"])) * 40
+            matrix, row_counts = matrices["symptom"]
+            scores += matrix @ _encode_tokens(symptom_tokens, vocab) / row_counts * 40
             total_criteria += 40
-        
-        # Score basé sur les parties affectées
         if affected_parts:
-            part_matches = sum(1 for part in affected_parts 
-                             if part.lower() in disease["affected_parts"])
-            score += (part_matches / len(disease["affected_parts"])) * 30
+            matrix, row_counts = matrices["part"]
+            scores += matrix @ _encode_tokens(part_tokens, vocab) / row_counts * 30
             total_criteria += 30
-        
-        # Score basé sur les conditions
         if environmental_conditions:
-            condition_matches = sum(1 for condition in disease["conditions"]
-                                  if condition.lower() in environmental_conditions.lower())
-            score += (condition_matches / len(disease["conditions"])) * 30
+            matrix, row_counts = matrices["condition"]
+            scores += matrix @ _encode_tokens(condition_tokens, vocab) / row_counts * 30
             total_criteria += 30
-        
-        # Calcul du pourcentage de probabilité
-        probability = (score / total_criteria * 100) if total_criteria > 0 else 0
-        
+        if total_criteria > 0:
+            probabilities = scores / total_criteria * 100
+    
+    for disease, probability in zip(crop_diseases, probabilities):
         disease_scores.append({
-            "disease": disease["name"],
-            "agent": disease["agent"],
-            "probability": probability,
-            "severity": disease["severity"],
-            "treatments": disease["treatments"],
-            "matching_symptoms": [s for s in symptoms if any(ds in s.lower() for ds in disease["symptoms"])]
+            "disease": disease.name,
+            "agent": disease.agent,
+            "probability": float(probability),
+            "severity": disease.severity,
+            "treatments": list(disease.treatments),
+            "matching_symptoms": [
+                s for s in symptoms if set(s.lower().split()) & disease.symptom_tokens
+            ],
         })
     
     # Tri par probabilité décroissante
     disease_scores.sort(key=lambda x: x["probability"], reverse=True)
+    return disease_scores
+
+
+async def diagnose_plant_disease(
+    crop: str,
+    symptoms: List[str],
+    tool_context: ToolContext,
+    affected_parts: Optional[List[str]] = None,
+    environmental_conditions: Optional[str] = None,
+) -> Dict[str, Any]:
+    """Diagnostique une maladie des plantes basée sur les symptômes.
     
-    # Utiliser Gemini pour l'analyse
-    prompt = f"""
-    Diagnostic phytosanitaire pour {crop} au Cameroun:
-    
-    Symptômes observés: {', '.join(symptoms)}
-    Parties affectées: {', '.join(affected_parts) if affected_parts else 'Non spécifié'}
-    Conditions: {environmental_conditions or 'Non spécifiées'}
-    
-    Analyses possibles: {disease_scores[:3]}
-    
-    Fournis un diagnostic détaillé incluant:
-    1. Diagnostic le plus probable avec justification
-    2. Diagnostics différentiels à considérer
-    3. Examens complémentaires recommandés
-    4. Urgence d'intervention
-    5. Risques d'évolution si non traité
-    6. Impact potentiel sur le rendement
+    Args:
+        crop: Type de culture affectée
+        symptoms: Liste des symptômes observés
+        affected_parts: Parties de la plante affectées (optionnel)
+        environmental_conditions: Conditions environnementales (optionnel)
+        tool_context: Contexte de l'outil
+        
+    Returns:
+        Diagnostic détaillé avec probabilités
     """
+    symptoms = _normalize_terms(symptoms)
+    affected_parts = _normalize_terms(affected_parts) or None
+    disease_scores = _score_diseases(crop, symptoms, affected_parts, environmental_conditions)
+    
+    # Court-circuit sans LLM quand le signal local est insuffisant
+    if not disease_scores or disease_scores[0]["probability"] < _MIN_CONFIDENCE:
+        return {
+            "crop": crop,
+            "symptoms": symptoms,
+            "affected_parts": affected_parts,
+            "environmental_conditions": environmental_conditions,
+            "diagnostic_results": disease_scores,
+            "most_likely_diagnosis": None,
+            "diagnostic_analysis": _LOW_CONFIDENCE_DIAGNOSIS,
+            "confidence_level": disease_scores[0]["probability"] if disease_scores else 0,
+        }
     
-    response = model.generate_content(prompt)
+    # Utiliser Gemini pour l'analyse (top 3 compacté: le repr Python complet
+    # des scores gonflait le prompt de tokens inutiles)
+    top_candidates = _fmt_compact([
+        {k: score[k] for k in ("disease", "agent", "probability", "severity")}
+        for score in disease_scores[:3]
+    ])
+    prompt = _DIAGNOSIS_PREFIX + (
+        f"\n- Culture: {crop}"
+        f"\n- Symptômes observés: {', '.join(symptoms)}"
+        f"\n- Parties affectées: {', '.join(affected_parts) if affected_parts else 'Non spécifié'}"
+        f"\n- Conditions: {environmental_conditions or 'Non spécifiées'}"
+        f"\n- Analyses possibles: {top_candidates}"
+    )
+    
+    response = await _generate(
+        prompt,
+        tool_context,
+        cache_key=(
+            "diagnose",
+            crop,
+            tuple(symptoms),
+            tuple(affected_parts or ()),
+            environmental_conditions,
+        ),
+    )
     
     return {
         "crop": crop,
@@ -175,7 +596,31 @@ def diagnose_plant_disease(
     }
 
 
-def get_treatment_recommendations(
+def _select_treatment_plan(severity: str, budget_constraints: str) -> List[Dict[str, Any]]:
+    """Sélectionne les meilleurs produits selon budget et gravité."""
+    # Sélection selon les contraintes budgétaires
+    if budget_constraints == "limité":
+        recommended_categories = ["traditionnel", "biologique"]
+    elif budget_constraints == "modéré":
+        recommended_categories = ["biologique", "chimique"]
+    else:
+        recommended_categories = ["chimique", "biologique"]
+    
+    # Sélection selon la gravité
+    if severity == "critique":
+        recommended_categories = ["chimique"] + recommended_categories
+    elif severity == "faible":
+        recommended_categories = ["traditionnel", "biologique"]
+    
+    # Création du plan de traitement
+    treatment_plan = []
+    for category in recommended_categories[:2]:  # Limiter à 2 catégories
+        if category in _PRODUCTS_BY_EFFICACY:
+            treatment_plan.extend(_PRODUCTS_BY_EFFICACY[category][:2])
+    return treatment_plan
+
+
+async def get_treatment_recommendations(
     diagnosis: str,
     crop: str,
     tool_context: ToolContext,
@@ -194,58 +639,7 @@ def get_treatment_recommendations(
     Returns:
         Plan de traitement détaillé
     """
-    # Traitements par type et budget
-    treatment_options = {
-        "biologique": {
-            "cost_level": "faible",
-            "products": [
-                {"name": "Trichoderma", "price_fcfa": 5000, "dose": "5g/L", "efficacy": 70},
-                {"name": "Bacillus thuringiensis", "price_fcfa": 8000, "dose": "2g/L", "efficacy": 65},
-                {"name": "Extrait de neem", "price_fcfa": 3000, "dose": "10ml/L", "efficacy": 60},
-                {"name": "Savon noir", "price_fcfa": 1000, "dose": "20g/L", "efficacy": 50}
-            ]
-        },
-        "traditionnel": {
-            "cost_level": "très faible",
-            "products": [
-                {"name": "Cendre de bois", "price_fcfa": 500, "dose": "100g/L", "efficacy": 45},
-                {"name": "Extrait ail-piment", "price_fcfa": 800, "dose": "50ml/L", "efficacy": 55},
-                {"name": "Urine fermentée", "price_fcfa": 0, "dose": "1:10", "efficacy": 40},
-                {"name": "Infusion feuilles papayer", "price_fcfa": 200, "dose": "100g/L", "efficacy": 35}
-            ]
-        },
-        "chimique": {
-            "cost_level": "élevé",
-            "products": [
-                {"name": "Mancozèbe", "price_fcfa": 15000, "dose": "2.5g/L", "efficacy": 85},
-                {"name": "Lambda-cyhalothrine", "price_fcfa": 12000, "dose": "1ml/L", "efficacy": 90},
-                {"name": "Oxychlorure de cuivre", "price_fcfa": 8000, "dose": "3g/L", "efficacy": 80},
-                {"name": "Profénofos", "price_fcfa": 18000, "dose": "2ml/L", "efficacy": 88}
-            ]
-        }
-    }
-    
-    # Sélection selon les contraintes budgétaires
-    if budget_constraints == "limité":
-        recommended_categories = ["traditionnel", "biologique"]
-    elif budget_constraints == "modéré":
-        recommended_categories = ["biologique", "chimique"]
-    else:
-        recommended_categories = ["chimique", "biologique"]
-    
-    # Sélection selon la gravité
-    if severity == "critique":
-        recommended_categories = ["chimique"] + recommended_categories
-    elif severity == "faible":
-        recommended_categories = ["traditionnel", "biologique"]
-    
-    # Création du plan de traitement
-    treatment_plan = []
-    for category in recommended_categories[:2]:  # Limiter à 2 catégories
-        if category in treatment_options:
-            best_products = sorted(treatment_options[category]["products"], 
-                                 key=lambda x: x["efficacy"], reverse=True)[:2]
-            treatment_plan.extend(best_products)
+    treatment_plan = _select_treatment_plan(severity, budget_constraints)
     
     # Calendrier de traitement
     treatment_schedule = {
@@ -255,27 +649,30 @@ def get_treatment_recommendations(
         "21_jours": ["Bilan traitement", "Mesures préventives"]
     }
     
-    # Utiliser Gemini pour les recommandations
-    prompt = f"""
-    Plan de traitement pour {diagnosis} sur {crop} au Cameroun:
-    
-    Gravité: {severity}
-    Budget: {budget_constraints}
-    Produits recommandés: {treatment_plan}
-    Calendrier: {treatment_schedule}
-    
-    Élabore un plan détaillé incluant:
-    1. Stratégie de traitement prioritaire
-    2. Protocole d'application précis
-    3. Calendrier d'intervention
-    4. Mesures d'accompagnement (cultural, préventif)
-    5. Évaluation de l'efficacité
-    6. Plan B en cas d'échec
-    7. Coût total estimé
-    8. Précautions d'usage et sécurité
-    """
-    
-    response = model.generate_content(prompt)
+    # Utiliser Gemini pour les recommandations: listes rendues en puces
+    # compactes plutôt qu'en repr Python verbeux (moins de tokens, plus lisible)
+    products_lines = "\n".join(
+        f"- {p['name']}: {p['dose']}, {p['price_fcfa']} FCFA, efficacité {p['efficacy']}%"
+        for p in treatment_plan
+    )
+    schedule_lines = "\n".join(
+        f"- {phase}: {', '.join(actions)}" for phase, actions in treatment_schedule.items()
+    )
+    prompt = _TREATMENT_PREFIX + (
+        f"\n- Diagnostic: {diagnosis}"
+        f"\n- Culture: {crop}"
+        f"\n- Gravité: {severity}"
+        f"\n- Budget: {budget_constraints}"
+        f"\nProduits recommandés:\n{products_lines}"
+        f"\nCalendrier:\n{schedule_lines}"
+    )
+    
+    response = await _generate(
+        prompt,
+        tool_context,
+        cache_key=("treatment", diagnosis, crop, severity, budget_constraints),
+        llm=model_lite,
+    )
     
     # Calcul du coût total
     total_cost = sum(product["price_fcfa"] for product in treatment_plan)
@@ -293,7 +690,7 @@ def get_treatment_recommendations(
     }
 
 
-def get_pest_identification(
+async def get_pest_identification(
     crop: str,
     pest_description: str,
     tool_context: ToolContext,
@@ -312,127 +709,75 @@ def get_pest_identification(
     Returns:
         Identification du parasite avec informations détaillées
     """
-    # Base de données des parasites
-    pest_database = {
-        "cacao": [
-            {
-                "name": "Mirides",
-                "scientific_name": "Sahlbergella singularis",
-                "description": "Insecte brun-noir, 10-12mm, antennes longues",
-                "damage": ["taches noires branches", "dessèchement", "écoulement sève"],
-                "location": ["branches", "tronc", "rameaux"],
-                "lifecycle": "45-60 jours",
-                "peak_season": ["saison sèche"],
-                "economic_impact": "très élevé"
-            },
-            {
-                "name": "Punaises des cabosses",
-                "scientific_name": "Bathycoelia thalassina",
-                "description": "Punaise verte, 8-10mm, forme ovale",
-                "damage": ["piqûres cabosses", "déformation fruits", "coulure"],
-                "location": ["cabosses", "fruits"],
-                "lifecycle": "30-40 jours",
-                "peak_season": ["saison des pluies"],
-                "economic_impact": "élevé"
-            }
-        ],
-        "maïs": [
-            {
-                "name": "Foreur de tige",
-                "scientific_name": "Sesamia calamistis",
-                "description": "Chenille rosâtre, 25-40mm, tête brune",
-                "damage": ["trous dans tiges", "brisure plants", "flétrissement"],
-                "location": ["tiges", "épis"],
-                "lifecycle": "35-45 jours",
-                "peak_season": ["début saison pluies"],
-                "economic_impact": "élevé"
-            },
-            {
-                "name": "Légionnaire d'automne",
-                "scientific_name": "Spodoptera frugiperda",
-                "description": "Chenille gris-brun, 30-40mm, rayures longitudinales",
-                "damage": ["défoliation", "consommation grains", "trous feuilles"],
-                "location": ["feuilles", "épis", "grains"],
-                "lifecycle": "30-35 jours",
-                "peak_season": ["toute l'année"],
-                "economic_impact": "très élevé"
-            }
-        ],
-        "manioc": [
-            {
-                "name": "Cochenille farineuse",
-                "scientific_name": "Phenacoccus manihoti",
-                "description": "Insecte blanc farineux, 2-4mm, colonies denses",
-                "damage": ["jaunissement feuilles", "déformation", "fumagine"],
-                "location": ["feuilles", "tiges", "bourgeons"],
-                "lifecycle": "20-30 jours",
-                "peak_season": ["saison sèche"],
-                "economic_impact": "élevé"
-            }
-        ]
-    }
-    
     # Identification par correspondance
-    crop_pests = pest_database.get(crop, [])
+    crop_pests = _PEST_DB.get(crop, ())
     identification_scores = []
     
-    for pest in crop_pests:
-        score = 0
-        
-        # Score basé sur la description
+    description_tokens = frozenset(pest_description.lower().split()) if pest_description else frozenset()
+    damage_tokens = frozenset(damage_type.lower().split()) if damage_type else frozenset()
+    location_tokens = frozenset(location_on_plant.lower().split()) if location_on_plant else frozenset()
+    
+    # Scores de tous les parasites candidats en un passage vectorisé
+    scores = np.zeros(len(crop_pests), dtype=np.float32)
+    if crop_pests:
+        vocab, matrices = _PEST_INDEX[crop]
         if pest_description:
-            desc_words = pest_description.lower().split()
-            pest_words = pest["description"].lower().split()
-            matches = sum(1 for word in desc_words if any(pw in word for pw in pest_words))
-            score += (matches / len(desc_words)) * 30
-        
-        # Score basé sur les dégâts
+            matrix, _ = matrices["description"]
+            scores += matrix @ _encode_tokens(description_tokens, vocab) / len(description_tokens) * 30
         if damage_type:
-            damage_matches = sum(1 for damage in pest["damage"]
-                               if damage.lower() in damage_type.lower())
-            score += (damage_matches / len(pest["damage"])) * 40
-        
-        # Score basé sur la localisation
+            matrix, row_counts = matrices["damage"]
+            scores += matrix @ _encode_tokens(damage_tokens, vocab) / row_counts * 40
         if location_on_plant:
-            location_matches = sum(1 for loc in pest["location"]
-                                 if loc.lower() in location_on_plant.lower())
-            score += (location_matches / len(pest["location"])) * 30
-        
+            matrix, row_counts = matrices["location"]
+            scores += matrix @ _encode_tokens(location_tokens, vocab) / row_counts * 30
+    
+    for pest, score in zip(crop_pests, scores):
         identification_scores.append({
-            "pest": pest["name"],
-            "scientific_name": pest["scientific_name"],
-            "probability": score,
-            "description": pest["description"],
-            "damage_patterns": pest["damage"],
-            "preferred_location": pest["location"],
-            "lifecycle": pest["lifecycle"],
-            "peak_season": pest["peak_season"],
-            "economic_impact": pest["economic_impact"]
+            "pest": pest.name,
+            "scientific_name": pest.scientific_name,
+            "probability": float(score),
+            "description": pest.description,
+            "damage_patterns": list(pest.damage),
+            "preferred_location": list(pest.location),
+            "lifecycle": pest.lifecycle,
+            "peak_season": list(pest.peak_season),
+            "economic_impact": pest.economic_impact
         })
     
     # Tri par probabilité
     identification_scores.sort(key=lambda x: x["probability"], reverse=True)
     
-    # Utiliser Gemini pour l'analyse
-    prompt = f"""
-    Identification de parasite sur {crop} au Cameroun:
-    
-    Description observée: {pest_description}
-    Type de dégâts: {damage_type or 'Non spécifié'}
-    Localisation: {location_on_plant or 'Non spécifiée'}
-    
-    Identifications possibles: {identification_scores[:3]}
-    
-    Fournis une analyse détaillée incluant:
-    1. Identification la plus probable avec justification
-    2. Stade de développement probable
-    3. Niveau d'infestation estimé
-    4. Urgence d'intervention
-    5. Méthodes de confirmation d'identification
-    6. Prédiction évolution sans traitement
-    """
+    # Court-circuit sans LLM quand le signal local est insuffisant
+    if not identification_scores or identification_scores[0]["probability"] < _MIN_CONFIDENCE:
+        return {
+            "crop": crop,
+            "pest_description": pest_description,
+            "damage_type": damage_type,
+            "location_on_plant": location_on_plant,
+            "identification_results": identification_scores,
+            "most_likely_pest": None,
+            "identification_analysis": _LOW_CONFIDENCE_PEST,
+            "confidence_level": identification_scores[0]["probability"] if identification_scores else 0,
+        }
     
-    response = model.generate_content(prompt)
+    # Utiliser Gemini pour l'analyse (top 3 compacté, cf. diagnostic)
+    top_candidates = _fmt_compact([
+        {k: score[k] for k in ("pest", "scientific_name", "probability", "economic_impact")}
+        for score in identification_scores[:3]
+    ])
+    prompt = _PEST_IDENTIFICATION_PREFIX + (
+        f"\n- Culture: {crop}"
+        f"\n- Description observée: {pest_description}"
+        f"\n- Type de dégâts: {damage_type or 'Non spécifié'}"
+        f"\n- Localisation: {location_on_plant or 'Non spécifiée'}"
+        f"\n- Identifications possibles: {top_candidates}"
+    )
+    
+    response = await _generate(
+        prompt,
+        tool_context,
+        cache_key=("pest", crop, pest_description, damage_type, location_on_plant),
+    )
     
     return {
         "crop": crop,
@@ -446,7 +791,7 @@ def get_pest_identification(
     }
 
 
-def get_prevention_strategies(
+async def get_prevention_strategies(
     crop: str,
     tool_context: ToolContext,
     region: Optional[str] = None,
@@ -465,40 +810,6 @@ def get_prevention_strategies(
     Returns:
         Stratégies de prévention complètes
     """
-    # Stratégies préventives par catégorie
-    prevention_strategies = {
-        "culturales": [
-            {"strategy": "Rotation des cultures", "cost": 0, "efficacy": 70, "description": "Briser le cycle des parasites"},
-            {"strategy": "Densité optimale", "cost": 5000, "efficacy": 60, "description": "Réduire humidité et compétition"},
-            {"strategy": "Associations culturales", "cost": 2000, "efficacy": 65, "description": "Plantes répulsives ou attractives"},
-            {"strategy": "Dates de semis", "cost": 0, "efficacy": 55, "description": "Éviter les pics d'infestation"}
-        ],
-        "biologiques": [
-            {"strategy": "Auxiliaires naturels", "cost": 10000, "efficacy": 75, "description": "Prédateurs et parasitoïdes"},
-            {"strategy": "Plantes pièges", "cost": 3000, "efficacy": 60, "description": "Concentrer les parasites"},
-            {"strategy": "Biodiversité fonctionnelle", "cost": 5000, "efficacy": 70, "description": "Haies, bandes fleuries"},
-            {"strategy": "Micro-organismes bénéfiques", "cost": 8000, "efficacy": 65, "description": "Mycorhizes, rhizobactéries"}
-        ],
-        "physiques": [
-            {"strategy": "Paillage", "cost": 15000, "efficacy": 50, "description": "Limiter mauvaises herbes et maladies sol"},
-            {"strategy": "Filets anti-insectes", "cost": 25000, "efficacy": 85, "description": "Barrière physique"},
-            {"strategy": "Pièges colorés", "cost": 8000, "efficacy": 60, "description": "Capture des adultes volants"},
-            {"strategy": "Barrières végétales", "cost": 12000, "efficacy": 55, "description": "Haies répulsives"}
-        ],
-        "sanitaires": [
-            {"strategy": "Assainissement", "cost": 2000, "efficacy": 80, "description": "Élimination résidus infectés"},
-            {"strategy": "Désinfection outils", "cost": 1000, "efficacy": 70, "description": "Éviter propagation"},
-            {"strategy": "Quarantaine nouvelles plants", "cost": 500, "efficacy": 90, "description": "Contrôle introduction"},
-            {"strategy": "Surveillance régulière", "cost": 3000, "efficacy": 85, "description": "Détection précoce"}
-        ],
-        "nutritionnelles": [
-            {"strategy": "Équilibre NPK", "cost": 20000, "efficacy": 65, "description": "Plantes plus résistantes"},
-            {"strategy": "Amendements organiques", "cost": 15000, "efficacy": 70, "description": "Amélioration sol et résistance"},
-            {"strategy": "Oligoéléments", "cost": 8000, "efficacy": 60, "description": "Stimulation défenses naturelles"},
-            {"strategy": "Compost de qualité", "cost": 10000, "efficacy": 68, "description": "Nutrition équilibrée"}
-        ]
-    }
-    
     # Sélection selon le système de culture
     if farming_system == "traditionnel":
         priority_categories = ["culturales", "sanitaires", "nutritionnelles"]
@@ -510,11 +821,9 @@ def get_prevention_strategies(
     # Sélection des meilleures stratégies
     selected_strategies = {}
     for category in priority_categories:
-        if category in prevention_strategies:
-            # Trier par efficacité et sélectionner les 3 meilleures
-            best_strategies = sorted(prevention_strategies[category], 
-                                   key=lambda x: x["efficacy"], reverse=True)[:3]
-            selected_strategies[category] = best_strategies
+        if category in _STRATEGIES_BY_EFFICACY:
+            # Déjà triées par efficacité: on garde les 3 meilleures
+            selected_strategies[category] = list(_STRATEGIES_BY_EFFICACY[category][:3])
     
     # Calcul du coût total et efficacité moyenne
     total_cost = 0
@@ -529,29 +838,32 @@ def get_prevention_strategies(
     
     average_efficacy = total_efficacy / strategy_count if strategy_count > 0 else 0
     
-    # Utiliser Gemini pour les recommandations
-    prompt = f"""
-    Stratégies de prévention pour {crop} au Cameroun:
-    
-    Région: {region or 'Non spécifiée'}
-    Système de culture: {farming_system}
-    Menaces principales: {', '.join(main_threats) if main_threats else 'Génériques'}
-    
-    Stratégies sélectionnées: {selected_strategies}
-    Coût total estimé: {total_cost} FCFA
-    Efficacité moyenne: {average_efficacy:.1f}%
-    
-    Élabore un plan préventif incluant:
-    1. Priorités d'action selon les menaces
-    2. Calendrier de mise en œuvre
-    3. Combinaisons synergiques de stratégies
-    4. Adaptations selon les conditions locales
-    5. Indicateurs de suivi et évaluation
-    6. Plan d'urgence si prévention insuffisante
-    7. Formation nécessaire pour l'agriculteur
-    """
-    
-    response = model.generate_content(prompt)
+    # Utiliser Gemini pour les recommandations: stratégies rendues en puces
+    # compactes plutôt qu'en repr Python du dict imbriqué
+    strategy_lines = "\n".join(
+        f"- {category}: "
+        + "; ".join(
+            f"{item['strategy']} ({item['efficacy']}%, {item['cost']} FCFA)"
+            for item in strategies
+        )
+        for category, strategies in selected_strategies.items()
+    )
+    prompt = _PREVENTION_PREFIX + (
+        f"\n- Culture: {crop}"
+        f"\n- Région: {region or 'Non spécifiée'}"
+        f"\n- Système de culture: {farming_system}"
+        f"\n- Menaces principales: {', '.join(main_threats) if main_threats else 'Génériques'}"
+        f"\n- Coût total estimé: {total_cost} FCFA"
+        f"\n- Efficacité moyenne: {average_efficacy:.1f}%"
+        f"\nStratégies sélectionnées:\n{strategy_lines}"
+    )
+    
+    response = await _generate(
+        prompt,
+        tool_context,
+        cache_key=("prevention", crop, region, tuple(main_threats or ()), farming_system),
+        llm=model_lite,
+    )
     
     return {
         "crop": crop,
@@ -564,6 +876,97 @@ def get_prevention_strategies(
         "prevention_plan": response.text,
         "priority_actions": [
             strategy["strategy"] for strategies in selected_strategies.values()
-            for strategy in sorted(strategies, key=lambda x: x["efficacy"], reverse=True)[:2]
+            for strategy in strategies[:2]
         ]
-    }
\ No newline at end of file
+    }
+
+
+async def diagnose_and_treat(
+    crop: str,
+    symptoms: List[str],
+    tool_context: ToolContext,
+    affected_parts: Optional[List[str]] = None,
+    environmental_conditions: Optional[str] = None,
+    severity: str = "modérée",
+    budget_constraints: str = "limité",
+) -> Dict[str, Any]:
+    """Diagnostic et plan de traitement fusionnés en un seul appel Gemini.
+
+    Le parcours classique enchaîne `diagnose_plant_disease` puis
+    `get_treatment_recommendations`, soit deux allers-retours LLM. Ici un
+    unique prompt à sortie JSON structurée produit les deux volets: latence
+    et préambule système divisés par deux.
+    
+    Args:
+        crop: Type de culture affectée
+        symptoms: Liste des symptômes observés
+        affected_parts: Parties de la plante affectées (optionnel)
+        environmental_conditions: Conditions environnementales (optionnel)
+        severity: Gravité du problème
+        budget_constraints: Contraintes budgétaires
+        tool_context: Contexte de l'outil
+        
+    Returns:
+        Diagnostic et plan de traitement combinés
+    """
+    symptoms = _normalize_terms(symptoms)
+    affected_parts = _normalize_terms(affected_parts) or None
+    disease_scores = _score_diseases(crop, symptoms, affected_parts, environmental_conditions)
+    treatment_plan = _select_treatment_plan(severity, budget_constraints)
+    
+    prompt = f"""
+    Diagnostic phytosanitaire ET plan de traitement pour {crop} au Cameroun:
+    
+    Symptômes observés: {', '.join(symptoms)}
+    Parties affectées: {', '.join(affected_parts) if affected_parts else 'Non spécifié'}
+    Conditions: {environmental_conditions or 'Non spécifiées'}
+    Gravité: {severity}
+    Budget: {budget_constraints}
+    
+    Analyses possibles: {_fmt_compact([{k: d[k] for k in ("disease", "probability", "severity")} for d in disease_scores[:3]])}
+    Produits recommandés: {_fmt_compact(treatment_plan)}
+    
+    Réponds en JSON strict avec exactement ces clés:
+    {{"diagnosis": {{"most_likely": str, "justification": str, "differentials": [str],
+    "urgency": str, "risks_if_untreated": str}},
+    "treatments": [{{"step": str, "product": str, "timing": str, "precautions": str}}]}}
+    """
+    
+    response = await _generate(
+        prompt,
+        tool_context,
+        cache_key=(
+            "diagnose_and_treat",
+            crop,
+            tuple(symptoms),
+            tuple(affected_parts or ()),
+            environmental_conditions,
+            severity,
+            budget_constraints,
+        ),
+        generation_config={
+            "response_mime_type": "application/json",
+            "max_output_tokens": 1024,
+            "temperature": 0.2,
+        },
+    )
+    
+    try:
+        fused = json.loads(response.text)
+    except ValueError:
+        # Sortie non conforme: on conserve le texte brut plutôt que d'échouer
+        fused = {"diagnosis": response.text, "treatments": []}
+    
+    return {
+        "crop": crop,
+        "symptoms": symptoms,
+        "severity": severity,
+        "budget_constraints": budget_constraints,
+        "diagnostic_results": disease_scores,
+        "most_likely_diagnosis": disease_scores[0] if disease_scores else None,
+        "confidence_level": disease_scores[0]["probability"] if disease_scores else 0,
+        "treatment_plan": treatment_plan,
+        "estimated_cost": sum(product["price_fcfa"] for product in treatment_plan),
+        "diagnosis": fused.get("diagnosis"),
+        "treatments": fused.get("treatments"),
+    }
@@ -2,29 +2,39 @@
 
 """Agent de gestion des ressources (sol, eau, engrais)."""
 
+import asyncio
 import os
-from google.adk.agents import Agent
-from google.genai import types
-
-from .prompts import return_instructions_resources
-from .tools import (
-    analyze_soil_requirements,
-    recommend_fertilizers,
-    optimize_irrigation,
-    assess_land_suitability,
-    calculate_nutrient_needs,
-    suggest_soil_amendments
-)
-from ...rag import retrieve_agricultural_knowledge
-from ...observability import make_adk_callbacks
-
-_obs = make_adk_callbacks()
-
-resources_agent = Agent(
-    model=os.getenv("RESOURCES_AGENT_MODEL", "gemini-2.0-flash-001"),
-    name="resources_agent",
-    instruction=return_instructions_resources(),
-    tools=[
+
+# Lu une seule fois à l'import: l'environnement ne change pas en cours de vie
+# du processus et _build/resources_agent_batch n'ont pas à re-consulter os.environ.
+_MODEL: str = os.getenv("RESOURCES_AGENT_MODEL", "gemini-2.0-flash-001")
+
+
+def _build():
+    """Construit l'agent ressources; les imports lourds sont différés ici."""
+    from google.adk.agents import Agent
+
+    from .prompts import return_instructions_resources
+    from .tools import (
+        analyze_soil_requirements,
+        recommend_fertilizers,
+        optimize_irrigation,
+        assess_land_suitability,
+        calculate_nutrient_needs,
+        suggest_soil_amendments,
+        get_soil_zone_profile,
+        get_context_block,
+    )
+    from .._config_cache import gen_cfg
+    from ...rag import retrieve_agricultural_knowledge
+    from ...observability import make_adk_callbacks
+
+    _obs = make_adk_callbacks()
+
+    # Tuple figé: l'ensemble d'outils est immuable une fois l'agent construit.
+    # Les outils sont nativement async (voir tools.py): ADK peut recouvrir
+    # leurs appels Gemini dans un même tour sans shim par thread.
+    tools = (
         retrieve_agricultural_knowledge,
         analyze_soil_requirements,
         recommend_fertilizers,
@@ -32,10 +42,76 @@ resources_agent = Agent(
         assess_land_suitability,
         calculate_nutrient_needs,
         suggest_soil_amendments,
-    ],
-    before_agent_callback=_obs["before_agent"],
-    after_agent_callback=_obs["after_agent"],
-    before_tool_callback=_obs["before_tool"],
-    after_tool_callback=_obs["after_tool"],
-    generate_content_config=types.GenerateContentConfig(temperature=0.4),
-)
\ No newline at end of file
+        get_soil_zone_profile,
+        get_context_block,
+    )
+
+    return Agent(
+        model=_MODEL,
+        name="resources_agent",
+        instruction=return_instructions_resources(),
+        tools=list(tools),
+        before_agent_callback=_obs["before_agent"],
+        after_agent_callback=_obs["after_agent"],
+        before_tool_callback=_obs["before_tool"],
+        after_tool_callback=_obs["after_tool"],
+        generate_content_config=gen_cfg(0.4),
+    )
+
+
+_resources_agent = None
+
+
+async def _warmup():
+    """Sort le coût du premier appel (TLS, préparation modèle) du chemin utilisateur."""
+    from ...utils.genai_client import get_model
+
+    try:
+        await get_model(_MODEL).generate_content_async(
+            "ping", generation_config={"max_output_tokens": 1}
+        )
+    except Exception:
+        # Best-effort: hors-ligne ou quota, la première vraie requête paiera
+        pass
+
+
+def __getattr__(name):
+    # PEP 562: la construction de l'agent (imports ADK/genai + validation
+    # Pydantic) n'a lieu qu'au premier accès à `resources_agent`, pas à
+    # l'import du package — démarrage plus rapide quand il n'est pas utilisé.
+    global _resources_agent
+    if name == "resources_agent":
+        if _resources_agent is None:
+            _resources_agent = _build()
+            # Warmup opt-in (AGRI_WARMUP=1): déplace ~10-50 ms de préparation
+            # de la première requête utilisateur vers la construction.
+            if os.getenv("AGRI_WARMUP"):
+                try:
+                    asyncio.get_running_loop().create_task(_warmup())
+                except RuntimeError:
+                    pass  # pas de boucle active: warmup ignoré
+        return _resources_agent
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
+async def resources_agent_batch(prompts: "list[str]") -> "list[str]":
+    """Exécute un lot de prompts ressources en concurrence bornée.
+
+    Pour les analyses en masse (des centaines de parcelles), passer N fois par
+    l'agent ADK paie N allers-retours sérialisés. Le SDK google-generativeai
+    n'expose pas l'API Batch de Gemini; l'équivalent inline émet tout le lot
+    d'un coup via le client partagé, sous le sémaphore global, avec
+    l'instruction de l'agent en préfixe commun (candidat au cache de prompt).
+    """
+    from .prompts import return_instructions_resources
+    from ...utils.genai_client import get_model, get_semaphore
+
+    llm = get_model(_MODEL)
+    instruction = return_instructions_resources()
+
+    async def _one(prompt: str) -> str:
+        async with get_semaphore():
+            response = await llm.generate_content_async(f"{instruction}\n\n{prompt}")
+        return response.text
+
+    return list(await asyncio.gather(*[_one(prompt) for prompt in prompts]))
@@ -2,128 +2,564 @@
 
 """Outils pour l'agent de gestion des ressources."""
 
-import os
-import random
+import asyncio
+import functools
+import json
+from collections import namedtuple
+from types import MappingProxyType
 from typing import Dict, List, Any, Optional
-import google.generativeai as genai
+
+import numpy as np
 from google.adk.tools import ToolContext
-from typing import Optional
+from google.api_core import exceptions as api_exceptions
 from agriculture_cameroun.config import CropType, RegionType, SoilType
+from ...utils.batch import BatchGeminiClient, batch_mode_enabled
+from ...utils.cache import CachedResponse, GeminiResponseCache
 from ...utils.data import LOCAL_FERTILIZERS, get_crop_info, get_region_info
+from ...utils.genai_client import get_model, get_semaphore
 
-# Configuration de l'API Gemini
-genai.configure(api_key=os.getenv("GEMINI_API_KEY"))
-model = genai.GenerativeModel('gemini-2.0-flash-001')
+@functools.lru_cache(maxsize=1)
+def _get_model():
+    """Client Gemini partagé, initialisé au premier appel d'outil.
 
+    La configuration genai (validation de la clé, création du client) ne se
+    paie plus à l'import du package: un processus qui n'invoque jamais les
+    outils ressources ne la paie jamais — voir utils/genai_client.py.
+    """
+    return get_model('gemini-2.0-flash-001')
 
-def analyze_soil_requirements(
-    crop: str,
-    region: str,
-    tool_context: ToolContext,
-    soil_type: Optional[str] = None,
-    current_ph: Optional[float] = None,
-) -> Dict[str, Any]:
-    """Analyse les exigences du sol pour une culture donnée.
-    
-    Args:
-        crop: Type de culture
-        region: Région de culture
-        soil_type: Type de sol (optionnel)
-        current_ph: pH actuel du sol (optionnel)
-        tool_context: Contexte de l'outil
-        
-    Returns:
-        Analyse complète des exigences du sol
+
+@functools.lru_cache(maxsize=1)
+def _get_batch_client():
+    """Micro-batcher des prompts d'un même tour, créé au premier usage.
+
+    Coalescence sol + engrais + irrigation pour une même parcelle: les appels
+    proches partent ensemble au lieu de payer chacun son aller-retour — voir
+    utils/batch.py. None hors mode batch (ENABLE_BATCH_MODE).
     """
-    # Exigences par culture
-    crop_requirements = {
-        "cacao": {
-            "ph_optimal": {"min": 6.0, "max": 7.0},
-            "depth_cm": 150,
-            "drainage": "bien drainé",
-            "organic_matter_percent": {"min": 3.0, "optimal": 5.0},
-            "texture_preferred": ["argileux", "argilo-limoneux"],
-            "nutrients": {"N": "élevé", "P": "modéré", "K": "élevé", "Ca": "élevé", "Mg": "modéré"}
-        },
-        "café": {
-            "ph_optimal": {"min": 6.0, "max": 6.8},
-            "depth_cm": 120,
-            "drainage": "bien drainé",
-            "organic_matter_percent": {"min": 4.0, "optimal": 6.0},
-            "texture_preferred": ["volcanique", "argilo-limoneux"],
-            "nutrients": {"N": "élevé", "P": "modéré", "K": "élevé", "Ca": "élevé", "Mg": "élevé"}
-        },
-        "maïs": {
-            "ph_optimal": {"min": 5.8, "max": 7.0},
-            "depth_cm": 80,
-            "drainage": "bien drainé à modéré",
-            "organic_matter_percent": {"min": 2.0, "optimal": 4.0},
-            "texture_preferred": ["limoneux", "argilo-limoneux"],
-            "nutrients": {"N": "très élevé", "P": "élevé", "K": "élevé", "Ca": "modéré", "Mg": "modéré"}
-        },
-        "manioc": {
-            "ph_optimal": {"min": 5.5, "max": 6.5},
-            "depth_cm": 60,
-            "drainage": "bien drainé",
-            "organic_matter_percent": {"min": 1.5, "optimal": 3.0},
-            "texture_preferred": ["sableux", "sablo-limoneux"],
-            "nutrients": {"N": "modéré", "P": "modéré", "K": "élevé", "Ca": "modéré", "Mg": "faible"}
-        },
-        "plantain": {
-            "ph_optimal": {"min": 6.0, "max": 7.5},
-            "depth_cm": 100,
-            "drainage": "modéré à humide",
-            "organic_matter_percent": {"min": 3.0, "optimal": 5.0},
-            "texture_preferred": ["argileux", "argilo-limoneux"],
-            "nutrients": {"N": "très élevé", "P": "élevé", "K": "très élevé", "Ca": "élevé", "Mg": "élevé"}
-        },
-        "arachide": {
-            "ph_optimal": {"min": 6.0, "max": 7.0},
-            "depth_cm": 50,
-            "drainage": "bien drainé",
-            "organic_matter_percent": {"min": 2.0, "optimal": 3.5},
-            "texture_preferred": ["sableux", "sablo-limoneux"],
-            "nutrients": {"N": "faible", "P": "élevé", "K": "modéré", "Ca": "élevé", "Mg": "modéré"}
-        }
+    return BatchGeminiClient(_get_model()) if batch_mode_enabled() else None
+
+# Cache disque des réponses: les prompts sont entièrement déterminés par un
+# petit espace d'arguments (culture × région × niveaux), et les plans sol/
+# engrais/irrigation pour des entrées identiques ne varient pas d'un appel
+# à l'autre. Un hit évite l'aller-retour LLM complet.
+_cache = GeminiResponseCache("resources")
+
+# Même durée de vie que les autres caches d'outils: une semaine, le temps
+# qu'une recommandation agronomique reste valable sans figer le cache.
+_CACHE_MAX_AGE_SECONDS = 7 * 86400
+
+
+# Erreurs Gemini passagères qui justifient une nouvelle tentative; tout le
+# reste (arguments invalides, auth, blocage sécurité) remonte immédiatement.
+_TRANSIENT_ERRORS = (
+    api_exceptions.ResourceExhausted,      # 429
+    api_exceptions.ServiceUnavailable,     # 503
+    api_exceptions.InternalServerError,    # 500
+    api_exceptions.DeadlineExceeded,       # 504
+)
+
+
+async def _call_with_retry(prompt: str):
+    """Appel Gemini direct avec reprise sur erreurs transitoires (429/5xx).
+
+    Trois tentatives avec backoff exponentiel (0,5 s puis 1 s), chacune sous
+    le sémaphore global qui borne les requêtes en vol sous le quota: les lots
+    limités en débit récupèrent au lieu de faire échouer tout l'outil.
+    """
+    for attempt in range(3):
+        try:
+            async with get_semaphore():
+                return await _get_model().generate_content_async(prompt)
+        except _TRANSIENT_ERRORS:
+            if attempt == 2:
+                raise
+            await asyncio.sleep(0.5 * 2**attempt)
+
+
+async def _generate(prompt: str, tool_context: ToolContext, cache_key: Optional[tuple] = None):
+    """Envoie un prompt à Gemini, avec cache disque sur clé structurée.
+
+    La clé reprend les arguments de l'outil plutôt que le prompt complet:
+    elle reste stable si la mise en page du prompt change.
+    `tool_context.state["force_refresh"]` court-circuite le cache;
+    `tool_context.state["fast_mode"]` saute l'appel LLM (texte None).
+    """
+    if cache_key is not None and not tool_context.state.get("force_refresh"):
+        cached = _cache.get(*cache_key, max_age_seconds=_CACHE_MAX_AGE_SECONDS)
+        if cached is not None:
+            return CachedResponse(cached)
+    if tool_context.state.get("fast_mode"):
+        # Mode structuré seul (évaluation en masse de parcelles): le volet
+        # quantitatif des outils est complet sans le narratif Gemini, et
+        # sauter l'appel ramène la latence de ~1-3 s à <1 ms. Rappeler le
+        # même outil sans fast_mode (clé de cache identique) complète le
+        # narratif a posteriori pour les seuls résultats retenus.
+        return CachedResponse(None, from_cache=False)
+    batch_client = _get_batch_client()
+    if batch_client is not None and tool_context.state.get("batch_mode"):
+        response = await batch_client.generate(prompt)
+    elif tool_context.state.get("streaming"):
+        # Mode streaming: le texte partiel est publié au fil des chunks dans
+        # l'état de session — l'orchestrateur peut l'afficher avant la fin de
+        # la génération, sans changer le contrat de retour de l'outil.
+        async with get_semaphore():
+            stream = await _get_model().generate_content_async(prompt, stream=True)
+            parts: List[str] = []
+            async for chunk in stream:
+                parts.append(chunk.text)
+                tool_context.state["partial_response"] = "".join(parts)
+            response = CachedResponse("".join(parts), from_cache=False)
+    else:
+        response = await _call_with_retry(prompt)
+    if cache_key is not None:
+        _cache.set(response.text, *cache_key)
+    return response
+
+
+# Tables statiques construites une fois à l'import: chaque appel d'outil les
+# référence au lieu de reconstruire des dizaines de littéraux dict/list.
+# Seule l'enveloppe externe est figée (MappingProxyType): les entrées internes
+# restent des dicts ordinaires car elles partent telles quelles dans les
+# prompts et les résultats JSON des outils.
+# Exigences par culture
+_CROP_REQUIREMENTS = MappingProxyType({
+    "cacao": {
+        "ph_optimal": {"min": 6.0, "max": 7.0},
+        "depth_cm": 150,
+        "drainage": "bien drainé",
+        "organic_matter_percent": {"min": 3.0, "optimal": 5.0},
+        "texture_preferred": ["argileux", "argilo-limoneux"],
+        "nutrients": {"N": "élevé", "P": "modéré", "K": "élevé", "Ca": "élevé", "Mg": "modéré"}
+    },
+    "café": {
+        "ph_optimal": {"min": 6.0, "max": 6.8},
+        "depth_cm": 120,
+        "drainage": "bien drainé",
+        "organic_matter_percent": {"min": 4.0, "optimal": 6.0},
+        "texture_preferred": ["volcanique", "argilo-limoneux"],
+        "nutrients": {"N": "élevé", "P": "modéré", "K": "élevé", "Ca": "élevé", "Mg": "élevé"}
+    },
+    "maïs": {
+        "ph_optimal": {"min": 5.8, "max": 7.0},
+        "depth_cm": 80,
+        "drainage": "bien drainé à modéré",
+        "organic_matter_percent": {"min": 2.0, "optimal": 4.0},
+        "texture_preferred": ["limoneux", "argilo-limoneux"],
+        "nutrients": {"N": "très élevé", "P": "élevé", "K": "élevé", "Ca": "modéré", "Mg": "modéré"}
+    },
+    "manioc": {
+        "ph_optimal": {"min": 5.5, "max": 6.5},
+        "depth_cm": 60,
+        "drainage": "bien drainé",
+        "organic_matter_percent": {"min": 1.5, "optimal": 3.0},
+        "texture_preferred": ["sableux", "sablo-limoneux"],
+        "nutrients": {"N": "modéré", "P": "modéré", "K": "élevé", "Ca": "modéré", "Mg": "faible"}
+    },
+    "plantain": {
+        "ph_optimal": {"min": 6.0, "max": 7.5},
+        "depth_cm": 100,
+        "drainage": "modéré à humide",
+        "organic_matter_percent": {"min": 3.0, "optimal": 5.0},
+        "texture_preferred": ["argileux", "argilo-limoneux"],
+        "nutrients": {"N": "très élevé", "P": "élevé", "K": "très élevé", "Ca": "élevé", "Mg": "élevé"}
+    },
+    "arachide": {
+        "ph_optimal": {"min": 6.0, "max": 7.0},
+        "depth_cm": 50,
+        "drainage": "bien drainé",
+        "organic_matter_percent": {"min": 2.0, "optimal": 3.5},
+        "texture_preferred": ["sableux", "sablo-limoneux"],
+        "nutrients": {"N": "faible", "P": "élevé", "K": "modéré", "Ca": "élevé", "Mg": "modéré"}
     }
-    
-    # Caractéristiques des sols par région
-    regional_soils = {
-        "Centre": {
-            "dominant_type": "ferrallitique",
-            "average_ph": 4.8,
-            "organic_matter": 2.5,
-            "main_constraints": ["acidité", "pauvreté en bases", "lixiviation"],
-            "advantages": ["profondeur", "pas de toxicité aluminique sévère"]
-        },
-        "Ouest": {
-            "dominant_type": "volcanique", 
-            "average_ph": 5.8,
-            "organic_matter": 4.2,
-            "main_constraints": ["pentes", "érosion potentielle"],
-            "advantages": ["fertilité naturelle", "rétention eau", "structure"]
-        },
-        "Nord": {
-            "dominant_type": "ferrugineux",
-            "average_ph": 6.2,
-            "organic_matter": 1.8,
-            "main_constraints": ["faible MO", "carence P", "battance"],
-            "advantages": ["pas d'acidité", "bonne base"]
-        }
+})
+
+# Caractéristiques des sols par région
+_REGIONAL_SOILS = MappingProxyType({
+    "Centre": {
+        "dominant_type": "ferrallitique",
+        "average_ph": 4.8,
+        "organic_matter": 2.5,
+        "main_constraints": ["acidité", "pauvreté en bases", "lixiviation"],
+        "advantages": ["profondeur", "pas de toxicité aluminique sévère"]
+    },
+    "Ouest": {
+        "dominant_type": "volcanique", 
+        "average_ph": 5.8,
+        "organic_matter": 4.2,
+        "main_constraints": ["pentes", "érosion potentielle"],
+        "advantages": ["fertilité naturelle", "rétention eau", "structure"]
+    },
+    "Nord": {
+        "dominant_type": "ferrugineux",
+        "average_ph": 6.2,
+        "organic_matter": 1.8,
+        "main_constraints": ["faible MO", "carence P", "battance"],
+        "advantages": ["pas d'acidité", "bonne base"]
     }
-    
-    # Obtenir les exigences de la culture
-    requirements = crop_requirements.get(crop, crop_requirements["maïs"])
-    regional_data = regional_soils.get(region, regional_soils["Centre"])
-    
+})
+
+# Besoins nutritifs par culture (kg/ha). namedtuple plutôt que dict: tuple
+# immuable à champs nommés, sans hachage de chaîne à l'accès, dont l'ordre
+# des champs est exactement celui de _FERT_NUTRIENTS — la conversion en
+# vecteur est alors un simple np.array(needs).
+_Nutrients = namedtuple("_Nutrients", ("N", "P2O5", "K2O", "Ca", "Mg"))
+_NUTRIENT_NEEDS = MappingProxyType({
+    "cacao": _Nutrients(120, 40, 150, 80, 30),
+    "café": _Nutrients(150, 50, 180, 100, 40),
+    "maïs": _Nutrients(200, 80, 160, 50, 25),
+    "manioc": _Nutrients(80, 40, 120, 30, 15),
+    "plantain": _Nutrients(250, 100, 300, 120, 50),
+    "arachide": _Nutrients(30, 60, 80, 80, 20)
+})
+
+# Facteurs de correction selon fertilité
+_FERTILITY_FACTORS = MappingProxyType({
+    "faible": 1.3,
+    "moyenne": 1.0,
+    "bonne": 0.8,
+    "élevée": 0.6
+})
+
+# Besoins en eau par culture (mm/cycle)
+_WATER_REQUIREMENTS = MappingProxyType({
+    "cacao": {"min": 1200, "optimal": 1800, "critical_periods": ["floraison", "développement fruits"]},
+    "café": {"min": 1000, "optimal": 1500, "critical_periods": ["floraison", "grossissement grains"]},
+    "maïs": {"min": 450, "optimal": 600, "critical_periods": ["floraison", "remplissage grains"]},
+    "manioc": {"min": 600, "optimal": 1000, "critical_periods": ["établissement", "tubérisation"]},
+    "plantain": {"min": 1200, "optimal": 1800, "critical_periods": ["toute l'année"]},
+    "arachide": {"min": 400, "optimal": 550, "critical_periods": ["floraison", "formation gousses"]}
+})
+
+# Précipitations moyennes par région (mm/an)
+_REGIONAL_RAINFALL = MappingProxyType({
+    "Centre": 1400,
+    "Littoral": 2800,
+    "Ouest": 1800,
+    "Sud": 1600,
+    "Est": 1500,
+    "Nord": 1000,
+    "Adamaoua": 1300,
+    "Extrême-Nord": 600,
+    "Nord-Ouest": 1600,
+    "Sud-Ouest": 3000
+})
+
+# Systèmes d'irrigation recommandés
+_IRRIGATION_SYSTEMS = MappingProxyType({
+    "goutte_à_goutte": {
+        "efficiency": 0.9,
+        "cost_per_ha": 800000,
+        "water_saving": 0.5,
+        "suitable_crops": ["maraîchage", "arbres fruitiers"],
+        "maintenance": "modérée"
+    },
+    "aspersion": {
+        "efficiency": 0.75,
+        "cost_per_ha": 400000,
+        "water_saving": 0.3,
+        "suitable_crops": ["céréales", "légumineuses"],
+        "maintenance": "élevée"
+    },
+    "gravitaire": {
+        "efficiency": 0.6,
+        "cost_per_ha": 150000,
+        "water_saving": 0.1,
+        "suitable_crops": ["riz", "maraîchage"],
+        "maintenance": "faible"
+    },
+    "micro_aspersion": {
+        "efficiency": 0.8,
+        "cost_per_ha": 600000,
+        "water_saving": 0.4,
+        "suitable_crops": ["plantain", "agrumes"],
+        "maintenance": "modérée"
+    }
+})
+
+# Techniques de conservation de l'eau
+_WATER_CONSERVATION = [
+    {"technique": "Paillage", "water_saving": 30, "cost_fcfa": 20000, "implementation": "facile"},
+    {"technique": "Brise-vent", "water_saving": 15, "cost_fcfa": 50000, "implementation": "moyenne"},
+    {"technique": "Récupération eau pluie", "water_saving": 0, "cost_fcfa": 100000, "implementation": "complexe"},
+    {"technique": "Amélioration sol", "water_saving": 25, "cost_fcfa": 30000, "implementation": "facile"}
+]
+
+# Critères d'aptitude par culture
+_SUITABILITY_CRITERIA = MappingProxyType({
+    "cacao": {
+        "altitude": {"min": 0, "max": 800},
+        "pente": {"max": 30},
+        "drainage": ["bien drainé", "modérément drainé"],
+        "exposition": ["ombragé", "mi-ombre"],
+        "ph": {"min": 5.5, "max": 7.0}
+    },
+    "café": {
+        "altitude": {"min": 500, "max": 2000},
+        "pente": {"max": 45},
+        "drainage": ["bien drainé"],
+        "exposition": ["mi-ombre", "ombragé"],
+        "ph": {"min": 6.0, "max": 7.0}
+    },
+    "maïs": {
+        "altitude": {"min": 0, "max": 1500},
+        "pente": {"max": 15},
+        "drainage": ["bien drainé", "modérément drainé"],
+        "exposition": ["plein soleil"],
+        "ph": {"min": 5.8, "max": 7.2}
+    }
+})
+
+# Seuils numériques d'aptitude en position fixe (altitude, pente, ph): chaque
+# ligne porte [borne basse, borne haute, marge de tolérance], si bien que les
+# trois critères se notent en un seul passage np.where au lieu de branches
+# Python par critère. La pente s'exprime dans le même moule: excellent jusqu'à
+# max/2, bon jusqu'à max (marge = max/2). Drainage et exposition, catégoriels,
+# restent des recherches dict.
+_SUITABILITY_NUMERIC = ("altitude", "pente", "ph")
+_SUITABILITY_BOUNDS = MappingProxyType({
+    crop: np.array(
+        [
+            [c["altitude"]["min"], c["altitude"]["max"], 200.0],
+            [0.0, c["pente"]["max"] / 2, c["pente"]["max"] / 2],
+            [c["ph"]["min"], c["ph"]["max"], 0.5],
+        ],
+        dtype=np.float32,
+    )
+    for crop, c in _SUITABILITY_CRITERIA.items()
+})
+
+# Besoins unitaires par kg de produit (g/kg produit), champs dans l'ordre
+# de _NUTRIENTS pour la même conversion directe en vecteur.
+_Uptake = namedtuple("_Uptake", ("N", "P", "K", "Ca", "Mg", "S"))
+_NUTRIENT_UPTAKE = MappingProxyType({
+    "cacao": _Uptake(25, 3, 35, 8, 4, 2),
+    "café": _Uptake(20, 2, 25, 5, 3, 1.5),
+    "maïs": _Uptake(15, 3, 8, 2, 2, 1),
+    "manioc": _Uptake(5, 1, 8, 3, 1, 0.5),
+    "plantain": _Uptake(12, 1.5, 20, 4, 2, 1),
+    "arachide": _Uptake(40, 4, 12, 8, 3, 2)
+})
+
+# Coefficients d'efficacité des engrais
+_FERTILIZER_EFFICIENCY = MappingProxyType({
+    "N": 0.6,  # 60% du N appliqué utilisé
+    "P": 0.2,  # 20% du P appliqué utilisé
+    "K": 0.8,  # 80% du K appliqué utilisé
+    "Ca": 0.7,
+    "Mg": 0.6,
+    "S": 0.5
+})
+
+# Niveaux critiques de référence
+_CRITICAL_LEVELS = MappingProxyType({
+    "ph": 6.0,
+    "organic_matter": 3.0,
+    "available_P": 15,  # ppm
+    "exchangeable_K": 120,  # ppm
+    "exchangeable_Ca": 2000,  # ppm
+    "exchangeable_Mg": 240   # ppm
+})
+
+# Amendements disponibles
+_AMENDMENTS = MappingProxyType({
+    "chaux_agricole": {
+        "purpose": "correction acidité",
+        "ph_range": {"min": 4.0, "max": 6.0},
+        "application_rate": "2-4 t/ha",
+        "cost_per_tonne": 50000,
+        "effect_duration": "2-3 ans",
+        "benefits": ["augmente pH", "apporte Ca", "améliore structure"]
+    },
+    "dolomie": {
+        "purpose": "correction acidité + Mg",
+        "ph_range": {"min": 4.0, "max": 6.0},
+        "application_rate": "1.5-3 t/ha",
+        "cost_per_tonne": 55000,
+        "effect_duration": "3-4 ans",
+        "benefits": ["augmente pH", "apporte Ca et Mg", "action plus douce"]
+    },
+    "compost": {
+        "purpose": "matière organique",
+        "mo_threshold": 3.0,
+        "application_rate": "10-20 t/ha",
+        "cost_per_tonne": 10000,
+        "effect_duration": "1-2 ans",
+        "benefits": ["améliore structure", "fertilité", "rétention eau", "vie microbienne"]
+    },
+    "fumier_décomposé": {
+        "purpose": "matière organique + nutriments",
+        "mo_threshold": 2.5,
+        "application_rate": "15-25 t/ha",
+        "cost_per_tonne": 12000,
+        "effect_duration": "1-2 ans",
+        "benefits": ["nutrition", "structure", "activité biologique"]
+    },
+    "gypse": {
+        "purpose": "amélioration sols sodiques",
+        "constraints": ["excès sodium", "compaction"],
+        "application_rate": "2-5 t/ha",
+        "cost_per_tonne": 30000,
+        "effect_duration": "2-3 ans",
+        "benefits": ["améliore infiltration", "réduit compaction"]
+    },
+    "biochar": {
+        "purpose": "amélioration physico-chimique",
+        "universal": True,
+        "application_rate": "2-5 t/ha",
+        "cost_per_tonne": 80000,
+        "effect_duration": "10+ ans",
+        "benefits": ["séquestration carbone", "rétention nutriments", "structure"]
+    }
+})
+
+def _fmt_compact(obj: Any) -> str:
+    """Sérialisation JSON compacte et canonique pour les prompts.
+
+    Les clés sont triées: des entrées identiques produisent des prompts
+    identiques à l'octet près, quel que soit l'ordre des dicts fournis par
+    l'appelant — condition pour que les caches amont/aval fassent mouche.
+    """
+    return json.dumps(obj, ensure_ascii=False, separators=(",", ":"), sort_keys=True, default=str)
+
+
+def _narrative_bucket(value: float) -> float:
+    """Projette une grandeur continue sur un palier pour la clé de cache.
+
+    Arrondi à deux chiffres significatifs: 1.02 et 1.0 ha, ou 101 et 100 ha,
+    tombent dans la même entrée. Pour des entrées aussi proches la narration
+    Gemini est essentiellement identique — seul le calcul local, qui reste
+    exact, diffère — et le cache capte ainsi les quasi-doublons au lieu de
+    repayer un aller-retour LLM par variation marginale.
+    """
+    return float(f"{value:.2g}")
+
+
+# Sérialisée une fois: la liste des techniques est statique, inutile de la
+# re-encoder à chaque prompt d'irrigation.
+_WATER_CONSERVATION_JSON = _fmt_compact(_WATER_CONSERVATION)
+
+
+# Prompts restructurés en préfixe statique (candidat au cache de prompt côté
+# Gemini) + court suffixe dynamique: le gros des tokens est identique d'un
+# appel à l'autre et les dicts interpolés passent en JSON compact au lieu du
+# __repr__ Python, plus verbeux et sensible à l'ordre d'insertion.
+_SOIL_ANALYSIS_PREFIX = """Analyse des exigences du sol pour une culture au Cameroun.
+
+Fournis une analyse complète incluant:
+1. Évaluation de l'adéquation sol-culture
+2. Facteurs limitants identifiés
+3. Plan d'amélioration détaillé avec chronologie
+4. Techniques d'amendement appropriées
+5. Coûts estimés et retour sur investissement
+6. Suivi et indicateurs de réussite
+7. Alternatives si contraintes trop importantes
+"""
+
+_FERTILIZATION_PREFIX = """Plan de fertilisation d'une culture au Cameroun.
+
+Optimise le plan en considérant:
+1. Efficacité agronomique des apports
+2. Fractionnement et timing d'application
+3. Compatibilités et synergies entre engrais
+4. Alternatives locales moins coûteuses
+5. Méthodes d'application recommandées
+6. Précautions d'usage et stockage
+7. Indicateurs de suivi d'efficacité
+"""
+
+_IRRIGATION_PREFIX = """Optimisation de l'irrigation d'une culture au Cameroun.
+
+Propose un plan complet incluant:
+1. Stratégie d'irrigation adaptée à la région
+2. Dimensionnement du système (débit, réservoirs)
+3. Calendrier d'irrigation précis
+4. Techniques complémentaires d'économie d'eau
+5. Coûts d'exploitation annuels
+6. Retour sur investissement estimé
+7. Maintenance préventive requise
+8. Alternatives en cas de pénurie d'eau
+"""
+
+_SUITABILITY_PREFIX = """Évaluation de l'aptitude d'un terrain pour une culture au Cameroun.
+
+Fournis une évaluation détaillée incluant:
+1. Analyse de l'aptitude par critère
+2. Facteurs limitants principaux
+3. Potentiel de production estimé
+4. Plan d'amélioration si nécessaire
+5. Alternatives culturales mieux adaptées
+6. Risques et contraintes à surveiller
+7. Investissements requis pour optimisation
+"""
+
+_NUTRIENT_NEEDS_PREFIX = """Calcul des besoins nutritifs d'une culture au Cameroun.
+
+Optimise le calcul en considérant:
+1. Précision des besoins selon le rendement cible
+2. Ajustements selon fertilité du sol
+3. Fractionnement optimal des apports
+4. Formes d'engrais les plus appropriées
+5. Interactions entre nutriments
+6. Facteurs climatiques et saisonniers
+7. Coût du programme et alternatives
+"""
+
+_AMENDMENT_PREFIX = """Plan d'amendement du sol au Cameroun.
+
+Optimise le plan en considérant:
+1. Priorités d'intervention selon l'urgence
+2. Synergies entre amendements
+3. Méthodes d'application optimales
+4. Suivi et évaluation des résultats
+5. Alternatives moins coûteuses
+6. Planning pluriannuel d'amélioration
+7. Indicateurs de réussite du programme
+"""
+
+
+# Vecteurs dérivés des tables ci-dessus pour le calcul des besoins nutritifs:
+# une position fixe par nutriment, une multiplication vectorisée par appel au
+# lieu de ~50 opérations dict/flottant en Python pur.
+_NUTRIENTS = ("N", "P", "K", "Ca", "Mg", "S")
+_NUTRIENT_IDX = MappingProxyType({n: i for i, n in enumerate(_NUTRIENTS)})
+_EFFICIENCY_VEC = np.array([_FERTILIZER_EFFICIENCY[n] for n in _NUTRIENTS], dtype=np.float32)
+_UPTAKE_VEC = MappingProxyType({
+    crop: np.array(uptake, dtype=np.float32)
+    for crop, uptake in _NUTRIENT_UPTAKE.items()
+})
+
+# Fractions d'apport par passage (lignes) et par nutriment (colonnes): N est
+# fractionné 30/40/30, K 50/30/20, P et les bases passent en fumure de fond.
+_SCHEDULE_STAGES = ("basal", "side_dress_1", "side_dress_2", "foliar")
+_SCHEDULE_MATRIX = np.array([
+    #  N    P    K    Ca   Mg   S
+    [0.3, 1.0, 0.5, 1.0, 1.0, 1.0],  # basal: à la plantation
+    [0.4, 0.0, 0.3, 0.0, 0.0, 0.0],  # side_dress_1: premier apport de couverture
+    [0.3, 0.0, 0.2, 0.0, 0.0, 0.0],  # side_dress_2: deuxième apport de couverture
+    [0.0, 0.0, 0.0, 0.0, 0.0, 0.0],  # foliar: applications foliaires
+], dtype=np.float32)
+
+
+@functools.cache
+def _soil_assessment(crop: str, region: str, current_ph: Optional[float]):
+    """Diagnostic sol déterministe pour un triplet (culture, région, pH).
+
+    L'espace d'entrée est discret et minuscule (cultures × régions × quelques
+    pH mesurés): le diagnostic et le plan d'amélioration sont construits une
+    fois par triplet puis rejoués depuis le cache.
+    """
+    requirements = _CROP_REQUIREMENTS.get(crop, _CROP_REQUIREMENTS["maïs"])
+    regional_data = _REGIONAL_SOILS.get(region, _REGIONAL_SOILS["Centre"])
+
     # Évaluation de l'adéquation
     ph_current = current_ph if current_ph else regional_data["average_ph"]
     ph_optimal = requirements["ph_optimal"]
-    
+
     ph_adequacy = "optimal" if ph_optimal["min"] <= ph_current <= ph_optimal["max"] else (
         "trop acide" if ph_current < ph_optimal["min"] else "trop alcalin"
     )
-    
+
     # Recommandations d'amélioration
     improvements = []
     if ph_adequacy == "trop acide":
@@ -134,7 +570,7 @@ def analyze_soil_requirements(
             "cost_fcfa": lime_needed * 50000,
             "priority": "élevée"
         })
-    
+
     if regional_data["organic_matter"] < requirements["organic_matter_percent"]["min"]:
         organic_deficit = requirements["organic_matter_percent"]["optimal"] - regional_data["organic_matter"]
         compost_needed = organic_deficit * 20  # Estimation
@@ -144,31 +580,57 @@ def analyze_soil_requirements(
             "cost_fcfa": compost_needed * 10000,
             "priority": "élevée"
         })
+
+    return requirements, regional_data, ph_current, ph_adequacy, tuple(improvements)
+
+
+async def analyze_soil_requirements(
+    crop: str,
+    region: str,
+    tool_context: ToolContext,
+    soil_type: Optional[str] = None,
+    current_ph: Optional[float] = None,
+) -> Dict[str, Any]:
+    """Analyse les exigences du sol pour une culture donnée.
     
-    # Utiliser Gemini pour l'analyse
-    prompt = f"""
-    Analyse des exigences du sol pour {crop} en région {region} du Cameroun:
-    
-    Exigences de la culture: {requirements}
-    Caractéristiques sol régional: {regional_data}
-    pH actuel: {ph_current}
-    Adéquation pH: {ph_adequacy}
-    Type de sol: {soil_type or regional_data['dominant_type']}
-    
-    Améliorations identifiées: {improvements}
-    
-    Fournis une analyse complète incluant:
-    1. Évaluation de l'adéquation sol-culture
-    2. Facteurs limitants identifiés
-    3. Plan d'amélioration détaillé avec chronologie
-    4. Techniques d'amendement appropriées
-    5. Coûts estimés et retour sur investissement
-    6. Suivi et indicateurs de réussite
-    7. Alternatives si contraintes trop importantes
+    Args:
+        crop: Type de culture
+        region: Région de culture
+        soil_type: Type de sol (optionnel)
+        current_ph: pH actuel du sol (optionnel)
+        tool_context: Contexte de l'outil
+        
+    Returns:
+        Analyse complète des exigences du sol
     """
+    # Volet déterministe mémoïsé: ne dépend que du triplet (culture, région, pH)
+    requirements, regional_data, ph_current, ph_adequacy, improvements = _soil_assessment(
+        crop, region, current_ph
+    )
+    improvements = list(improvements)
+
+    # Utiliser Gemini pour l'analyse
+    prompt = _SOIL_ANALYSIS_PREFIX + (
+        f"\n- Culture: {crop} | Région: {region}"
+        f"\n- Exigences de la culture: {_fmt_compact(requirements)}"
+        f"\n- Caractéristiques sol régional: {_fmt_compact(regional_data)}"
+        f"\n- pH actuel: {ph_current} | Adéquation pH: {ph_adequacy}"
+        f"\n- Type de sol: {soil_type or regional_data['dominant_type']}"
+        f"\n- Améliorations identifiées: {_fmt_compact(improvements)}"
+    )
     
-    response = model.generate_content(prompt)
-    
+    response = await _generate(
+        prompt,
+        tool_context,
+        cache_key=(
+            "soil_requirements",
+            crop,
+            region,
+            soil_type,
+            round(current_ph, 1) if current_ph else None,
+        ),
+    )
+
     return {
         "crop": crop,
         "region": region,
@@ -189,7 +651,100 @@ def analyze_soil_requirements(
     }
 
 
-def recommend_fertilizers(
+# Besoins de fumure par position fixe (mêmes champs que _NUTRIENT_NEEDS): la
+# correction de fertilité et le bilan restant se font sur un vecteur au lieu
+# d'un dict copié puis muté clé par clé.
+_FERT_NUTRIENTS = ("N", "P2O5", "K2O", "Ca", "Mg")
+_FERT_IDX = MappingProxyType({n: i for i, n in enumerate(_FERT_NUTRIENTS)})
+_BASE_NEEDS_VEC = MappingProxyType({
+    crop: np.array(needs, dtype=np.float32)
+    for crop, needs in _NUTRIENT_NEEDS.items()
+})
+
+# Compléments minéraux disponibles par nutriment: engrais, teneur en élément,
+# coût unitaire et consignes. Le choix du complément devient un parcours de
+# table au lieu d'une cascade de branches par nutriment.
+_FERTILIZER_SPECS = MappingProxyType({
+    "N": {
+        "product": "urée (46% N)",
+        "analysis": 0.46,
+        "cost_per_unit": 450,  # FCFA/kg
+        "application_timing": "fractionnée (plantation + 45j + 90j)",
+        "extra": ("precautions", ["appliquer avant pluie", "ne pas mettre sur feuilles"]),
+    },
+    "P2O5": {
+        "product": "phosphate naturel",
+        "analysis": 0.28,
+        "cost_per_unit": 300,  # FCFA/kg
+        "application_timing": "à la plantation",
+        "extra": ("benefits", ["effet résiduel long", "améliore enracinement"]),
+    },
+})
+
+# Apport nutritif du compost de base, aligné sur _FERT_NUTRIENTS: le bilan
+# restant se réduit d'une seule soustraction bornée (np.maximum) au lieu
+# d'une boucle dict par nutriment. Le vecteur s'étend sans changer le code
+# si d'autres apports organiques viennent s'ajouter.
+_ORGANIC_SUPPLY_VEC = np.array([75, 50, 75, 0, 0], dtype=np.float32)
+
+
+@functools.cache
+def _fertilization_template(crop: str, soil_fertility: str, budget_level: str):
+    """Plan de fertilisation par hectare pour (culture, fertilité, budget).
+
+    Quelques dizaines de combinaisons possibles: le plan et son coût par
+    hectare sont construits une fois par triplet, chaque appel n'effectue
+    plus que la mise à l'échelle par la superficie.
+    """
+    base = _BASE_NEEDS_VEC.get(crop, _BASE_NEEDS_VEC["maïs"])
+    fertility_factor = _FERTILITY_FACTORS.get(soil_fertility, 1.0)
+    adjusted = base * fertility_factor
+    adjusted_needs = {n: float(adjusted[i]) for i, n in enumerate(_FERT_NUTRIENTS)}
+
+    # Plan de fertilisation (quantités et coûts par hectare)
+    plan = []
+    remaining = adjusted.copy()
+    cost_per_ha = 0
+
+    # Engrais organiques de base (toujours recommandés)
+    organic_base = {
+        "product": "compost",
+        "quantity_per_ha": 5,  # tonnes
+        "nutrient_supply": {"N": 75, "P2O5": 50, "K2O": 75},
+        "cost_per_unit": 10000,  # FCFA/tonne
+        "application_timing": "avant plantation",
+        "benefits": ["améliore structure sol", "stimule vie microbienne", "libération lente"]
+    }
+
+    plan.append(organic_base)
+    cost_per_ha += organic_base["quantity_per_ha"] * organic_base["cost_per_unit"]
+
+    # Réduction des besoins par apport organique, bornée à zéro en une passe
+    np.maximum(remaining - _ORGANIC_SUPPLY_VEC, 0.0, out=remaining)
+
+    # Compléments minéraux si nécessaire: un seul masque booléen sur le bilan
+    # restant, puis un parcours piloté par _FERTILIZER_SPECS
+    for i in np.nonzero(remaining > 20)[0]:
+        spec = _FERTILIZER_SPECS.get(_FERT_NUTRIENTS[i])
+        if spec is None:
+            continue  # pas de complément minéral dédié pour ce nutriment
+        need = float(remaining[i])
+        extra_key, extra_value = spec["extra"]
+        fertilizer = {
+            "product": spec["product"],
+            "quantity_per_ha": need / spec["analysis"],
+            "nutrient_supply": {_FERT_NUTRIENTS[i]: need},
+            "cost_per_unit": spec["cost_per_unit"],
+            "application_timing": spec["application_timing"],
+            extra_key: extra_value,
+        }
+        plan.append(fertilizer)
+        cost_per_ha += fertilizer["quantity_per_ha"] * fertilizer["cost_per_unit"]
+
+    return adjusted_needs, tuple(plan), cost_per_ha
+
+
+async def recommend_fertilizers(
     crop: str,
     area_hectares: float,
     tool_context: ToolContext,
@@ -208,116 +763,32 @@ def recommend_fertilizers(
     Returns:
         Plan de fertilisation détaillé
     """
-    # Besoins nutritifs par culture (kg/ha)
-    nutrient_needs = {
-        "cacao": {"N": 120, "P2O5": 40, "K2O": 150, "Ca": 80, "Mg": 30},
-        "café": {"N": 150, "P2O5": 50, "K2O": 180, "Ca": 100, "Mg": 40},
-        "maïs": {"N": 200, "P2O5": 80, "K2O": 160, "Ca": 50, "Mg": 25},
-        "manioc": {"N": 80, "P2O5": 40, "K2O": 120, "Ca": 30, "Mg": 15},
-        "plantain": {"N": 250, "P2O5": 100, "K2O": 300, "Ca": 120, "Mg": 50},
-        "arachide": {"N": 30, "P2O5": 60, "K2O": 80, "Ca": 80, "Mg": 20}
-    }
-    
-    # Facteurs de correction selon fertilité
-    fertility_factors = {
-        "faible": 1.3,
-        "moyenne": 1.0,
-        "bonne": 0.8,
-        "élevée": 0.6
-    }
-    
-    # Obtenir les besoins ajustés
-    base_needs = nutrient_needs.get(crop, nutrient_needs["maïs"])
-    fertility_factor = fertility_factors.get(soil_fertility, 1.0)
-    adjusted_needs = {k: v * fertility_factor for k, v in base_needs.items()}
-    
-    # Sélection d'engrais selon budget
-    if budget_level == "limité":
-        fertilizer_priority = ["fumier_bovin", "compost", "cendres_bois"]
-        max_chemical_percent = 20
-    elif budget_level == "modéré":
-        fertilizer_priority = ["compost", "npk_1520", "fumier_bovin"]
-        max_chemical_percent = 50
-    else:  # élevé
-        fertilizer_priority = ["npk_1520", "urée", "compost"]
-        max_chemical_percent = 80
-    
-    # Plan de fertilisation
-    fertilization_plan = []
-    remaining_needs = adjusted_needs.copy()
-    total_cost = 0
-    
-    # Engrais organiques de base (toujours recommandés)
-    organic_base = {
-        "product": "compost",
-        "quantity_per_ha": 5,  # tonnes
-        "total_quantity": 5 * area_hectares,
-        "nutrient_supply": {"N": 75, "P2O5": 50, "K2O": 75},
-        "cost_per_unit": 10000,  # FCFA/tonne
-        "application_timing": "avant plantation",
-        "benefits": ["améliore structure sol", "stimule vie microbienne", "libération lente"]
-    }
-    
-    fertilization_plan.append(organic_base)
-    total_cost += organic_base["total_quantity"] * organic_base["cost_per_unit"]
-    
-    # Réduction des besoins par apport organique
-    for nutrient, supply in organic_base["nutrient_supply"].items():
-        if nutrient in remaining_needs:
-            remaining_needs[nutrient] = max(0, remaining_needs[nutrient] - supply)
-    
-    # Compléments minéraux si nécessaire
-    if any(need > 20 for need in remaining_needs.values()):
-        if remaining_needs["N"] > 20:
-            n_fertilizer = {
-                "product": "urée (46% N)",
-                "quantity_per_ha": remaining_needs["N"] / 0.46,
-                "total_quantity": (remaining_needs["N"] / 0.46) * area_hectares,
-                "nutrient_supply": {"N": remaining_needs["N"]},
-                "cost_per_unit": 450,  # FCFA/kg
-                "application_timing": "fractionnée (plantation + 45j + 90j)",
-                "precautions": ["appliquer avant pluie", "ne pas mettre sur feuilles"]
-            }
-            fertilization_plan.append(n_fertilizer)
-            total_cost += n_fertilizer["total_quantity"] * n_fertilizer["cost_per_unit"]
-        
-        if remaining_needs["P2O5"] > 20:
-            p_fertilizer = {
-                "product": "phosphate naturel",
-                "quantity_per_ha": remaining_needs["P2O5"] / 0.28,
-                "total_quantity": (remaining_needs["P2O5"] / 0.28) * area_hectares,
-                "nutrient_supply": {"P2O5": remaining_needs["P2O5"]},
-                "cost_per_unit": 300,  # FCFA/kg
-                "application_timing": "à la plantation",
-                "benefits": ["effet résiduel long", "améliore enracinement"]
-            }
-            fertilization_plan.append(p_fertilizer)
-            total_cost += p_fertilizer["total_quantity"] * p_fertilizer["cost_per_unit"]
-    
+    adjusted_needs, plan_template, cost_per_ha = _fertilization_template(
+        crop, soil_fertility, budget_level
+    )
+
+    # Mise à l'échelle par la superficie: seule partie propre à l'appel
+    fertilization_plan = [
+        {**entry, "total_quantity": entry["quantity_per_ha"] * area_hectares}
+        for entry in plan_template
+    ]
+    total_cost = cost_per_ha * area_hectares
+
     # Utiliser Gemini pour les recommandations
-    prompt = f"""
-    Plan de fertilisation pour {crop} au Cameroun:
-    
-    Superficie: {area_hectares} ha
-    Fertilité sol: {soil_fertility}
-    Budget: {budget_level}
-    Besoins nutritifs ajustés: {adjusted_needs}
-    
-    Plan proposé: {fertilization_plan}
-    Coût total: {total_cost:,.0f} FCFA
-    
-    Optimise le plan en considérant:
-    1. Efficacité agronomique des apports
-    2. Fractionnement et timing d'application
-    3. Compatibilités et synergies entre engrais
-    4. Alternatives locales moins coûteuses
-    5. Méthodes d'application recommandées
-    6. Précautions d'usage et stockage
-    7. Indicateurs de suivi d'efficacité
-    """
-    
-    response = model.generate_content(prompt)
+    prompt = _FERTILIZATION_PREFIX + (
+        f"\n- Culture: {crop} | Superficie: {area_hectares} ha"
+        f"\n- Fertilité sol: {soil_fertility} | Budget: {budget_level}"
+        f"\n- Besoins nutritifs ajustés: {_fmt_compact(adjusted_needs)}"
+        f"\n- Plan proposé: {_fmt_compact(fertilization_plan)}"
+        f"\n- Coût total: {total_cost:,.0f} FCFA"
+    )
     
+    response = await _generate(
+        prompt,
+        tool_context,
+        cache_key=("fertilizers", crop, _narrative_bucket(area_hectares), soil_fertility, budget_level),
+    )
+
     return {
         "crop": crop,
         "area_hectares": area_hectares,
@@ -337,88 +808,21 @@ def recommend_fertilizers(
     }
 
 
-def optimize_irrigation(
-    crop: str,
-    region: str,
-    area_hectares: float,
-    tool_context: ToolContext,
-    water_source: str = "pluie",
-) -> Dict[str, Any]:
-    """Optimise la gestion de l'irrigation.
-    
-    Args:
-        crop: Type de culture
-        region: Région de culture
-        area_hectares: Superficie à irriguer
-        water_source: Source d'eau disponible
-        tool_context: Contexte de l'outil
-        
-    Returns:
-        Plan d'irrigation optimisé
+@functools.cache
+def _irrigation_template(crop: str, region: str):
+    """Bilan hydrique et système recommandé pour un couple (culture, région).
+
+    Tout le volet déterministe de l'irrigation (déficit, choix du système,
+    calendrier) ne dépend que de ce couple: il est calculé une fois puis
+    rejoué, seule la mise à l'échelle par la superficie reste par appel.
     """
-    # Besoins en eau par culture (mm/cycle)
-    water_requirements = {
-        "cacao": {"min": 1200, "optimal": 1800, "critical_periods": ["floraison", "développement fruits"]},
-        "café": {"min": 1000, "optimal": 1500, "critical_periods": ["floraison", "grossissement grains"]},
-        "maïs": {"min": 450, "optimal": 600, "critical_periods": ["floraison", "remplissage grains"]},
-        "manioc": {"min": 600, "optimal": 1000, "critical_periods": ["établissement", "tubérisation"]},
-        "plantain": {"min": 1200, "optimal": 1800, "critical_periods": ["toute l'année"]},
-        "arachide": {"min": 400, "optimal": 550, "critical_periods": ["floraison", "formation gousses"]}
-    }
-    
-    # Précipitations moyennes par région (mm/an)
-    regional_rainfall = {
-        "Centre": 1400,
-        "Littoral": 2800,
-        "Ouest": 1800,
-        "Sud": 1600,
-        "Est": 1500,
-        "Nord": 1000,
-        "Adamaoua": 1300,
-        "Extrême-Nord": 600,
-        "Nord-Ouest": 1600,
-        "Sud-Ouest": 3000
-    }
-    
-    crop_needs = water_requirements.get(crop, water_requirements["maïs"])
-    annual_rainfall = regional_rainfall.get(region, 1200)
-    
+    crop_needs = _WATER_REQUIREMENTS.get(crop, _WATER_REQUIREMENTS["maïs"])
+    annual_rainfall = _REGIONAL_RAINFALL.get(region, 1200)
+
     # Calcul du déficit hydrique
     water_deficit = max(0, crop_needs["optimal"] - annual_rainfall)
     irrigation_needed = water_deficit > 100  # Si déficit > 100mm
-    
-    # Systèmes d'irrigation recommandés
-    irrigation_systems = {
-        "goutte_à_goutte": {
-            "efficiency": 0.9,
-            "cost_per_ha": 800000,
-            "water_saving": 0.5,
-            "suitable_crops": ["maraîchage", "arbres fruitiers"],
-            "maintenance": "modérée"
-        },
-        "aspersion": {
-            "efficiency": 0.75,
-            "cost_per_ha": 400000,
-            "water_saving": 0.3,
-            "suitable_crops": ["céréales", "légumineuses"],
-            "maintenance": "élevée"
-        },
-        "gravitaire": {
-            "efficiency": 0.6,
-            "cost_per_ha": 150000,
-            "water_saving": 0.1,
-            "suitable_crops": ["riz", "maraîchage"],
-            "maintenance": "faible"
-        },
-        "micro_aspersion": {
-            "efficiency": 0.8,
-            "cost_per_ha": 600000,
-            "water_saving": 0.4,
-            "suitable_crops": ["plantain", "agrumes"],
-            "maintenance": "modérée"
-        }
-    }
-    
+
     # Recommandation système selon culture et budget
     if crop in ["cacao", "café", "plantain"]:
         recommended_system = "micro_aspersion"
@@ -426,10 +830,9 @@ def optimize_irrigation(
         recommended_system = "aspersion"
     else:
         recommended_system = "goutte_à_goutte"
-    
-    system_data = irrigation_systems[recommended_system]
-    total_cost = system_data["cost_per_ha"] * area_hectares
-    
+
+    system_data = _IRRIGATION_SYSTEMS[recommended_system]
+
     # Calendrier d'irrigation
     irrigation_schedule = {
         "fréquence": "tous les 3-5 jours selon saison",
@@ -441,42 +844,50 @@ def optimize_irrigation(
             "début_pluies": "réduction progressive"
         }
     }
+
+    return (crop_needs, annual_rainfall, water_deficit, irrigation_needed,
+            recommended_system, system_data, irrigation_schedule)
+
+
+async def optimize_irrigation(
+    crop: str,
+    region: str,
+    area_hectares: float,
+    tool_context: ToolContext,
+    water_source: str = "pluie",
+) -> Dict[str, Any]:
+    """Optimise la gestion de l'irrigation.
     
-    # Techniques de conservation de l'eau
-    water_conservation = [
-        {"technique": "Paillage", "water_saving": 30, "cost_fcfa": 20000, "implementation": "facile"},
-        {"technique": "Brise-vent", "water_saving": 15, "cost_fcfa": 50000, "implementation": "moyenne"},
-        {"technique": "Récupération eau pluie", "water_saving": 0, "cost_fcfa": 100000, "implementation": "complexe"},
-        {"technique": "Amélioration sol", "water_saving": 25, "cost_fcfa": 30000, "implementation": "facile"}
-    ]
-    
-    # Utiliser Gemini pour l'optimisation
-    prompt = f"""
-    Optimisation irrigation pour {crop} en région {region} du Cameroun:
-    
-    Besoins en eau: {crop_needs}
-    Précipitations région: {annual_rainfall} mm/an
-    Déficit hydrique: {water_deficit} mm
-    Superficie: {area_hectares} ha
-    Source d'eau: {water_source}
-    
-    Système recommandé: {recommended_system}
-    Coût installation: {total_cost:,.0f} FCFA
-    Techniques conservation: {water_conservation}
-    
-    Propose un plan complet incluant:
-    1. Stratégie d'irrigation adaptée à la région
-    2. Dimensionnement du système (débit, réservoirs)
-    3. Calendrier d'irrigation précis
-    4. Techniques complémentaires d'économie d'eau
-    5. Coûts d'exploitation annuels
-    6. Retour sur investissement estimé
-    7. Maintenance préventive requise
-    8. Alternatives en cas de pénurie d'eau
+    Args:
+        crop: Type de culture
+        region: Région de culture
+        area_hectares: Superficie à irriguer
+        water_source: Source d'eau disponible
+        tool_context: Contexte de l'outil
+        
+    Returns:
+        Plan d'irrigation optimisé
     """
+    (crop_needs, annual_rainfall, water_deficit, irrigation_needed,
+     recommended_system, system_data, irrigation_schedule) = _irrigation_template(crop, region)
+    total_cost = system_data["cost_per_ha"] * area_hectares
+
+    # Utiliser Gemini pour l'optimisation
+    prompt = _IRRIGATION_PREFIX + (
+        f"\n- Culture: {crop} | Région: {region} | Superficie: {area_hectares} ha"
+        f"\n- Besoins en eau: {_fmt_compact(crop_needs)}"
+        f"\n- Précipitations région: {annual_rainfall} mm/an | Déficit hydrique: {water_deficit} mm"
+        f"\n- Source d'eau: {water_source}"
+        f"\n- Système recommandé: {recommended_system} | Coût installation: {total_cost:,.0f} FCFA"
+        f"\n- Techniques conservation: {_WATER_CONSERVATION_JSON}"
+    )
     
-    response = model.generate_content(prompt)
-    
+    response = await _generate(
+        prompt,
+        tool_context,
+        cache_key=("irrigation", crop, region, _narrative_bucket(area_hectares), water_source),
+    )
+
     return {
         "crop": crop,
         "region": region,
@@ -494,12 +905,12 @@ def optimize_irrigation(
             "total_cost": total_cost
         },
         "irrigation_schedule": irrigation_schedule,
-        "conservation_techniques": water_conservation,
+        "conservation_techniques": _WATER_CONSERVATION,
         "optimization_plan": response.text
     }
 
 
-def assess_land_suitability(
+async def assess_land_suitability(
     crop: str,
     region: str,
     terrain_characteristics: Dict[str, Any],
@@ -516,76 +927,46 @@ def assess_land_suitability(
     Returns:
         Évaluation complète de l'aptitude du terrain
     """
-    # Critères d'aptitude par culture
-    suitability_criteria = {
-        "cacao": {
-            "altitude": {"min": 0, "max": 800},
-            "pente": {"max": 30},
-            "drainage": ["bien drainé", "modérément drainé"],
-            "exposition": ["ombragé", "mi-ombre"],
-            "ph": {"min": 5.5, "max": 7.0}
-        },
-        "café": {
-            "altitude": {"min": 500, "max": 2000},
-            "pente": {"max": 45},
-            "drainage": ["bien drainé"],
-            "exposition": ["mi-ombre", "ombragé"],
-            "ph": {"min": 6.0, "max": 7.0}
-        },
-        "maïs": {
-            "altitude": {"min": 0, "max": 1500},
-            "pente": {"max": 15},
-            "drainage": ["bien drainé", "modérément drainé"],
-            "exposition": ["plein soleil"],
-            "ph": {"min": 5.8, "max": 7.2}
-        }
-    }
-    
-    # Évaluation par critère
-    criteria = suitability_criteria.get(crop, suitability_criteria["maïs"])
+    # Évaluation par critère: les trois critères numériques se notent en un
+    # passage vectorisé sur la matrice de seuils (3 = dans l'intervalle,
+    # 2 = dans la marge de tolérance, 1 = hors limites).
+    criteria = _SUITABILITY_CRITERIA.get(crop, _SUITABILITY_CRITERIA["maïs"])
+    bounds = _SUITABILITY_BOUNDS.get(crop, _SUITABILITY_BOUNDS["maïs"])
+
+    present = [i for i, c in enumerate(_SUITABILITY_NUMERIC) if c in terrain_characteristics]
+    numeric_scores = {}
+    if present:
+        sel = bounds[present]
+        vals = np.array(
+            [terrain_characteristics[_SUITABILITY_NUMERIC[i]] for i in present],
+            dtype=np.float32,
+        )
+        inside = (vals >= sel[:, 0]) & (vals <= sel[:, 1])
+        near = (np.abs(vals - sel[:, 0]) <= sel[:, 2]) | (np.abs(vals - sel[:, 1]) <= sel[:, 2])
+        scores = np.where(inside, 3, np.where(near, 2, 1))
+        numeric_scores = {_SUITABILITY_NUMERIC[i]: int(s) for i, s in zip(present, scores)}
+
     evaluation = {}
     overall_score = 0
     max_score = 0
-    
+
     for criterion, requirements in criteria.items():
         if criterion in terrain_characteristics:
             value = terrain_characteristics[criterion]
-            
-            if criterion == "altitude":
-                if requirements["min"] <= value <= requirements["max"]:
-                    score = 3  # Excellent
-                elif abs(value - requirements["min"]) <= 200 or abs(value - requirements["max"]) <= 200:
-                    score = 2  # Bon
-                else:
-                    score = 1  # Marginal
-                    
-            elif criterion == "pente":
-                if value <= requirements["max"]/2:
-                    score = 3
-                elif value <= requirements["max"]:
-                    score = 2
-                else:
-                    score = 1
-                    
+
+            if criterion in numeric_scores:
+                score = numeric_scores[criterion]
             elif criterion == "drainage":
                 score = 3 if value in requirements else 1
-                
-            elif criterion == "ph":
-                if requirements["min"] <= value <= requirements["max"]:
-                    score = 3
-                elif abs(value - requirements["min"]) <= 0.5 or abs(value - requirements["max"]) <= 0.5:
-                    score = 2
-                else:
-                    score = 1
             else:
-                score = 2  # Score par défaut
-            
+                score = 2  # Score par défaut (exposition, etc.)
+
             evaluation[criterion] = {
                 "value": value,
                 "score": score,
                 "status": ["inadéquat", "marginal", "bon", "excellent"][score]
             }
-            
+
             overall_score += score
             max_score += 3
     
@@ -622,28 +1003,21 @@ def assess_land_suitability(
                     })
     
     # Utiliser Gemini pour l'évaluation
-    prompt = f"""
-    Évaluation aptitude terrain pour {crop} en région {region} du Cameroun:
-    
-    Caractéristiques terrain: {terrain_characteristics}
-    Critères culture: {criteria}
-    Évaluation par critère: {evaluation}
-    
-    Aptitude globale: {suitability_class} ({suitability_percent:.1f}%)
-    Améliorations identifiées: {improvements}
-    
-    Fournis une évaluation détaillée incluant:
-    1. Analyse de l'aptitude par critère
-    2. Facteurs limitants principaux
-    3. Potentiel de production estimé
-    4. Plan d'amélioration si nécessaire
-    5. Alternatives culturales mieux adaptées
-    6. Risques et contraintes à surveiller
-    7. Investissements requis pour optimisation
-    """
-    
-    response = model.generate_content(prompt)
+    prompt = _SUITABILITY_PREFIX + (
+        f"\n- Culture: {crop} | Région: {region}"
+        f"\n- Caractéristiques terrain: {_fmt_compact(terrain_characteristics)}"
+        f"\n- Critères culture: {_fmt_compact(criteria)}"
+        f"\n- Évaluation par critère: {_fmt_compact(evaluation)}"
+        f"\n- Aptitude globale: {suitability_class} ({suitability_percent:.1f}%)"
+        f"\n- Améliorations identifiées: {_fmt_compact(improvements)}"
+    )
     
+    response = await _generate(
+        prompt,
+        tool_context,
+        cache_key=("land_suitability", crop, region, tuple(sorted(terrain_characteristics.items()))),
+    )
+
     return {
         "crop": crop,
         "region": region,
@@ -659,7 +1033,7 @@ def assess_land_suitability(
     }
 
 
-def calculate_nutrient_needs(
+async def calculate_nutrient_needs(
     crop: str,
     target_yield: float,
     tool_context: ToolContext,
@@ -676,110 +1050,69 @@ def calculate_nutrient_needs(
     Returns:
         Calcul détaillé des besoins nutritifs
     """
-    # Besoins unitaires par kg de produit (g/kg produit)
-    nutrient_uptake = {
-        "cacao": {"N": 25, "P": 3, "K": 35, "Ca": 8, "Mg": 4, "S": 2},
-        "café": {"N": 20, "P": 2, "K": 25, "Ca": 5, "Mg": 3, "S": 1.5},
-        "maïs": {"N": 15, "P": 3, "K": 8, "Ca": 2, "Mg": 2, "S": 1},
-        "manioc": {"N": 5, "P": 1, "K": 8, "Ca": 3, "Mg": 1, "S": 0.5},
-        "plantain": {"N": 12, "P": 1.5, "K": 20, "Ca": 4, "Mg": 2, "S": 1},
-        "arachide": {"N": 40, "P": 4, "K": 12, "Ca": 8, "Mg": 3, "S": 2}
-    }
-    
-    # Coefficients d'efficacité des engrais
-    fertilizer_efficiency = {
-        "N": 0.6,  # 60% du N appliqué utilisé
-        "P": 0.2,  # 20% du P appliqué utilisé
-        "K": 0.8,  # 80% du K appliqué utilisé
-        "Ca": 0.7,
-        "Mg": 0.6,
-        "S": 0.5
-    }
-    
-    # Calcul besoins bruts
-    uptake_data = nutrient_uptake.get(crop, nutrient_uptake["maïs"])
-    gross_needs = {}
-    
-    for nutrient, uptake_per_kg in uptake_data.items():
-        gross_need = (target_yield * uptake_per_kg) / 1000  # kg/ha
-        # Ajustement pour efficacité engrais
-        net_need = gross_need / fertilizer_efficiency.get(nutrient, 0.6)
-        gross_needs[nutrient] = {
-            "uptake_kg": gross_need,
-            "fertilizer_needed_kg": net_need
+    # Calcul besoins bruts, vectorisé: prélèvement × rendement, puis division
+    # par l'efficacité des engrais — deux opérations sur le vecteur complet
+    uptake = _UPTAKE_VEC.get(crop, _UPTAKE_VEC["maïs"])
+    gross = uptake * target_yield / 1000.0  # kg/ha
+    net = gross / _EFFICIENCY_VEC
+
+    gross_needs = {
+        nutrient: {
+            "uptake_kg": float(gross[i]),
+            "fertilizer_needed_kg": float(net[i]),
         }
-    
+        for i, nutrient in enumerate(_NUTRIENTS)
+    }
+
     # Ajustements selon analyse de sol
     soil_corrections = {}
     if soil_analysis:
-        # Niveaux critiques de référence
-        critical_levels = {
-            "ph": 6.0,
-            "organic_matter": 3.0,
-            "available_P": 15,  # ppm
-            "exchangeable_K": 120,  # ppm
-            "exchangeable_Ca": 2000,  # ppm
-            "exchangeable_Mg": 240   # ppm
-        }
-        
-        for nutrient, critical in critical_levels.items():
+        for nutrient, critical in _CRITICAL_LEVELS.items():
             if nutrient in soil_analysis:
                 current = soil_analysis[nutrient]
                 if current < critical:
                     deficit_ratio = (critical - current) / critical
                     if nutrient == "available_P":
-                        soil_corrections["P"] = gross_needs["P"]["fertilizer_needed_kg"] * (1 + deficit_ratio)
+                        soil_corrections["P"] = float(net[_NUTRIENT_IDX["P"]]) * (1 + deficit_ratio)
                     elif nutrient == "exchangeable_K":
-                        soil_corrections["K"] = gross_needs["K"]["fertilizer_needed_kg"] * (1 + deficit_ratio)
-    
-    # Plan de fertilisation
+                        soil_corrections["K"] = float(net[_NUTRIENT_IDX["K"]]) * (1 + deficit_ratio)
+
+    # Répartition des apports: un broadcast des fractions par passage sur le
+    # vecteur des besoins totaux, reconverti en dicts pour le résultat JSON
+    total = net.copy()
+    for nutrient, corrected in soil_corrections.items():
+        total[_NUTRIENT_IDX[nutrient]] = corrected
+    schedule = _SCHEDULE_MATRIX * total[None, :]
+
     fertilization_schedule = {
-        "basal": {},  # À la plantation
-        "side_dress_1": {},  # Premier apport de couverture
-        "side_dress_2": {},  # Deuxième apport de couverture
-        "foliar": {}  # Applications foliaires
+        stage: {
+            _NUTRIENTS[i]: float(amounts[i])
+            for i in range(len(_NUTRIENTS))
+            if fractions[i] > 0
+        }
+        for stage, fractions, amounts in zip(_SCHEDULE_STAGES, _SCHEDULE_MATRIX, schedule)
     }
     
-    # Répartition des apports
-    for nutrient, needs in gross_needs.items():
-        total_need = soil_corrections.get(nutrient, needs["fertilizer_needed_kg"])
-        
-        if nutrient == "N":
-            fertilization_schedule["basal"]["N"] = total_need * 0.3
-            fertilization_schedule["side_dress_1"]["N"] = total_need * 0.4
-            fertilization_schedule["side_dress_2"]["N"] = total_need * 0.3
-        elif nutrient == "P":
-            fertilization_schedule["basal"]["P"] = total_need
-        elif nutrient == "K":
-            fertilization_schedule["basal"]["K"] = total_need * 0.5
-            fertilization_schedule["side_dress_1"]["K"] = total_need * 0.3
-            fertilization_schedule["side_dress_2"]["K"] = total_need * 0.2
-        else:
-            fertilization_schedule["basal"][nutrient] = total_need
-    
     # Utiliser Gemini pour l'analyse
-    prompt = f"""
-    Calcul besoins nutritifs pour {crop} au Cameroun:
-    
-    Rendement cible: {target_yield} kg/ha
-    Besoins bruts calculés: {gross_needs}
-    Analyse de sol: {soil_analysis or 'Non disponible'}
-    Corrections sol: {soil_corrections}
-    
-    Programme fertilisation: {fertilization_schedule}
-    
-    Optimise le calcul en considérant:
-    1. Précision des besoins selon le rendement cible
-    2. Ajustements selon fertilité du sol
-    3. Fractionnement optimal des apports
-    4. Formes d'engrais les plus appropriées
-    5. Interactions entre nutriments
-    6. Facteurs climatiques et saisonniers
-    7. Coût du programme et alternatives
-    """
-    
-    response = model.generate_content(prompt)
+    prompt = _NUTRIENT_NEEDS_PREFIX + (
+        f"\n- Culture: {crop} | Rendement cible: {target_yield} kg/ha"
+        f"\n- Besoins bruts calculés: {_fmt_compact(gross_needs)}"
+        f"\n- Analyse de sol: {_fmt_compact(soil_analysis) if soil_analysis else 'Non disponible'}"
+        f"\n- Corrections sol: {_fmt_compact(soil_corrections)}"
+        f"\n- Programme fertilisation: {_fmt_compact(fertilization_schedule)}"
+    )
     
+    response = await _generate(
+        prompt,
+        tool_context,
+        cache_key=(
+            "nutrient_needs",
+            crop,
+            _narrative_bucket(target_yield),
+            tuple(sorted(soil_analysis.items())) if soil_analysis else None,
+        ),
+    )
+
     return {
         "crop": crop,
         "target_yield": target_yield,
@@ -795,7 +1128,17 @@ def calculate_nutrient_needs(
     }
 
 
-def suggest_soil_amendments(
+def _amendment_entry(name: str, quantity: float) -> Dict[str, Any]:
+    """Entrée d'amendement prête à retourner: base figée + champs par appel.
+
+    Seuls quantity_needed et total_cost varient d'un appel à l'autre; les
+    champs descriptifs sont partagés depuis _AMENDMENTS sans copie mutée.
+    """
+    base = _AMENDMENTS[name]
+    return {**base, "quantity_needed": quantity, "total_cost": quantity * base["cost_per_tonne"]}
+
+
+async def suggest_soil_amendments(
     soil_ph: float,
     organic_matter: float,
     main_constraints: List[str],
@@ -814,58 +1157,6 @@ def suggest_soil_amendments(
     Returns:
         Plan d'amendement du sol
     """
-    # Amendements disponibles
-    amendments = {
-        "chaux_agricole": {
-            "purpose": "correction acidité",
-            "ph_range": {"min": 4.0, "max": 6.0},
-            "application_rate": "2-4 t/ha",
-            "cost_per_tonne": 50000,
-            "effect_duration": "2-3 ans",
-            "benefits": ["augmente pH", "apporte Ca", "améliore structure"]
-        },
-        "dolomie": {
-            "purpose": "correction acidité + Mg",
-            "ph_range": {"min": 4.0, "max": 6.0},
-            "application_rate": "1.5-3 t/ha",
-            "cost_per_tonne": 55000,
-            "effect_duration": "3-4 ans",
-            "benefits": ["augmente pH", "apporte Ca et Mg", "action plus douce"]
-        },
-        "compost": {
-            "purpose": "matière organique",
-            "mo_threshold": 3.0,
-            "application_rate": "10-20 t/ha",
-            "cost_per_tonne": 10000,
-            "effect_duration": "1-2 ans",
-            "benefits": ["améliore structure", "fertilité", "rétention eau", "vie microbienne"]
-        },
-        "fumier_décomposé": {
-            "purpose": "matière organique + nutriments",
-            "mo_threshold": 2.5,
-            "application_rate": "15-25 t/ha",
-            "cost_per_tonne": 12000,
-            "effect_duration": "1-2 ans",
-            "benefits": ["nutrition", "structure", "activité biologique"]
-        },
-        "gypse": {
-            "purpose": "amélioration sols sodiques",
-            "constraints": ["excès sodium", "compaction"],
-            "application_rate": "2-5 t/ha",
-            "cost_per_tonne": 30000,
-            "effect_duration": "2-3 ans",
-            "benefits": ["améliore infiltration", "réduit compaction"]
-        },
-        "biochar": {
-            "purpose": "amélioration physico-chimique",
-            "universal": True,
-            "application_rate": "2-5 t/ha",
-            "cost_per_tonne": 80000,
-            "effect_duration": "10+ ans",
-            "benefits": ["séquestration carbone", "rétention nutriments", "structure"]
-        }
-    }
-    
     # Sélection selon contraintes
     recommended_amendments = []
     total_cost = 0
@@ -874,15 +1165,10 @@ def suggest_soil_amendments(
     if soil_ph < 5.5:
         lime_needed = (6.0 - soil_ph) * 2  # Estimation simplifiée
         if "carence magnésium" in main_constraints:
-            amendment = amendments["dolomie"].copy()
-            amendment["quantity_needed"] = min(3.0, lime_needed)
+            amendment = _amendment_entry("dolomie", min(3.0, lime_needed))
         else:
-            amendment = amendments["chaux_agricole"].copy()
-            amendment["quantity_needed"] = min(4.0, lime_needed)
-        
-        cost = amendment["quantity_needed"] * amendment["cost_per_tonne"]
-        amendment["total_cost"] = cost
-        total_cost += cost
+            amendment = _amendment_entry("chaux_agricole", min(4.0, lime_needed))
+        total_cost += amendment["total_cost"]
         recommended_amendments.append(amendment)
     
     # Amélioration matière organique
@@ -890,21 +1176,15 @@ def suggest_soil_amendments(
         mo_deficit = 3.0 - organic_matter
         compost_needed = mo_deficit * 10  # Estimation
         
-        amendment = amendments["compost"].copy()
-        amendment["quantity_needed"] = min(20, compost_needed)
-        cost = amendment["quantity_needed"] * amendment["cost_per_tonne"]
-        amendment["total_cost"] = cost
-        total_cost += cost
+        amendment = _amendment_entry("compost", min(20, compost_needed))
+        total_cost += amendment["total_cost"]
         recommended_amendments.append(amendment)
     
     # Contraintes spécifiques
     if "compaction" in main_constraints:
         if total_cost < (budget_fcfa or float('inf')):
-            amendment = amendments["gypse"].copy()
-            amendment["quantity_needed"] = 3.0
-            cost = amendment["quantity_needed"] * amendment["cost_per_tonne"]
-            amendment["total_cost"] = cost
-            total_cost += cost
+            amendment = _amendment_entry("gypse", 3.0)
+            total_cost += amendment["total_cost"]
             recommended_amendments.append(amendment)
     
     # Filtrage selon budget
@@ -938,31 +1218,27 @@ def suggest_soil_amendments(
             application_schedule["entretien_annuel"].append(amendment)
     
     # Utiliser Gemini pour les recommandations
-    prompt = f"""
-    Plan d'amendement du sol au Cameroun:
-    
-    État actuel:
-    - pH: {soil_ph}
-    - Matière organique: {organic_matter}%
-    - Contraintes: {', '.join(main_constraints)}
-    - Budget: {budget_fcfa or 'Non limité'} FCFA
-    
-    Amendements recommandés: {recommended_amendments}
-    Coût total: {total_cost:,.0f} FCFA
-    Calendrier: {application_schedule}
-    
-    Optimise le plan en considérant:
-    1. Priorités d'intervention selon l'urgence
-    2. Synergies entre amendements
-    3. Méthodes d'application optimales
-    4. Suivi et évaluation des résultats
-    5. Alternatives moins coûteuses
-    6. Planning pluriannuel d'amélioration
-    7. Indicateurs de réussite du programme
-    """
-    
-    response = model.generate_content(prompt)
+    prompt = _AMENDMENT_PREFIX + (
+        f"\n- pH: {soil_ph} | Matière organique: {organic_matter}%"
+        f"\n- Contraintes: {', '.join(main_constraints)}"
+        f"\n- Budget: {budget_fcfa or 'Non limité'} FCFA"
+        f"\n- Amendements recommandés: {_fmt_compact(recommended_amendments)}"
+        f"\n- Coût total: {total_cost:,.0f} FCFA"
+        f"\n- Calendrier: {_fmt_compact(application_schedule)}"
+    )
     
+    response = await _generate(
+        prompt,
+        tool_context,
+        cache_key=(
+            "amendments",
+            round(soil_ph, 1),
+            round(organic_matter, 1),
+            tuple(main_constraints),
+            _narrative_bucket(budget_fcfa) if budget_fcfa else None,
+        ),
+    )
+
     return {
         "soil_status": {
             "ph": soil_ph,
@@ -980,4 +1256,197 @@ def suggest_soil_amendments(
             "organic_matter_target": min(4.0, organic_matter + 1.0),
             "timeline_months": "6-12 mois pour effets visibles"
         }
-    }
\ No newline at end of file
+    }
+
+
+async def run_resource_bundle(
+    crop: str,
+    region: str,
+    area_hectares: float,
+    tool_context: ToolContext,
+) -> Dict[str, Any]:
+    """Lance en parallèle les trois analyses principales d'une parcelle.
+
+    Sol, fertilisation et irrigation sont indépendants pour une même
+    parcelle: les trois allers-retours Gemini se recouvrent via
+    `asyncio.gather`, ramenant le temps total d'environ trois fois à une
+    fois la latence d'un appel.
+
+    Args:
+        crop: Type de culture
+        region: Région de la parcelle
+        area_hectares: Superficie concernée
+        tool_context: Contexte de l'outil
+
+    Returns:
+        Les trois analyses regroupées par volet
+    """
+    soil, fertilizers, irrigation = await asyncio.gather(
+        analyze_soil_requirements(crop, region, tool_context),
+        recommend_fertilizers(crop, area_hectares, tool_context),
+        optimize_irrigation(crop, region, area_hectares, tool_context),
+    )
+    return {"soil": soil, "fertilization": fertilizers, "irrigation": irrigation}
+
+
+# Profils pédologiques par grande zone agro-écologique, sortis du prompt
+# d'instruction: le modèle ne charge le bloc que lorsqu'il en a besoin.
+_SOIL_ZONE_PROFILES = {
+    "forestière": {
+        "regions": ["Sud", "Centre", "Est"],
+        "soil_type": "Sols ferrallitiques (oxisols)",
+        "ph": "acide (4.5-5.5)",
+        "characteristics": [
+            "forte lixiviation",
+            "pauvres en bases échangeables",
+            "riches en fer et aluminium",
+        ],
+    },
+    "savane": {
+        "regions": ["Adamaoua", "Nord"],
+        "soil_type": "Sols ferrugineux tropicaux",
+        "ph": "légèrement acide à neutre (5.5-6.5)",
+        "characteristics": [
+            "texture sablo-argileuse",
+            "carence en phosphore",
+            "matière organique variable",
+        ],
+    },
+    "hauts plateaux": {
+        "regions": ["Ouest", "Nord-Ouest"],
+        "soil_type": "Sols volcaniques (andosols)",
+        "ph": "variable (5.0-7.0)",
+        "characteristics": [
+            "très fertiles naturellement",
+            "bonne rétention d'eau",
+            "riches en matière organique",
+        ],
+    },
+    "sahélienne": {
+        "regions": ["Extrême-Nord"],
+        "soil_type": "Sols peu évolués",
+        "ph": "alcalin (7.0-8.5)",
+        "characteristics": [
+            "texture sableuse",
+            "faible matière organique",
+            "problèmes de salinité localisés",
+        ],
+    },
+}
+
+
+def get_soil_zone_profile(zone: str, tool_context: ToolContext) -> Dict[str, Any]:
+    """Retourne le profil pédologique d'une grande zone du Cameroun.
+    
+    Args:
+        zone: Zone agro-écologique (forestière, savane, hauts plateaux, sahélienne)
+        tool_context: Contexte de l'outil
+        
+    Returns:
+        Profil pédologique de la zone, ou la liste des zones connues
+    """
+    profile = _SOIL_ZONE_PROFILES.get(zone.strip().lower())
+    if profile is None:
+        return {
+            "zone": zone,
+            "error": "Zone inconnue",
+            "zones_connues": list(_SOIL_ZONE_PROFILES),
+        }
+    return {"zone": zone, **profile}
+
+
+# Briefings de référence par thème, sortis du prompt d'instruction (voir
+# prompts.py): le modèle charge le bloc pertinent à la demande au lieu de
+# payer l'intégralité du briefing en tokens d'entrée à chaque requête.
+_CONTEXT_BLOCKS = {
+    "soils": """## Principes de gestion durable des sols
+
+### Fertilité:
+- Maintien/augmentation de la matière organique
+- Correction de l'acidité par chaulage
+- Apports équilibrés NPK
+- Utilisation d'engrais organiques locaux
+
+### Conservation:
+- Lutte contre l'érosion
+- Couverture végétale permanente
+- Techniques anti-érosives
+- Agroforesterie
+
+### Indicateurs de suivi:
+- pH, matière organique, NPK disponible
+- Capacité d'échange cationique
+- Activité biologique du sol
+""",
+    "water": """## Gestion de l'eau
+
+### Contraintes hydriques:
+- Excès: drainage insuffisant en zone forestière, engorgement temporaire, lessivage des nutriments
+- Déficit: stress hydrique en saison sèche, irrigation nécessaire au Nord
+
+### Bonnes pratiques:
+- Efficience d'utilisation
+- Techniques d'économie d'eau
+- Collecte et stockage eau de pluie
+- Drainage contrôlé
+
+### Indicateurs de suivi:
+- Consommation d'eau par kg produit
+- Taux d'humidité du sol
+- Water use efficiency
+""",
+    "fertilizers": """## Ressources locales disponibles
+
+### Engrais organiques:
+- Fumier de bovins, ovins, caprins
+- Fientes de volaille
+- Compost de résidus végétaux
+- Tourteaux (palmiste, coton, arachide)
+- Cendres de bois
+
+### Amendements locaux:
+- Chaux agricole (calcaire broyé)
+- Coquilles d'œufs broyées
+- Cendres riches en potasse
+- Roches phosphatées locales
+
+### Techniques traditionnelles:
+- Jachère améliorée
+- Association culturale
+- Rotation avec légumineuses
+- Billonnage et buttage
+- Paillage avec résidus de récolte
+""",
+    "climate": """## Adaptations climatiques et durabilité
+
+- Anticiper la variabilité des précipitations et la hausse des températures
+- Prévoir les événements extrêmes; viser la résilience des systèmes
+- Diversification des cultures
+
+### Indicateurs de durabilité:
+- Évolution de la matière organique
+- Bilan des nutriments
+- Biodiversité du sol
+- Érosion et séquestration carbone
+""",
+}
+
+
+def get_context_block(topic: str, tool_context: ToolContext) -> Dict[str, Any]:
+    """Retourne le briefing de référence pour un thème donné.
+    
+    Args:
+        topic: Thème demandé (soils, water, fertilizers, climate)
+        tool_context: Contexte de l'outil
+        
+    Returns:
+        Bloc de contexte du thème, ou la liste des thèmes connus
+    """
+    block = _CONTEXT_BLOCKS.get(topic.strip().lower())
+    if block is None:
+        return {
+            "topic": topic,
+            "error": "Thème inconnu",
+            "themes_connus": list(_CONTEXT_BLOCKS),
+        }
+    return {"topic": topic, "context": block}
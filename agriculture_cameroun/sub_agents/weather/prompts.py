@@ -2,7 +2,10 @@
 
 """Instructions pour l'agent météorologique."""
 
+import functools
 
+
+@functools.cache
 def return_instructions_weather() -> str:
     """Retourne les instructions pour l'agent météo."""
     
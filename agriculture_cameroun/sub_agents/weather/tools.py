@@ -8,19 +8,21 @@ le système reste fonctionnel en environnement de démo/offline.
 
 from __future__ import annotations
 
-import os
+import json
 import random
 import statistics
 from datetime import datetime, timedelta
 from typing import Any, Dict
 
-import google.generativeai as genai
+import numpy as np
 import requests
 from google.adk.tools import ToolContext
 
-# Configuration de l'API Gemini
-genai.configure(api_key=os.getenv("GEMINI_API_KEY"))
-model = genai.GenerativeModel("gemini-2.0-flash-001")
+from ...utils.genai_client import get_model
+
+# Client Gemini partagé (voir utils/genai_client.py): configuration unique
+# par processus et connexion réutilisée entre sous-agents.
+model = get_model("gemini-2.0-flash-001")
 
 
 # Coordonnées des zones agricoles clés du Cameroun (lat, lon).
@@ -70,53 +72,59 @@ def _fetch_open_meteo(lat: float, lon: float, days: int) -> dict[str, Any] | Non
         return None
 
 
-def _simulate_forecast(region: str, days: int) -> list[dict[str, Any]]:
-    base_temp = {
-        "Nord": {"min": 22, "max": 38},
-        "Centre": {"min": 19, "max": 28},
-        "Littoral": {"min": 23, "max": 31},
-        "Ouest": {"min": 15, "max": 25},
-        "Sud": {"min": 22, "max": 29},
-    }
-    temps = base_temp.get(region, base_temp["Centre"])
-    forecast = []
-    for i in range(min(days, 14)):
-        day = datetime.now() + timedelta(days=i)
-        rain = (
-            random.randint(40, 80)
-            if day.month in [3, 4, 5, 9, 10, 11]
-            else random.randint(10, 30)
-        )
-        forecast.append(
-            {
-                "date": day.strftime("%Y-%m-%d"),
-                "temperature_min": temps["min"] + random.randint(-2, 2),
-                "temperature_max": temps["max"] + random.randint(-2, 2),
-                "humidity": random.randint(60, 85),
-                "rain_probability": rain,
-                "wind_speed": random.randint(5, 20),
-                "conditions": "Pluvieux" if rain > 50 else "Partiellement nuageux",
-                "source": "simulated",
-            }
-        )
-    return forecast
+# Températures de base par région pour la simulation hors-ligne.
+_BASE_TEMPS: dict[str, dict[str, int]] = {
+    "Nord": {"min": 22, "max": 38},
+    "Centre": {"min": 19, "max": 28},
+    "Littoral": {"min": 23, "max": 31},
+    "Ouest": {"min": 15, "max": 25},
+    "Sud": {"min": 22, "max": 29},
+}
 
+# Mois des deux saisons des pluies (bimodales au sud du pays).
+_WET_MONTHS = np.array([3, 4, 5, 9, 10, 11])
 
-def get_weather_forecast(
-    region: str,
-    tool_context: ToolContext,
-    days: int = 7,
-) -> Dict[str, Any]:
-    """Prévisions météo réelles via Open-Meteo (fallback simulé).
 
-    Args:
-        region: Nom de la région au Cameroun.
-        days: Nombre de jours (max 14).
-        tool_context: Contexte ADK.
+def _simulate_forecast(region: str, days: int) -> list[dict[str, Any]]:
+    # Tirages vectorisés: un appel NumPy par champ pour tout l'horizon au
+    # lieu de ~5 tirages Python par jour; les dates sortent d'une seule
+    # arithmétique datetime64 (les bornes hautes sont exclusives chez
+    # Generator.integers, d'où le +1 par rapport à random.randint).
+    temps = _BASE_TEMPS.get(region, _BASE_TEMPS["Centre"])
+    n = min(days, 14)
+    rng = np.random.default_rng()
+
+    dates = np.datetime64(datetime.now().date()) + np.arange(n)
+    months = dates.astype("datetime64[M]").astype(int) % 12 + 1
+    rain = np.where(
+        np.isin(months, _WET_MONTHS),
+        rng.integers(40, 81, n),
+        rng.integers(10, 31, n),
+    )
+    tmin = temps["min"] + rng.integers(-2, 3, n)
+    tmax = temps["max"] + rng.integers(-2, 3, n)
+    humidity = rng.integers(60, 86, n)
+    wind = rng.integers(5, 21, n)
+
+    return [
+        {
+            "date": str(date),
+            "temperature_min": int(t_lo),
+            "temperature_max": int(t_hi),
+            "humidity": int(hum),
+            "rain_probability": int(prob),
+            "wind_speed": int(speed),
+            "conditions": "Pluvieux" if prob > 50 else "Partiellement nuageux",
+            "source": "simulated",
+        }
+        for date, t_lo, t_hi, hum, prob, speed in zip(
+            dates, tmin, tmax, humidity, rain, wind
+        )
+    ]
 
-    Returns:
-        Dict avec `region`, `forecast` (liste de jours), `summary`, `source`.
-    """
+
+def _forecast_data(region: str, days: int) -> tuple:
+    """Assemble les données de prévision (Open-Meteo ou simulation), sans LLM."""
     coords = REGION_COORDS.get(region, REGION_COORDS["Centre"])
     raw = _fetch_open_meteo(coords[0], coords[1], days)
 
@@ -140,10 +148,26 @@ def get_weather_forecast(
                     "source": "open-meteo",
                 }
             )
-        source = "open-meteo"
-    else:
-        forecast = _simulate_forecast(region, days)
-        source = "simulated"
+        return coords, forecast, "open-meteo"
+    return coords, _simulate_forecast(region, days), "simulated"
+
+
+def get_weather_forecast(
+    region: str,
+    tool_context: ToolContext,
+    days: int = 7,
+) -> Dict[str, Any]:
+    """Prévisions météo réelles via Open-Meteo (fallback simulé).
+
+    Args:
+        region: Nom de la région au Cameroun.
+        days: Nombre de jours (max 14).
+        tool_context: Contexte ADK.
+
+    Returns:
+        Dict avec `region`, `forecast` (liste de jours), `summary`, `source`.
+    """
+    coords, forecast, source = _forecast_data(region, days)
 
     prompt = (
         f"Génère un résumé météo agricole pour la région {region} du Cameroun "
@@ -271,12 +295,8 @@ def get_climate_alerts(
     }
 
 
-def analyze_rainfall_patterns(
-    region: str,
-    tool_context: ToolContext,
-    period_months: int = 6,
-) -> Dict[str, Any]:
-    """Analyse des précipitations sur les N derniers mois via Open-Meteo Archive."""
+def _rainfall_data(region: str, period_months: int) -> tuple:
+    """Agrège les précipitations mensuelles (archive ou simulation), sans LLM."""
     coords = REGION_COORDS.get(region, REGION_COORDS["Centre"])
     end = datetime.now().date()
     start = end - timedelta(days=period_months * 30)
@@ -335,6 +355,17 @@ def analyze_rainfall_patterns(
                 }
             )
 
+    return monthly_data, source
+
+
+def analyze_rainfall_patterns(
+    region: str,
+    tool_context: ToolContext,
+    period_months: int = 6,
+) -> Dict[str, Any]:
+    """Analyse des précipitations sur les N derniers mois via Open-Meteo Archive."""
+    monthly_data, source = _rainfall_data(region, period_months)
+
     prompt = (
         f"Analyse ces données pluviométriques pour {region}, Cameroun: "
         f"{monthly_data}\n"
@@ -350,3 +381,66 @@ def analyze_rainfall_patterns(
         "analysis": analysis,
         "source": source,
     }
+
+
+def get_weather_bundle(
+    region: str,
+    crop: str,
+    soil_type: str,
+    current_conditions: Dict[str, Any],
+    tool_context: ToolContext,
+    days: int = 7,
+    period_months: int = 6,
+) -> Dict[str, Any]:
+    """Résumé météo + conseils d'irrigation + analyse pluviométrique en UN appel.
+
+    Les trois outils séparés paient chacun un aller-retour Gemini alors que
+    les flux agent les demandent souvent ensemble; ici les trois volets sont
+    posés dans un seul prompt sectionné et la réponse revient en JSON structuré
+    (response_mime_type), dont les champs sont redistribués dans les formes de
+    retour habituelles de chaque outil.
+    """
+    coords, forecast, forecast_source = _forecast_data(region, days)
+    monthly_data, rainfall_source = _rainfall_data(region, period_months)
+
+    prompt = (
+        f"Tu es un expert agro-météorologique au Cameroun (région {region}).\n"
+        "Réponds en JSON avec exactement les clés \"forecast_summary\", "
+        "\"irrigation_advice\" et \"rainfall_analysis\" (valeurs: texte en français).\n"
+        "\n### FORECAST\n"
+        f"Données de prévision: {forecast}\n"
+        "Résumé agricole attendu: conseils semis, traitements, irrigation.\n"
+        "\n### IRRIGATION\n"
+        f"Culture: {crop} | Sol: {soil_type} | Conditions: {current_conditions}\n"
+        "Conseils attendus: fréquence, quantité par irrigation, moment de la "
+        "journée, économie d'eau, signes de sur/sous-irrigation.\n"
+        "\n### RAINFALL\n"
+        f"Précipitations mensuelles: {monthly_data}\n"
+        "Analyse attendue: tendance, comparaison historique, impact agricole, "
+        "recommandations."
+    )
+    response = model.generate_content(
+        prompt, generation_config={"response_mime_type": "application/json"}
+    )
+    try:
+        sections = json.loads(response.text)
+    except (ValueError, TypeError):
+        # Réponse non conforme: le texte brut sert pour les trois volets
+        # plutôt que de faire échouer l'appel groupé.
+        sections = {}
+    fallback = response.text
+
+    return {
+        "region": region,
+        "coordinates": {"lat": coords[0], "lon": coords[1]},
+        "forecast": forecast,
+        "summary": sections.get("forecast_summary", fallback),
+        "irrigation_advice": sections.get("irrigation_advice", fallback),
+        "rainfall": {
+            "period": f"{period_months} derniers mois",
+            "data": monthly_data,
+            "analysis": sections.get("rainfall_analysis", fallback),
+            "source": rainfall_source,
+        },
+        "source": forecast_source,
+    }
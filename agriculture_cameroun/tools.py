@@ -2,9 +2,12 @@
 
 """Outils pour l'agent principal."""
 
+import asyncio
+import re
+
 from google.adk.tools import ToolContext
 from google.adk.tools.agent_tool import AgentTool
-from typing import Optional
+from typing import Any, Dict, List, Literal, Optional
 
 from .sub_agents import (
     weather_agent,
@@ -14,6 +17,90 @@ from .sub_agents import (
     resources_agent
 )
 
+# AgentTool fait une passe d'introspection de schéma à la construction:
+# les instances sont créées une fois au chargement du module plutôt qu'à
+# chaque invocation.
+_WEATHER_TOOL = AgentTool(agent=weather_agent)
+_CROPS_TOOL = AgentTool(agent=crops_agent)
+_HEALTH_TOOL = AgentTool(agent=health_agent)
+_ECONOMIC_TOOL = AgentTool(agent=economic_agent)
+_RESOURCES_TOOL = AgentTool(agent=resources_agent)
+
+# Classification par mots-clés des questions mono-agent fréquentes: si la
+# cible est évidente, le sous-agent est pré-lancé pendant le tour de
+# planification du root LLM (appel spéculatif), puis son résultat est
+# récupéré quand le root demande effectivement cet outil.
+_SPECULATIVE_RULES = (
+    ("crops", re.compile(r"plant(er|ation)|calendrier|variét|rotation|semis", re.IGNORECASE)),
+    ("weather", re.compile(r"météo|pluie|climat|prévision|sécheresse", re.IGNORECASE)),
+    ("economic", re.compile(r"prix|marché|vendre|vente|rentab", re.IGNORECASE)),
+)
+
+# Tâches spéculatives par invocation_id (hors état de session: non sérialisable).
+_speculative_tasks: Dict[str, Dict[str, asyncio.Task]] = {}
+
+
+def classify_agent(question: str) -> Optional[str]:
+    """Retourne le sous-agent probable pour une question, ou None."""
+    for agent_name, pattern in _SPECULATIVE_RULES:
+        if pattern.search(question):
+            return agent_name
+    return None
+
+
+def launch_speculative_call(callback_context) -> None:
+    """Pré-lance le sous-agent le plus probable pour la question courante.
+
+    Best-effort: toute erreur (pas de boucle, contexte incomplet) annule
+    simplement la spéculation, jamais la requête.
+    """
+    try:
+        invocation = callback_context._invocation_context
+        content = getattr(invocation, "user_content", None)
+        if content is None or not getattr(content, "parts", None):
+            return
+        question = "".join(part.text or "" for part in content.parts)
+        agent_name = classify_agent(question)
+        if agent_name is None:
+            return
+        loop = asyncio.get_running_loop()
+        tool_context = ToolContext(invocation)
+        task = loop.create_task(
+            _AGENT_CALLERS[agent_name](question=question, tool_context=tool_context)
+        )
+        _speculative_tasks.setdefault(invocation.invocation_id, {})[agent_name] = task
+    except Exception:
+        return
+
+
+def cancel_speculative_calls(callback_context) -> None:
+    """Annule les tâches spéculatives restantes de l'invocation."""
+    invocation_id = getattr(callback_context, "invocation_id", None)
+    for task in _speculative_tasks.pop(invocation_id, {}).values():
+        task.cancel()
+
+
+async def _take_speculative(agent_name: str, tool_context: ToolContext):
+    """Récupère le résultat pré-calculé si la spéculation a visé juste."""
+    invocation_id = getattr(tool_context, "invocation_id", None)
+    tasks = _speculative_tasks.get(invocation_id)
+    if not tasks:
+        return None
+    task = tasks.get(agent_name)
+    if task is asyncio.current_task():
+        # Appel interne émis par la tâche spéculative elle-même.
+        return None
+    _speculative_tasks.pop(invocation_id, None)
+    for name, other in tasks.items():
+        if name != agent_name:
+            other.cancel()
+    if task is None or task.cancelled():
+        return None
+    try:
+        return await task
+    except Exception:
+        return None
+
 
 async def call_weather_agent(
     question: str,
@@ -30,22 +117,25 @@ async def call_weather_agent(
     Returns:
         Réponse de l'agent météo
     """
+    speculative = await _take_speculative("weather", tool_context)
+    if speculative is not None:
+        return speculative
+
     if region is None:
         region = tool_context.state["agriculture_settings"]["default_region"]
     
-    agent_tool = AgentTool(agent=weather_agent)
-    
     weather_input = {
         "request": question,
         "region": region
     }
     
-    response = await agent_tool.run_async(
+    response = await _WEATHER_TOOL.run_async(
         args=weather_input,
         tool_context=tool_context
     )
     
-    tool_context.state["weather_response"] = response
+    if tool_context.state.get("debug_persist_responses"):
+        tool_context.state["weather_response"] = response
     return response
 
 
@@ -66,23 +156,26 @@ async def call_crops_agent(
     Returns:
         Réponse de l'agent cultures
     """
+    speculative = await _take_speculative("crops", tool_context)
+    if speculative is not None:
+        return speculative
+
     if region is None:
         region = tool_context.state["agriculture_settings"]["default_region"]
     
-    agent_tool = AgentTool(agent=crops_agent)
-    
     crops_input = {
         "request": question,
         "crop": crop,
         "region": region
     }
     
-    response = await agent_tool.run_async(
+    response = await _CROPS_TOOL.run_async(
         args=crops_input,
         tool_context=tool_context
     )
     
-    tool_context.state["crops_response"] = response
+    if tool_context.state.get("debug_persist_responses"):
+        tool_context.state["crops_response"] = response
     return response
 
 
@@ -103,20 +196,19 @@ async def call_health_agent(
     Returns:
         Réponse de l'agent santé
     """
-    agent_tool = AgentTool(agent=health_agent)
-    
     health_input = {
         "request": question,
         "symptoms": symptoms,
         "crop": crop
     }
     
-    response = await agent_tool.run_async(
+    response = await _HEALTH_TOOL.run_async(
         args=health_input,
         tool_context=tool_context
     )
     
-    tool_context.state["health_response"] = response
+    if tool_context.state.get("debug_persist_responses"):
+        tool_context.state["health_response"] = response
     return response
 
 
@@ -137,20 +229,23 @@ async def call_economic_agent(
     Returns:
         Réponse de l'agent économique
     """
-    agent_tool = AgentTool(agent=economic_agent)
-    
+    speculative = await _take_speculative("economic", tool_context)
+    if speculative is not None:
+        return speculative
+
     economic_input = {
         "request": question,
         "crop": crop,
         "quantity": quantity
     }
     
-    response = await agent_tool.run_async(
+    response = await _ECONOMIC_TOOL.run_async(
         args=economic_input,
         tool_context=tool_context
     )
     
-    tool_context.state["economic_response"] = response
+    if tool_context.state.get("debug_persist_responses"):
+        tool_context.state["economic_response"] = response
     return response
 
 
@@ -171,18 +266,125 @@ async def call_resources_agent(
     Returns:
         Réponse de l'agent ressources
     """
-    agent_tool = AgentTool(agent=resources_agent)
-    
     resources_input = {
         "request": question,
         "resource_type": resource_type,
         "crop": crop
     }
     
-    response = await agent_tool.run_async(
+    response = await _RESOURCES_TOOL.run_async(
         args=resources_input,
         tool_context=tool_context
     )
     
-    tool_context.state["resources_response"] = response
-    return response
\ No newline at end of file
+    if tool_context.state.get("debug_persist_responses"):
+        tool_context.state["resources_response"] = response
+    return response
+
+
+# Correspondance nom d'agent → coroutine d'appel, pour le fan-out parallèle.
+_AGENT_CALLERS = {
+    "weather": call_weather_agent,
+    "crops": call_crops_agent,
+    "health": call_health_agent,
+    "economic": call_economic_agent,
+    "resources": call_resources_agent,
+}
+
+# Paramètres optionnels acceptés par chaque sous-agent.
+_AGENT_PARAM_NAMES = {
+    "weather": ("region",),
+    "crops": ("crop", "region"),
+    "health": ("symptoms", "crop"),
+    "economic": ("crop", "quantity"),
+    "resources": ("resource_type", "crop"),
+}
+
+
+async def call_agent(
+    agent_name: Literal["weather", "crops", "health", "economic", "resources"],
+    question: str,
+    tool_context: ToolContext,
+    crop: Optional[str] = None,
+    region: Optional[str] = None,
+    symptoms: Optional[str] = None,
+    quantity: Optional[float] = None,
+    resource_type: Optional[str] = None,
+):
+    """Appelle un agent spécialisé (outil unique exposé à l'agent principal).
+
+    Un seul schéma d'outil au lieu de cinq quasi identiques: le prompt
+    système du root reste compact, pour le même pouvoir d'expression.
+
+    Args:
+        agent_name: Agent cible (weather, crops, health, economic, resources)
+        question: Question à transmettre à l'agent
+        crop: Culture concernée (crops, health, economic, resources)
+        region: Région spécifique (weather, crops)
+        symptoms: Description des symptômes (health)
+        quantity: Quantité en kg (economic)
+        resource_type: Type de ressource: sol, eau, engrais (resources)
+        tool_context: Contexte de l'outil
+
+    Returns:
+        Réponse de l'agent spécialisé
+    """
+    caller = _AGENT_CALLERS.get(agent_name)
+    if caller is None:
+        raise ValueError(f"Agent inconnu: {agent_name}")
+    provided = {
+        "crop": crop,
+        "region": region,
+        "symptoms": symptoms,
+        "quantity": quantity,
+        "resource_type": resource_type,
+    }
+    kwargs = {name: provided[name] for name in _AGENT_PARAM_NAMES[agent_name]}
+    return await caller(question=question, tool_context=tool_context, **kwargs)
+
+
+async def call_agents_parallel(
+    requests: List[Dict[str, Any]],
+    tool_context: ToolContext,
+):
+    """Appelle plusieurs agents spécialisés en parallèle.
+
+    À utiliser quand une question nécessite plusieurs agents indépendants:
+    les appels s'exécutent simultanément via asyncio.gather, donc la latence
+    totale est celle de l'agent le plus lent au lieu de la somme des appels.
+
+    Args:
+        requests: Liste de requêtes, chacune avec une clé "agent"
+            (weather, crops, health, economic, resources), une clé "question"
+            et les paramètres optionnels de l'agent (region, crop, etc.)
+        tool_context: Contexte de l'outil
+
+    Returns:
+        Dictionnaire des réponses indexé par nom d'agent
+    """
+    tasks = []
+    agent_names = []
+    results: Dict[str, Any] = {}
+
+    for request in requests:
+        params = dict(request)
+        agent_name = params.pop("agent", None)
+        caller = _AGENT_CALLERS.get(agent_name)
+        if caller is None:
+            # Entrée explicite plutôt qu'un abandon silencieux: le LLM voit
+            # pourquoi cette requête n'a pas produit de réponse.
+            results[str(agent_name)] = f"Erreur: agent inconnu '{agent_name}'"
+            continue
+        # Même filtrage que call_agent: les clés étrangères à l'agent cible
+        # sont ignorées au lieu de faire échouer tout le lot en TypeError.
+        kwargs = {
+            name: params.get(name) for name in _AGENT_PARAM_NAMES[agent_name]
+        }
+        agent_names.append(agent_name)
+        tasks.append(
+            caller(question=params.get("question"), tool_context=tool_context, **kwargs)
+        )
+
+    responses = await asyncio.gather(*tasks)
+    results.update(zip(agent_names, responses))
+    return results
\ No newline at end of file
@@ -0,0 +1,87 @@
+# Copyright 2025 Agriculture Cameroun
+
+"""Client de micro-batching pour les appels Gemini non-interactifs.
+
+Le SDK google-generativeai n'expose pas l'API Batch de Gemini; ce module
+fournit l'équivalent inline: les prompts soumis pendant une courte fenêtre
+sont accumulés puis envoyés ensemble (un seul gather, connexions réutilisées),
+au lieu d'un aller-retour HTTP isolé par appel d'outil.
+
+Activation: variable d'environnement ENABLE_BATCH_MODE, puis
+`tool_context.state["batch_mode"] = True` côté session pour les workflows
+de type rapport/planification (pas le chat en direct).
+"""
+
+from __future__ import annotations
+
+import asyncio
+import os
+from typing import Any
+
+
+def batch_mode_enabled() -> bool:
+    """Indique si le micro-batching est activé au niveau du processus."""
+    return os.getenv("ENABLE_BATCH_MODE", "").lower() in ("1", "true", "yes")
+
+
+class BatchGeminiClient:
+    """Accumule les prompts et les envoie groupés via generate_content_async.
+
+    Chaque `generate()` retourne une future résolue quand le lot est parti:
+    les appelants restent async/await classiques, seul le dispatch est groupé.
+    """
+
+    def __init__(
+        self,
+        model: Any,
+        flush_interval: float = 0.05,
+        max_batch_size: int = 16,
+    ):
+        self._model = model
+        self._flush_interval = flush_interval
+        self._max_batch_size = max_batch_size
+        self._pending: list[tuple[str, asyncio.Future]] = []
+        self._flush_task: asyncio.Task | None = None
+
+    async def generate(self, prompt: str) -> Any:
+        """Soumet un prompt au lot courant et attend sa réponse."""
+        loop = asyncio.get_running_loop()
+        future: asyncio.Future = loop.create_future()
+        self._pending.append((prompt, future))
+
+        if len(self._pending) >= self._max_batch_size:
+            await self._flush()
+        elif self._flush_task is None or self._flush_task.done():
+            self._flush_task = loop.create_task(self._delayed_flush())
+
+        return await future
+
+    async def _delayed_flush(self):
+        await asyncio.sleep(self._flush_interval)
+        await self._flush()
+
+    async def _flush(self):
+        batch, self._pending = self._pending, []
+        if not batch:
+            return
+
+        # Chaque appel du lot passe sous le sémaphore global: le dispatch
+        # reste groupé mais la concurrence effective ne dépasse jamais
+        # max_gemini_concurrency, même avec un lot plein.
+        from .genai_client import get_semaphore
+
+        async def _one(prompt: str) -> Any:
+            async with get_semaphore():
+                return await self._model.generate_content_async(prompt)
+
+        responses = await asyncio.gather(
+            *[_one(prompt) for prompt, _ in batch],
+            return_exceptions=True,
+        )
+        for (_, future), response in zip(batch, responses):
+            if future.done():
+                continue
+            if isinstance(response, Exception):
+                future.set_exception(response)
+            else:
+                future.set_result(response)
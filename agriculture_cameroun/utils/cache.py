@@ -0,0 +1,72 @@
+# Copyright 2025 Agriculture Cameroun
+
+"""Cache disque pour les réponses Gemini des outils déterministes.
+
+Les outils construisent leurs prompts à partir d'un espace d'arguments réduit
+(culture × région × priorités); pour des entrées identiques la réponse
+agronomique est essentiellement statique. Ce cache évite l'aller-retour LLM
+(~1-3 s) sur les hits en persistant les textes dans des fichiers JSON sous
+`data_storage_path/gemini_cache`.
+
+Contournement: `tool_context.state["force_refresh"] = True` ignore le cache
+pour une session.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import json
+import os
+import time
+from pathlib import Path
+from typing import Any, Optional
+
+
+class CachedResponse:
+    """Réponse texte reconstituée (cache ou flux), compatible `.text`."""
+
+    def __init__(self, text: str, from_cache: bool = True):
+        self.text = text
+        self.from_cache = from_cache
+
+
+class GeminiResponseCache:
+    """Cache clé → texte de réponse, un fichier JSON par entrée."""
+
+    def __init__(self, namespace: str, directory: Optional[str] = None):
+        if directory is None:
+            directory = os.getenv("AGRICULTURE_CACHE_DIR", "./data/gemini_cache")
+        self._directory = Path(directory) / namespace
+        self._namespace = namespace
+
+    def _path_for(self, key_parts: tuple[Any, ...]) -> Path:
+        raw = json.dumps(key_parts, ensure_ascii=False, default=str)
+        digest = hashlib.sha256(raw.encode("utf-8")).hexdigest()
+        return self._directory / f"{digest}.json"
+
+    def get(self, *key_parts: Any, max_age_seconds: Optional[float] = None) -> Optional[str]:
+        """Retourne le texte mis en cache pour cette clé, ou None.
+
+        Args:
+            max_age_seconds: Âge maximal de l'entrée (mtime du fichier);
+                None pour une durée de vie illimitée.
+        """
+        path = self._path_for(key_parts)
+        try:
+            if max_age_seconds is not None:
+                if time.time() - path.stat().st_mtime > max_age_seconds:
+                    return None
+            with open(path, encoding="utf-8") as f:
+                return json.load(f)["text"]
+        except (OSError, ValueError, KeyError):
+            return None
+
+    def set(self, text: str, *key_parts: Any) -> None:
+        """Enregistre le texte de réponse pour cette clé (best-effort)."""
+        path = self._path_for(key_parts)
+        try:
+            self._directory.mkdir(parents=True, exist_ok=True)
+            with open(path, "w", encoding="utf-8") as f:
+                json.dump({"key": [str(k) for k in key_parts], "text": text}, f, ensure_ascii=False)
+        except OSError:
+            pass
@@ -325,29 +325,43 @@ def get_crop_info(crop: CropType) -> CropInfo:
     """Retourne les informations d'une culture."""
     return CROPS.get(crop)
 
+# Index inverse région -> cultures, construit une fois à l'import:
+# get_suitable_crops devient une simple recherche dict au lieu d'un parcours
+# de CROPS avec test d'appartenance par culture à chaque appel.
+_REGION_TO_CROPS: Dict[RegionType, tuple] = {region: () for region in RegionType}
+for _crop_type, _crop_info in CROPS.items():
+    for _region in _crop_info.suitable_regions:
+        _REGION_TO_CROPS[_region] = _REGION_TO_CROPS[_region] + (_crop_type,)
+del _crop_type, _crop_info, _region
+
 def get_suitable_crops(region: RegionType) -> List[CropType]:
     """Retourne les cultures adaptées à une région."""
-    suitable_crops = []
-    for crop_type, crop_info in CROPS.items():
-        if region in crop_info.suitable_regions:
-            suitable_crops.append(crop_type)
-    return suitable_crops
+    return list(_REGION_TO_CROPS.get(region, ()))
+
+def _seasonal_activities(region: RegionType, month: int) -> tuple:
+    """Logique saisonnière (implémentation simplifiée), évaluée une fois par case."""
+    if region in (RegionType.NORD, RegionType.EXTREME_NORD):
+        if month in (6, 7, 8, 9):
+            return ("plantation", "sarclage", "fertilisation")
+        return ("récolte", "préparation_sol", "commercialisation")
+    if month in (3, 4, 5, 8, 9):
+        return ("plantation", "entretien_cultures")
+    if month in (12, 1, 2):
+        return ("préparation_sol", "récolte_cultures_pérennes")
+    return ("entretien_général", "surveillance_sanitaire")
+
+# Table (région, mois) -> activités, matérialisée une fois à l'import: la
+# cascade de comparaisons et les listes reconstruites à chaque appel se
+# réduisent à une recherche dict sur 120 cases.
+_ACTIVITIES_BY_REGION_MONTH: Dict[tuple, tuple] = {
+    (region, month): _seasonal_activities(region, month)
+    for region in RegionType
+    for month in range(1, 13)
+}
 
 def get_seasonal_activities(region: RegionType, month: int) -> List[str]:
     """Retourne les activités agricoles recommandées pour un mois donné."""
-    # Implémentation simplifiée
-    if region in [RegionType.NORD, RegionType.EXTREME_NORD]:
-        if month in [6, 7, 8, 9]:
-            return ["plantation", "sarclage", "fertilisation"]
-        else:
-            return ["récolte", "préparation_sol", "commercialisation"]
-    else:
-        if month in [3, 4, 5, 8, 9]:
-            return ["plantation", "entretien_cultures"]
-        elif month in [12, 1, 2]:
-            return ["préparation_sol", "récolte_cultures_pérennes"]
-        else:
-            return ["entretien_général", "surveillance_sanitaire"]
+    return list(_ACTIVITIES_BY_REGION_MONTH[(region, month)])
 
 def get_market_price_range(crop: CropType) -> Dict[str, float]:
     """Retourne la fourchette de prix pour une culture."""
@@ -0,0 +1,92 @@
+# Copyright 2025 Agriculture Cameroun
+
+"""Client Gemini partagé pour tous les sous-agents.
+
+Chaque module d'outils faisait son propre `genai.configure(...)` +
+`genai.GenerativeModel(...)`: autant de clients, de canaux TLS et de
+handshakes que de modules. Ici la configuration est faite une seule fois
+par processus et les instances `GenerativeModel` sont mémoïsées par nom de
+modèle, donc les appels concurrents partagent le même client sous-jacent et
+restent en keep-alive.
+"""
+
+from __future__ import annotations
+
+import asyncio
+
+import google.generativeai as genai
+
+DEFAULT_MODEL_NAME = "gemini-2.0-flash-001"
+
+_configured = False
+_models: dict[str, genai.GenerativeModel] = {}
+_cached_prefix_models: dict[tuple[str, int], genai.GenerativeModel] = {}
+_semaphore: asyncio.Semaphore | None = None
+
+
+def _ensure_configured() -> None:
+    # La clé passe par AgricultureConfig: son validateur échoue immédiatement
+    # si GEMINI_API_KEY manque, au lieu d'un 401 au premier appel d'outil.
+    global _configured
+    if not _configured:
+        from agriculture_cameroun.config import get_config
+
+        genai.configure(api_key=get_config().gemini_api_key)
+        _configured = True
+
+
+def get_model(model_name: str | None = None) -> genai.GenerativeModel:
+    """Retourne l'instance partagée de GenerativeModel pour ce nom de modèle."""
+    name = model_name or DEFAULT_MODEL_NAME
+    if name not in _models:
+        _ensure_configured()
+        _models[name] = genai.GenerativeModel(name)
+    return _models[name]
+
+
+def get_cached_model(
+    model_name: str | None = None,
+    system_instruction: str | None = None,
+    ttl: str = "3600s",
+) -> genai.GenerativeModel:
+    """Modèle dont l'instruction système est mise en cache côté Gemini.
+
+    Tente un `CachedContent` explicite (les tokens du préfixe sont facturés
+    à ~10% et ne sont plus re-préremplis à chaque appel). Best-effort: si la
+    création échoue — instruction sous le minimum de tokens cachables, API
+    indisponible, hors-ligne — retombe sur un `GenerativeModel` classique
+    portant la même instruction, sans changer le comportement.
+    """
+    name = model_name or DEFAULT_MODEL_NAME
+    key = (name, hash(system_instruction))
+    if key not in _cached_prefix_models:
+        _ensure_configured()
+        try:
+            from google.generativeai import caching
+
+            cached = caching.CachedContent.create(
+                model=name,
+                system_instruction=system_instruction,
+                ttl=ttl,
+            )
+            _cached_prefix_models[key] = genai.GenerativeModel.from_cached_content(cached)
+        except Exception:
+            _cached_prefix_models[key] = genai.GenerativeModel(
+                name, system_instruction=system_instruction
+            )
+    return _cached_prefix_models[key]
+
+
+def get_semaphore() -> asyncio.Semaphore:
+    """Sémaphore global bornant les appels Gemini simultanés.
+
+    Le fan-out parallèle peut émettre 5+ appels d'un coup; sans borne, les
+    rafales déclenchent des 429 et un backoff plus lent que l'exécution
+    séquentielle. La limite vient de `AgricultureConfig.max_gemini_concurrency`.
+    """
+    global _semaphore
+    if _semaphore is None:
+        from agriculture_cameroun.config import get_config
+
+        _semaphore = asyncio.Semaphore(get_config().max_gemini_concurrency)
+    return _semaphore
@@ -32,7 +32,7 @@ class TestAgentConfiguration:
         assert root_agent.name == "agriculture_multiagent"
         assert root_agent.model is not None
         assert len(root_agent.sub_agents) == 5
-        assert len(root_agent.tools) >= 6
+        assert len(root_agent.tools) >= 3
     
     def test_sub_agents_initialization(self):
         """Test l'initialisation des sous-agents."""
@@ -119,16 +119,16 @@ class TestCropsAgent:
         context.state = {"agriculture_settings": {"default_region": "Centre"}}
         return context
     
-    @patch('agriculture.sub_agents.crops.tools.model.generate_content')
-    def test_planting_calendar_tool(self, mock_generate, mock_crops_context):
+    @patch('agriculture_cameroun.sub_agents.crops.tools.model.generate_content_async', new_callable=AsyncMock)
+    async def test_planting_calendar_tool(self, mock_generate, mock_crops_context):
         """Test l'outil de calendrier de plantation."""
         from agriculture_cameroun.sub_agents.crops.tools import get_planting_calendar
-        
+
         mock_response = Mock()
         mock_response.text = '{"plantation": "mars-avril", "récolte": "juillet"}'
         mock_generate.return_value = mock_response
-        
-        result = get_planting_calendar(
+
+        result = await get_planting_calendar(
             crop="maïs",
             region="Centre",
             tool_context=mock_crops_context
@@ -140,16 +140,16 @@ class TestCropsAgent:
         assert result["crop"] == "maïs"
         assert result["region"] == "Centre"
     
-    @patch('agriculture.sub_agents.crops.tools.model.generate_content')
-    def test_variety_recommendations_tool(self, mock_generate, mock_crops_context):
+    @patch('agriculture_cameroun.sub_agents.crops.tools.model.generate_content_async', new_callable=AsyncMock)
+    async def test_variety_recommendations_tool(self, mock_generate, mock_crops_context):
         """Test l'outil de recommandations de variétés."""
         from agriculture_cameroun.sub_agents.crops.tools import get_variety_recommendations
-        
+
         mock_response = Mock()
         mock_response.text = "Variétés recommandées: ATP Y2000, CMS 8704"
         mock_generate.return_value = mock_response
-        
-        result = get_variety_recommendations(
+
+        result = await get_variety_recommendations(
             crop="maïs",
             region="Centre",
             priorities=["rendement", "résistance"],
@@ -168,18 +168,19 @@ class TestHealthAgent:
     def mock_health_context(self):
         """Mock du contexte pour les outils santé."""
         context = Mock()
+        context.state = {"force_refresh": True}
         return context
     
-    @patch('agriculture.sub_agents.health.tools.model.generate_content')
-    def test_disease_diagnosis_tool(self, mock_generate, mock_health_context):
+    @patch('agriculture_cameroun.sub_agents.health.tools.model.generate_content_async', new_callable=AsyncMock)
+    async def test_disease_diagnosis_tool(self, mock_generate, mock_health_context):
         """Test l'outil de diagnostic des maladies."""
         from agriculture_cameroun.sub_agents.health.tools import diagnose_plant_disease
-        
+
         mock_response = Mock()
         mock_response.text = "Diagnostic: Pourriture brune probable"
         mock_generate.return_value = mock_response
-        
-        result = diagnose_plant_disease(
+
+        result = await diagnose_plant_disease(
             crop="cacao",
             symptoms=["taches brunes", "pourriture fruits"],
             affected_parts=["fruits"],
@@ -191,16 +192,16 @@ class TestHealthAgent:
         assert "diagnostic_results" in result
         assert len(result["diagnostic_results"]) > 0
     
-    @patch('agriculture.sub_agents.health.tools.model.generate_content')
-    def test_treatment_recommendations_tool(self, mock_generate, mock_health_context):
+    @patch('agriculture_cameroun.sub_agents.health.tools.model_lite.generate_content_async', new_callable=AsyncMock)
+    async def test_treatment_recommendations_tool(self, mock_generate, mock_health_context):
         """Test l'outil de recommandations de traitement."""
         from agriculture_cameroun.sub_agents.health.tools import get_treatment_recommendations
-        
+
         mock_response = Mock()
         mock_response.text = "Traitement: Application de fongicide cuprique"
         mock_generate.return_value = mock_response
-        
-        result = get_treatment_recommendations(
+
+        result = await get_treatment_recommendations(
             diagnosis="Pourriture brune",
             crop="cacao",
             severity="élevée",
@@ -212,6 +213,26 @@ class TestHealthAgent:
         assert "estimated_cost" in result
         assert result["severity"] == "élevée"
 
+    @patch('agriculture_cameroun.sub_agents.health.tools.model.generate_content_async', new_callable=AsyncMock)
+    async def test_pest_identification_peak_season(self, mock_generate, mock_health_context):
+        """Test que peak_season reste une liste de saisons (pas de caractères)."""
+        from agriculture_cameroun.sub_agents.health.tools import get_pest_identification
+
+        mock_response = Mock()
+        mock_response.text = "Identification: Mirides probable"
+        mock_generate.return_value = mock_response
+
+        result = await get_pest_identification(
+            crop="cacao",
+            pest_description="insecte brun-noir antennes longues",
+            damage_type="taches noires branches",
+            tool_context=mock_health_context
+        )
+
+        assert len(result["identification_results"]) > 0
+        for pest in result["identification_results"]:
+            assert pest["peak_season"] in (["saison sèche"], ["saison des pluies"])
+
 
 class TestEconomicAgent:
     """Tests pour l'agent économique."""
@@ -220,18 +241,19 @@ class TestEconomicAgent:
     def mock_economic_context(self):
         """Mock du contexte pour les outils économiques."""
         context = Mock()
+        context.state = {"force_refresh": True}
         return context
     
-    @patch('agriculture.sub_agents.economic.tools.model.generate_content')
-    def test_market_prices_tool(self, mock_generate, mock_economic_context):
+    @patch('agriculture_cameroun.sub_agents.economic.tools._get_model')
+    async def test_market_prices_tool(self, mock_get_model, mock_economic_context):
         """Test l'outil de prix du marché."""
         from agriculture_cameroun.sub_agents.economic.tools import get_market_prices
-        
+
         mock_response = Mock()
         mock_response.text = "Analyse des prix du marché"
-        mock_generate.return_value = mock_response
-        
-        result = get_market_prices(
+        mock_get_model.return_value.generate_content_async = AsyncMock(return_value=mock_response)
+
+        result = await get_market_prices(
             crop="cacao",
             region="Centre",
             market_type="gros",
@@ -244,16 +266,16 @@ class TestEconomicAgent:
         assert "analysis" in result
         assert result["crop"] == "cacao"
     
-    @patch('agriculture.sub_agents.economic.tools.model.generate_content')
-    def test_profitability_analysis_tool(self, mock_generate, mock_economic_context):
+    @patch('agriculture_cameroun.sub_agents.economic.tools._get_model')
+    async def test_profitability_analysis_tool(self, mock_get_model, mock_economic_context):
         """Test l'outil d'analyse de rentabilité."""
         from agriculture_cameroun.sub_agents.economic.tools import analyze_profitability
-        
+
         mock_response = Mock()
         mock_response.text = "Analyse de rentabilité détaillée"
-        mock_generate.return_value = mock_response
-        
-        result = analyze_profitability(
+        mock_get_model.return_value.generate_content_async = AsyncMock(return_value=mock_response)
+
+        result = await analyze_profitability(
             crop="maïs",
             area_hectares=2.0,
             production_system="amélioré",
@@ -275,41 +297,42 @@ class TestResourcesAgent:
     def mock_resources_context(self):
         """Mock du contexte pour les outils ressources."""
         context = Mock()
+        context.state = {"force_refresh": True}
         return context
-    
-    @patch('agriculture.sub_agents.resources.tools.model.generate_content')
-    def test_soil_analysis_tool(self, mock_generate, mock_resources_context):
+
+    @patch('agriculture_cameroun.sub_agents.resources.tools._get_model')
+    async def test_soil_analysis_tool(self, mock_get_model, mock_resources_context):
         """Test l'outil d'analyse du sol."""
         from agriculture_cameroun.sub_agents.resources.tools import analyze_soil_requirements
-        
+
         mock_response = Mock()
         mock_response.text = "Analyse des exigences du sol"
-        mock_generate.return_value = mock_response
-        
-        result = analyze_soil_requirements(
+        mock_get_model.return_value.generate_content_async = AsyncMock(return_value=mock_response)
+
+        result = await analyze_soil_requirements(
             crop="cacao",
             region="Centre",
             soil_type="argileux",
             current_ph=5.2,
             tool_context=mock_resources_context
         )
-        
+
         assert "crop" in result
         assert "region" in result
         assert "requirements" in result
         assert "current_conditions" in result
         assert "improvement_plan" in result
-    
-    @patch('agriculture.sub_agents.resources.tools.model.generate_content')
-    def test_fertilizer_recommendations_tool(self, mock_generate, mock_resources_context):
+
+    @patch('agriculture_cameroun.sub_agents.resources.tools._get_model')
+    async def test_fertilizer_recommendations_tool(self, mock_get_model, mock_resources_context):
         """Test l'outil de recommandations d'engrais."""
         from agriculture_cameroun.sub_agents.resources.tools import recommend_fertilizers
-        
+
         mock_response = Mock()
         mock_response.text = "Plan de fertilisation recommandé"
-        mock_generate.return_value = mock_response
-        
-        result = recommend_fertilizers(
+        mock_get_model.return_value.generate_content_async = AsyncMock(return_value=mock_response)
+
+        result = await recommend_fertilizers(
             crop="maïs",
             area_hectares=1.0,
             soil_fertility="moyenne",
@@ -359,17 +382,16 @@ class TestIntegration:
     async def test_agent_communication_mock(self):
         """Test mock de la communication entre agents."""
         # Mock des outils d'agent
-        with patch('agriculture.tools.AgentTool') as mock_agent_tool:
-            mock_instance = AsyncMock()
-            mock_instance.run_async.return_value = "Réponse de l'agent météo"
-            mock_agent_tool.return_value = mock_instance
-            
-            from agriculture_cameroun.tools import call_weather_agent
-            
+        mock_instance = AsyncMock()
+        mock_instance.run_async.return_value = "Réponse de l'agent météo"
+        with patch('agriculture_cameroun.tools._WEATHER_TOOL', mock_instance):
+            from agriculture_cameroun.tools import call_agent
+
             mock_context = Mock()
             mock_context.state = {"agriculture_settings": {"default_region": "Centre"}}
-            
-            result = await call_weather_agent(
+
+            result = await call_agent(
+                agent_name="weather",
                 question="Quelles sont les prévisions pour cette semaine?",
                 region="Centre",
                 tool_context=mock_context